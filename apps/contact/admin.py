@@ -5,11 +5,14 @@ import logging
 
 from django import forms
 from django.contrib import admin, messages
-from django.db import models
+from django.db import models, transaction
+from django.db.models.fields.files import FieldFile
 from django.forms import model_to_dict
+from django.http import JsonResponse
 from django.shortcuts import render
 
 from apps.contact.models import Contact, ContactBackup
+from core.admin import InputListFilter, LargeTableAdminMixin
 
 logger = logging.getLogger(__name__)
 
@@ -22,13 +25,28 @@ class ContactAdminForm(forms.ModelForm):
         exclude = ("user", "external_id", "imported_at", "created_at", "last_updated")
 
 
+class OrganizationListFilter(InputListFilter):
+    """Organization filter without the DISTINCT scan over the free-text column."""
+
+    title = "organization"
+    parameter_name = "organization"
+    autocomplete_url_name = "admin:contact_contact_organization_autocomplete"
+
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(organization__iexact=self.value())
+        return queryset
+
+
 @admin.register(Contact)
-class ContactAdmin(admin.ModelAdmin):
+class ContactAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     form = ContactAdminForm
     actions = ["create_backup_action"]
 
     list_display = ["display_name", "email", "mobile_phone", "created_at"]
-    list_filter = ["import_source", "is_active", "created_at", "organization"]
+    list_filter = ["import_source", "is_active", "created_at", OrganizationListFilter]
+    # Sort on the indexed column instead of the model's name ordering
+    ordering = ["-created_at"]
     search_fields = ["first_name", "last_name", "email", "mobile_phone", "organization"]
     readonly_fields = ["external_id", "imported_at", "created_at", "last_updated"]
 
@@ -69,9 +87,28 @@ class ContactAdmin(admin.ModelAdmin):
         custom_urls = [
             path("analytics", self.analytics_view, name="contact_contact_analytics"),
             path("bulk_backup", self.bulk_backup_view, name="contact_contact_bulk_backup"),
+            path(
+                "organization_autocomplete",
+                self.admin_site.admin_view(self.organization_autocomplete_view),
+                name="contact_contact_organization_autocomplete",
+            ),
         ]
         return custom_urls + urls
 
+    def organization_autocomplete_view(self, request):
+        """Return up to 20 organization names starting with `term` for the organization filter"""
+        term = request.GET.get("term", "").strip()
+        if len(term) < 2:
+            return JsonResponse({"results": []})
+
+        organizations = (
+            Contact.objects.filter(organization__istartswith=term)
+            .order_by("organization")
+            .values_list("organization", flat=True)
+            .distinct()[:20]
+        )
+        return JsonResponse({"results": list(organizations)})
+
     def analytics_view(self, request):
         """Contact analytics view"""
         stats = Contact.objects.filter(is_active=True).aggregate(
@@ -104,7 +141,7 @@ class ContactAdmin(admin.ModelAdmin):
 
         context = {
             "title": "Contact Analytics",
-            "duplicate_count": Contact.contact_manager.duplicate_numbers(request.user.pk).count(),
+            "duplicate_count": Contact.objects.duplicate_numbers(request.user.pk).count(),
             "source_stats": source_stats,
             "org_stats": org_stats,
             "total_contacts": stats["total_contacts"],
@@ -130,8 +167,13 @@ class ContactAdmin(admin.ModelAdmin):
                     for key, value in dict_contact.items():
                         if isinstance(value, (datetime.datetime, datetime.date)):
                             dict_contact[key] = value.isoformat()
+                        elif isinstance(value, FieldFile):
+                            # Photos are backed up by their storage path, the file itself stays in place
+                            dict_contact[key] = value.name or None
 
-                    ContactBackup.objects.create(contact=contact, user_id=user_id, contact_data=dict_contact)
+                    # A failed backup must not break the transaction of the ones after it
+                    with transaction.atomic():
+                        ContactBackup.objects.create(contact=contact, user_id=user_id, contact_data=dict_contact)
                     success_ids.append(contact_id)
                 except Exception as err:
                     logger.exception(f"Error creating backups: {err}, Contact ID: {getattr(contact, "id", "Unknown")} data: {contact}")
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.2 on 2026-10-19 10:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contact", "0002_contact_photo_file"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contact",
+            name="photo_hash",
+            field=models.CharField(blank=True, db_index=True, default="", max_length=64),
+        ),
+        migrations.AddField(
+            model_name="contact",
+            name="photo_thumbnail",
+            field=models.FileField(
+                blank=True,
+                help_text="Small JPEG version of the photo for list views",
+                null=True,
+                upload_to="contact_photos/thumbnails/",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:12
+
+import apps.contact.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contact", "0003_contact_photo_thumbnail_photo_hash"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="contact",
+            name="birthday_doy",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=apps.contact.models.DayOfYear("birthday"),
+                output_field=models.SmallIntegerField(),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contact",
+            index=models.Index(
+                condition=models.Q(("birthday_doy__isnull", False), ("is_active", True)),
+                fields=["user", "birthday_doy"],
+                name="contact_user_birthday_doy",
+            ),
+        ),
+    ]
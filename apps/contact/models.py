@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import datetime
+
 from django.forms.models import model_to_dict
 from django.db import models
-from django.db.models import Q, Count, Window, QuerySet, Manager, F
+from django.db.models import Q, Count, Window, QuerySet, Manager, F, Func, Case, When
 from django.db.models.functions import RowNumber
 from django.utils import timezone as django_timezone
 
@@ -12,6 +14,27 @@ from core.models import BaseModel
 from apps.user.models import User
 
 
+# Leap year used to number the days of the year, so February 29 gets its own day and
+# every other date has the same number in every year
+DAY_OF_YEAR_CALENDAR_YEAR = 2000
+DAYS_IN_YEAR = 366
+
+
+def day_of_year(value: datetime.date) -> int:
+    """Day number (1-366) of the month and day of `value`, the same in leap and common years."""
+    return datetime.date(DAY_OF_YEAR_CALENDAR_YEAR, value.month, value.day).timetuple().tm_yday
+
+
+class DayOfYear(Func):
+    """Database side of `day_of_year`. Immutable, so it can back a stored generated column."""
+
+    template = (
+        f"EXTRACT(DOY FROM MAKE_DATE({DAY_OF_YEAR_CALENDAR_YEAR}, "
+        "EXTRACT(MONTH FROM %(expressions)s)::integer, EXTRACT(DAY FROM %(expressions)s)::integer))::smallint"
+    )
+    output_field = models.SmallIntegerField()
+
+
 class ContactManager(Manager):
     def duplicate_numbers(self, user_id: int) -> QuerySet:
         """Find duplicate phone numbers with details"""
@@ -40,6 +63,36 @@ class ContactManager(Manager):
             .order_by("-created_at")
         )
 
+    def upcoming_birthdays(self, start: datetime.date, days: int, user_ids: list[int] | None = None) -> QuerySet:
+        """Active contacts whose birthday falls within `days` days from `start`, inclusive.
+
+        Filters on the stored `birthday_doy` column with a range that wraps around the new
+        year (December 20 + 30 days matches December 20-31 and January 1-19). Contacts are
+        ordered by the next occurrence of their birthday.
+        """
+        start_doy = day_of_year(start)
+        end_doy = day_of_year(start + datetime.timedelta(days=min(days, DAYS_IN_YEAR - 1)))
+
+        queryset = self.filter(is_active=True, birthday_doy__isnull=False)
+        if user_ids is not None:
+            queryset = queryset.filter(user_id__in=user_ids)
+
+        if days >= DAYS_IN_YEAR - 1:
+            in_window = Q()
+        elif start_doy <= end_doy:
+            in_window = Q(birthday_doy__range=(start_doy, end_doy))
+        else:
+            in_window = Q(birthday_doy__gte=start_doy) | Q(birthday_doy__lte=end_doy)
+
+        return queryset.filter(in_window).order_by(
+            Case(
+                When(birthday_doy__lt=start_doy, then=F("birthday_doy") + DAYS_IN_YEAR),
+                default=F("birthday_doy"),
+                output_field=models.IntegerField(),
+            ),
+            "pk",
+        )
+
 
 class Contact(BaseModel):
     """Model for storing contact information imported from various sources."""
@@ -72,6 +125,10 @@ class Contact(BaseModel):
 
     # Personal information
     birthday = models.DateField(null=True, blank=True)
+    # Day of the year of the birthday (see `day_of_year`), for index-backed date-window scans
+    birthday_doy = models.GeneratedField(
+        expression=DayOfYear("birthday"), output_field=models.SmallIntegerField(), db_persist=True
+    )
     anniversary = models.DateField(null=True, blank=True)
 
     # Online presence
@@ -102,6 +159,14 @@ class Contact(BaseModel):
         null=True,
         help_text="Optional photo file for the contact",
     )
+    photo_thumbnail = models.FileField(
+        upload_to="contact_photos/thumbnails/",
+        blank=True,
+        null=True,
+        help_text="Small JPEG version of the photo for list views",
+    )
+    # SHA-256 of the photo bytes, identical photos share one stored file
+    photo_hash = models.CharField(max_length=64, blank=True, default="", db_index=True)
 
     deactivated_at = models.DateTimeField(blank=True, null=True)
 
@@ -110,6 +175,13 @@ class Contact(BaseModel):
     class Meta:
         unique_together = [["user", "external_id", "import_source"]]
         ordering = ["first_name", "middle_name", "last_name"]
+        indexes = [
+            models.Index(
+                fields=["user", "birthday_doy"],
+                condition=Q(is_active=True, birthday_doy__isnull=False),
+                name="contact_user_birthday_doy",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.first_name} {self.last_name}".strip() or "Unnamed Contact"
@@ -123,7 +195,7 @@ class Contact(BaseModel):
         # Create a backup copy
         ContactBackup.objects.create(
             contact_id=str(self.pk),
-            user=self.user,
+            user_id=self.user_id,
             contact_data=model_to_dict(self),
         )
 
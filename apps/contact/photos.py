@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+
+
+logger = logging.getLogger(__name__)
+
+PHOTO_DIRECTORY = "contact_photos"
+THUMBNAIL_DIRECTORY = "contact_photos/thumbnails"
+THUMBNAIL_SIZE = (128, 128)
+THUMBNAIL_QUALITY = 80
+
+# Raw photo bytes wait in the cache between the import request and the worker
+PHOTO_STAGING_KEY = "contact_photo:{photo_hash}"
+PHOTO_STAGING_TIMEOUT = 60 * 60 * 24
+
+IMAGE_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"BM", "image/bmp"),
+)
+
+MIME_TYPE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp",
+    "image/bmp": "bmp",
+}
+
+
+def sniff_image_mime_type(data: bytes) -> str | None:
+    """Detect the image MIME type from the first bytes of `data`, None if unknown."""
+    header = data[:12]
+
+    for signature, mime_type in IMAGE_SIGNATURES:
+        if header.startswith(signature):
+            return mime_type
+
+    # WebP: RIFF....WEBP
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "image/webp"
+
+    return None
+
+
+def photo_content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def photo_path(photo_hash: str, mime_type: str | None) -> str:
+    """Content-addressed storage path, sharded by the first two hash characters."""
+    extension = MIME_TYPE_EXTENSIONS.get(mime_type or "", "bin")
+    return f"{PHOTO_DIRECTORY}/{photo_hash[:2]}/{photo_hash}.{extension}"
+
+
+def thumbnail_path(photo_hash: str) -> str:
+    return f"{THUMBNAIL_DIRECTORY}/{photo_hash[:2]}/{photo_hash}.jpg"
+
+
+def stage_photo(data: bytes) -> str:
+    """Keep raw photo bytes in the cache for the storage worker and return their content hash.
+
+    Identical photos share one cache entry, so a file with the same picture on
+    many cards is staged (and later stored) only once.
+    """
+    photo_hash = photo_content_hash(data)
+    cache.add(PHOTO_STAGING_KEY.format(photo_hash=photo_hash), data, timeout=PHOTO_STAGING_TIMEOUT)
+    return photo_hash
+
+
+def get_staged_photo(photo_hash: str) -> bytes | None:
+    return cache.get(PHOTO_STAGING_KEY.format(photo_hash=photo_hash))
+
+
+def generate_thumbnail(data: bytes, size: tuple[int, int] = THUMBNAIL_SIZE) -> bytes | None:
+    """Return a JPEG thumbnail that fits in `size`, None if the image cannot be decoded."""
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            # Decode at a reduced scale where the format supports it (JPEG)
+            image.draft("RGB", size)
+            image.thumbnail(size)
+            output = io.BytesIO()
+            image.convert("RGB").save(output, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+            return output.getvalue()
+    except (UnidentifiedImageError, OSError, ValueError) as err:
+        logger.warning(f"Failed to generate photo thumbnail: {err}")
+        return None
+
+
+def store_photo(photo_hash: str, data: bytes) -> tuple[str, str | None]:
+    """Write the photo and its thumbnail to storage unless they already exist.
+
+    Args:
+        photo_hash: SHA-256 of `data`
+        data: Raw image bytes
+
+    Returns:
+        tuple: (photo path, thumbnail path or None if no thumbnail could be made)
+    """
+    path = photo_path(photo_hash, sniff_image_mime_type(data))
+    if not default_storage.exists(path):
+        path = default_storage.save(path, ContentFile(data))
+
+    thumbnail = thumbnail_path(photo_hash)
+    if default_storage.exists(thumbnail):
+        return path, thumbnail
+
+    thumbnail_data = generate_thumbnail(data)
+    if thumbnail_data is None:
+        return path, None
+
+    return path, default_storage.save(thumbnail, ContentFile(thumbnail_data))
@@ -38,7 +38,7 @@ class ContactSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Contact
-        exclude = ("user", "is_active", "deactivated_at", "external_id")
+        exclude = ("user", "is_active", "deactivated_at", "external_id", "photo_hash")
 
     def get_display_name(self, obj: Contact) -> str:
         if obj.full_name:
@@ -62,6 +62,13 @@ class ContactSerializer(serializers.ModelSerializer):
         return today.year - obj.birthday.year - ((today.month, today.day) < (obj.birthday.month, obj.birthday.day))
 
 
+class ContactListSerializer(ContactSerializer):
+    """ContactSerializer for list views, only the photo thumbnail is returned"""
+
+    class Meta(ContactSerializer.Meta):
+        exclude = ContactSerializer.Meta.exclude + ("photo_file",)
+
+
 class ContactBackupCreateSerializer(serializers.ModelSerializer):
     """ModelSerializer for creating new contacts"""
 
@@ -5,6 +5,7 @@ import logging
 from datetime import timedelta
 from typing import Any
 from celery import shared_task
+from django.db import transaction
 from django.utils import timezone
 
 from apps.contact.models import Contact
@@ -21,7 +22,7 @@ def task_cleanup_inactive_contacts(self) -> str:
 
     # Get contacts to delete
     contacts_to_delete = Contact.objects.filter(is_active=False, deactivated_at__lt=thirty_days_ago)
-    
+
     if not contacts_to_delete.exists():
         logger.info("No inactive contacts to delete.")
         return "No inactive contacts to delete."
@@ -33,17 +34,16 @@ def task_cleanup_inactive_contacts(self) -> str:
 
 
 @shared_task(bind=True, name="task_save_contact")
-def task_save_contact(self, contact_data: dict[str, Any]):
+def task_save_contact(self, contact_data: dict[str, Any], photo_hash: str | None = None):
     """Save a contact to the database.
     Args:
         contact_data (dict): Contact data to save.
+        photo_hash (str, optional): Hash of a photo staged by `apps.contact.photos.stage_photo`.
     Returns:
         bool: True if contact was saved successfully, False otherwise.
     """
     try:
-        Contact.objects.create(**contact_data)
-        return {"status": "success"}
-
+        contact = Contact.objects.create(**contact_data)
     except Exception as err:
         logger.error(f"Failed to save contact: {err}")
 
@@ -53,3 +53,38 @@ def task_save_contact(self, contact_data: dict[str, Any]):
             raise self.retry(countdown=60, max_retries=3)
 
         return {"status": "failed", "error": str(err), "contact_data": contact_data}
+
+    # Queued outside the retried block so a broker error never creates the contact twice
+    if photo_hash:
+        transaction.on_commit(
+            lambda: task_store_contact_photo.delay(contact_id=contact.pk, photo_hash=photo_hash)  # type: ignore
+        )
+    return {"status": "success"}
+
+
+@shared_task(bind=True, name="task_store_contact_photo")
+def task_store_contact_photo(self, contact_id: int, photo_hash: str):
+    """Write a staged contact photo and its thumbnail to storage and attach them to the contact.
+    Args:
+        contact_id (int): Contact to attach the photo to.
+        photo_hash (str): Content hash the photo was staged under.
+    """
+    from apps.contact.photos import get_staged_photo, store_photo
+
+    data = get_staged_photo(photo_hash)
+    if data is None:
+        logger.warning(f"Staged photo {photo_hash} for contact {contact_id} expired")
+        return {"status": "failed", "error": "Staged photo not found"}
+
+    try:
+        path, thumbnail = store_photo(photo_hash, data)
+    except Exception as err:
+        logger.error(f"Failed to store photo for contact {contact_id}: {err}")
+
+        if self.request.retries < 3:
+            raise self.retry(countdown=60, max_retries=3)
+
+        return {"status": "failed", "error": str(err)}
+
+    Contact.objects.filter(pk=contact_id).update(photo_file=path, photo_thumbnail=thumbnail, photo_hash=photo_hash)
+    return {"status": "success", "photo": path, "thumbnail": thumbnail}
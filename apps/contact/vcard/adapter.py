@@ -195,59 +195,53 @@ class VCardAdapter:
         return self._get_cached("photo_url", _get_photo_url)
 
     @property
-    def vcard_photo_base64(self) -> str | None:
-        """Get base64 photo data if it's binary, None if it's a URL or not set."""
+    def photo_bytes(self) -> bytes | None:
+        """Get the embedded photo as raw bytes, None if it's a URL or not set.
+
+        vobject already decodes `ENCODING=b` values, so the bytes are used as is.
+        """
 
-        def _get_photo_base64():
+        def _get_photo_bytes():
             try:
                 if not hasattr(self.vcard, "photo"):
                     return None
 
                 photo_value = self.vcard.photo.value
-
-                # If it's binary data, convert to base64
-                if isinstance(photo_value, bytes):
-                    return base64.b64encode(photo_value).decode("utf-8")
+                if isinstance(photo_value, bytes) and photo_value:
+                    return photo_value
 
                 return None
             except Exception as e:
-                logger.debug(f"Error getting photo base64: {e}")
+                logger.debug(f"Error getting photo bytes: {e}")
                 return None
 
-        return self._get_cached("vcard_photo_base64", _get_photo_base64)
+        return self._get_cached("photo_bytes", _get_photo_bytes)
+
+    @property
+    def vcard_photo_base64(self) -> str | None:
+        """Get base64 photo data if it's binary, None if it's a URL or not set."""
+        photo_bytes = self.photo_bytes
+        return base64.b64encode(photo_bytes).decode("ascii") if photo_bytes else None
 
     @property
     def vcard_mime_type(self) -> str | None:
-        """Get MIME type for base64 photo, None if it's URL"""
+        """Get MIME type for the binary photo, None if it's URL"""
 
         def _get_mime_type():
-            try:
-                if not hasattr(self.vcard, "photo"):
-                    return None
-
-                photo_value = self.vcard.photo.value
+            from apps.contact.photos import sniff_image_mime_type
 
-                # Only return MIME type for binary data
-                if isinstance(photo_value, bytes):
-                    if photo_value.startswith(b"\xff\xd8"):
-                        return "image/jpeg"
-                    elif photo_value.startswith(b"\x89PNG"):
-                        return "image/png"
-                    elif photo_value.startswith(b"GIF87a") or photo_value.startswith(b"GIF89a"):
-                        return "image/gif"
-                    elif "JPEG" in photo_value.decode("utf-8", errors="ignore"):
-                        return "image/jpeg"  # default
-                    elif "PNG" in photo_value.decode("utf-8", errors="ignore"):
-                        return "image/png"
-                    elif "GIF" in photo_value.decode("utf-8", errors="ignore"):
-                        return "image/gif"
-                    else:
-                        return None
-                return None
-            except Exception as e:
-                logger.debug(f"Error getting MIME type: {e}")
+            photo_bytes = self.photo_bytes
+            if not photo_bytes:
                 return None
 
+            # Sniff the byte header, fall back to the TYPE parameter (e.g. PHOTO;TYPE=JPEG)
+            mime_type = sniff_image_mime_type(photo_bytes)
+            if mime_type is None:
+                photo_type = getattr(self.vcard.photo, "type_param", None)
+                if isinstance(photo_type, str) and photo_type.strip():
+                    mime_type = f"image/{photo_type.strip().lower()}"
+            return mime_type
+
         return self._get_cached("vcard_mime_type", _get_mime_type)
 
     # Utility methods
@@ -267,10 +261,8 @@ class VCardAdapter:
                 "department": self.department,
                 "birthday": self.birthday.isoformat() if self.birthday else None,
                 "websites": self.websites,
-                "photo_url": self.photo_url,
+                "photo_url": self.photo_url or "",
                 "notes": self.notes,
-                # TODO: "vcard_photo_base64": self.vcard_photo_base64,
-                # TODO: "vcard_mime_type": self.vcard_mime_type,
             }
         except Exception as err:
             logger.error(f"Error converting vCard to dict: {err}")
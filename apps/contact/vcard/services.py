@@ -6,6 +6,7 @@ import ulid
 from vobject import base as vobject
 
 from apps.contact.enums import SourceEnum
+from apps.contact.photos import stage_photo
 from apps.contact.vcard.adapter import VCardAdapter
 from apps.user.models import User
 
@@ -125,13 +126,16 @@ class VCardImportService:
                 try:
                     adapter = VCardAdapter(vcard)
                     contact_data = adapter.to_contact_dict()
-                    contact_data["user"] = self.user.id
+                    contact_data["user_id"] = self.user.id
                     contact_data["import_source"] = SourceEnum.VCARD.value
                     contact_data["external_id"] = f"vcard_{ulid.ULID()}"
 
+                    # Raw photo bytes are staged in the cache, the worker stores them after saving the contact
+                    photo_hash = stage_photo(adapter.photo_bytes) if adapter.photo_bytes else None
+
                     from apps.contact.tasks import task_save_contact
 
-                    task_save_contact.delay(contact_data=contact_data)  # type: ignore
+                    task_save_contact.delay(contact_data=contact_data, photo_hash=photo_hash)  # type: ignore
                 except Exception as err:
                     logger.warning(f"Failed to process vCard {i}: {err}")
                     continue
@@ -12,6 +12,7 @@ from rest_framework.response import Response
 from apps.contact.filter import ContactDuplicateFilter, ContactFilter
 from apps.contact.models import Contact
 from apps.contact.serializers import (
+    ContactListSerializer,
     ContactSerializer,
     VCardImportSerializer,
     ContactDuplicateSerializer,
@@ -56,7 +57,7 @@ class VCardImportAPIView(BaseAPIView):
 class ContactListAPIView(BaseListAPIView):
     """Contact List API with filtering and search"""
 
-    serializer_class = ContactSerializer
+    serializer_class = ContactListSerializer
     permission_classes = [IsOwner]
     filterset_class = ContactFilter
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]  # type: ignore
@@ -83,13 +84,14 @@ class ContactDetailAPIView(BaseRetrieveAPIView):
         """Override to add custom response format and logging"""
         try:
             instance = self.get_object()
-            serializer = self.get_serializer(instance)
+            with self.track_serializer():
+                data = self.get_serializer(instance).data
 
             # Log contact access for analytics (optional)
             logger.info(f"Contact {instance.id} accessed by user {request.user.id}")
 
             return self.success_response(
-                data=serializer.data, message=f"Contact details for {serializer.data.get('display_name', 'Unknown')}"
+                data=data, message=f"Contact details for {data.get('display_name', 'Unknown')}"
             )
 
         except Contact.DoesNotExist:
@@ -106,17 +108,18 @@ class ContactDuplicateListAPIView(BaseListAPIView):
 
     def get(self, request: Request, *args, **kwargs) -> Response:
         _queryset = self.get_queryset()
-        serializer = self.get_serializer(_queryset, many=True)
-
-        if not serializer.data:
-            return self.success_response(data=[], message="No duplicate contacts found")
-
-        data = serializer.data
-        if self.filterset_class:
-            filterset = self.filterset_class(self.request.GET, queryset=_queryset)
-            data = self.get_serializer(filterset.qs, many=True).data
-        else:
-            data = self.get_serializer(_queryset, many=True).data
+        with self.track_serializer():
+            serializer = self.get_serializer(_queryset, many=True)
+
+            if not serializer.data:
+                return self.success_response(data=[], message="No duplicate contacts found")
+
+            data = serializer.data
+            if self.filterset_class:
+                filterset = self.filterset_class(self.request.GET, queryset=_queryset)
+                data = self.get_serializer(filterset.qs, many=True).data
+            else:
+                data = self.get_serializer(_queryset, many=True).data
 
         return self.success_response(
             data=data,
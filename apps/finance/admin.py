@@ -1,6 +1,7 @@
 from django.contrib import admin
 
 from apps.finance.models import SubscriptionService, SubscriptionServiceCategory, UserSubscription
+from core.admin import LargeTableAdminMixin
 
 
 @admin.register(SubscriptionService)
@@ -31,7 +32,7 @@ class SubscriptionServiceCategoryAdmin(admin.ModelAdmin):
 
 
 @admin.register(UserSubscription)
-class UserSubscriptionAdmin(admin.ModelAdmin):
+class UserSubscriptionAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = (
         "user",
         "service",
@@ -46,6 +47,7 @@ class UserSubscriptionAdmin(admin.ModelAdmin):
         "status",
         "auto_renewal",
     )
+    list_select_related = ("user", "service")
     search_fields = ("user__email", "service__name", "plan_name")
     list_filter = ("status", "billing_cycle", "currency", "auto_renewal")
     ordering = ("-started_at",)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import time
+
+from collections import defaultdict
+from decimal import Decimal
+from typing import Any
+
+from django.core.cache import cache
+from django.db.models import Case, Count, DecimalField, ExpressionWrapper, F, IntegerField, Sum, Value, When
+from django.db.models.functions import TruncMonth
+
+from apps.finance.enums import (
+    AnalyticsBucketChoices,
+    AnalyticsGroupByChoices,
+    BillingCycleChoices,
+    SubscriptionStatusChoices,
+)
+from apps.finance.ledger import get_horizon_end
+from apps.finance.models import ProjectedCharge, UserSubscription
+from apps.finance.reports import convert_currency_totals
+from apps.user.models import User
+from core.enums import CurrencyChoices
+from core.services.exchange_rates import ExchangeRateProvider
+
+
+logger = logging.getLogger(__name__)
+
+# Label of subscriptions whose service has no category
+UNCATEGORIZED = "Other"
+
+PERIODS_PER_YEAR = {
+    BillingCycleChoices.WEEKLY: 52,
+    BillingCycleChoices.MONTHLY: 12,
+    BillingCycleChoices.QUARTERLY: 4,
+    BillingCycleChoices.SEMI_ANNUALLY: 2,
+    BillingCycleChoices.ANNUALLY: 1,
+}
+
+# Field of UserSubscription each grouping is keyed on
+GROUP_BY_FIELDS = {
+    AnalyticsGroupByChoices.CATEGORY: "service__category__name",
+    AnalyticsGroupByChoices.SERVICE: "service__name",
+    AnalyticsGroupByChoices.CURRENCY: "currency",
+}
+
+CACHE_KEY = "finance_analytics:{user_id}:{version}:{date}:{group_by}:{bucket}:{currency}"
+CACHE_TIMEOUT = 60 * 60
+VERSION_KEY = "finance_analytics:version:{user_id}"
+
+# Normalized monthly cost of a subscription, charges per year * amount / 12 (monthly when no cycle is set)
+MONTHLY_COST = ExpressionWrapper(
+    F("amount")
+    * Case(
+        *[When(billing_cycle=cycle, then=Value(periods)) for cycle, periods in PERIODS_PER_YEAR.items()],
+        default=Value(12),
+        output_field=IntegerField(),
+    )
+    / Value(12),
+    output_field=DecimalField(),
+)
+
+
+def build_subscription_analytics(
+    user: User,
+    group_by: str = AnalyticsGroupByChoices.CATEGORY,
+    bucket: str | None = None,
+    currency: str = CurrencyChoices.TRY,
+    exchange_rate_provider: ExchangeRateProvider | None = None,
+    today: datetime.date | None = None,
+) -> dict[str, Any]:
+    """Spend of the active subscriptions of `user` grouped by category, service or currency.
+
+    The normalized monthly cost (a weekly plan counts 52/12 times, an annual one
+    1/12) is summed in SQL per group and currency, then converted to `currency`
+    with one rate per currency. With `bucket="month"` every group also gets its
+    projected charges per calendar month over the ledger horizon.
+
+    Args:
+        user: Owner of the subscriptions
+        group_by: One of `AnalyticsGroupByChoices`
+        bucket: `AnalyticsBucketChoices.MONTH` or None for no time series
+        currency: Currency of the converted totals
+        exchange_rate_provider: Rate source, a new ExchangeRateProvider by default
+        today: Start of the time series, today by default
+
+    Returns:
+        dict: Groups ordered by monthly cost, largest first
+    """
+    today = today or datetime.date.today()
+    provider = exchange_rate_provider or ExchangeRateProvider()
+    field = GROUP_BY_FIELDS[group_by]
+
+    rows = (
+        UserSubscription.objects.filter(user=user, status=SubscriptionStatusChoices.ACTIVE)
+        .values(key=F(field), code=F("currency"))
+        .annotate(monthly_cost=Sum(MONTHLY_COST), subscription_count=Count("id"))
+        .order_by()
+    )
+
+    groups: dict[str, dict[str, Any]] = {}
+    group_currency_totals: dict[str, dict[str, Decimal]] = defaultdict(dict)
+    for row in rows:
+        key = row["key"] or UNCATEGORIZED
+        group = groups.setdefault(key, {"key": key, "subscription_count": 0})
+        group["subscription_count"] += row["subscription_count"]
+        totals = group_currency_totals[key]
+        totals[row["code"]] = totals.get(row["code"], Decimal("0")) + row["monthly_cost"]
+
+    for key, group in groups.items():
+        group["monthly_cost"] = convert_currency_totals(group_currency_totals[key], currency, provider)
+
+    if bucket == AnalyticsBucketChoices.MONTH:
+        for key, buckets in _get_monthly_buckets(user, field, currency, provider, today).items():
+            groups.setdefault(key, {"key": key, "subscription_count": 0, "monthly_cost": Decimal("0")})
+            groups[key]["buckets"] = buckets
+        for group in groups.values():
+            group.setdefault("buckets", [])
+
+    ordered = sorted(groups.values(), key=lambda group: (-group["monthly_cost"], group["key"]))
+    return {
+        "group_by": group_by,
+        "bucket": bucket,
+        "currency": currency,
+        "monthly_total": str(sum((group["monthly_cost"] for group in ordered), Decimal("0"))),
+        "groups": [{**group, "monthly_cost": str(group["monthly_cost"])} for group in ordered],
+    }
+
+
+def _get_monthly_buckets(
+    user: User,
+    field: str,
+    currency: str,
+    provider: ExchangeRateProvider,
+    today: datetime.date,
+) -> dict[str, list[dict[str, str]]]:
+    """Projected charges of `user` per group and calendar month, from `today` to the end of the ledger horizon."""
+    rows = (
+        ProjectedCharge.objects.filter(user=user, billing_date__gte=today, billing_date__lt=get_horizon_end(today))
+        .annotate(month=TruncMonth("billing_date"))
+        .values("month", key=F(f"subscription__{field}"), code=F("currency"))
+        .annotate(total=Sum("amount"))
+        .order_by()
+    )
+
+    month_totals: dict[str, dict[datetime.date, dict[str, Decimal]]] = defaultdict(lambda: defaultdict(dict))
+    for row in rows:
+        month_totals[row["key"] or UNCATEGORIZED][row["month"]][row["code"]] = row["total"]
+
+    return {
+        key: [
+            {
+                "month": month.strftime("%Y-%m"),
+                "total": str(convert_currency_totals(months[month], currency, provider)),
+            }
+            for month in sorted(months)
+        ]
+        for key, months in month_totals.items()
+    }
+
+
+def get_analytics_version(user_id: str) -> int:
+    return cache.get_or_set(VERSION_KEY.format(user_id=user_id), time.time_ns, timeout=None)
+
+
+def invalidate_subscription_analytics(user_id: str) -> None:
+    """Drop every cached analytics result of the user by moving to a new version."""
+    cache.set(VERSION_KEY.format(user_id=user_id), time.time_ns(), timeout=None)
+
+
+def get_subscription_analytics(
+    user: User,
+    group_by: str = AnalyticsGroupByChoices.CATEGORY,
+    bucket: str | None = None,
+    currency: str = CurrencyChoices.TRY,
+) -> dict[str, Any]:
+    """Cached `build_subscription_analytics`, per user and day until the user's subscriptions change."""
+    today = datetime.date.today()
+    cache_key = CACHE_KEY.format(
+        user_id=user.pk,
+        version=get_analytics_version(user.pk),
+        date=today.isoformat(),
+        group_by=group_by,
+        bucket=bucket or "",
+        currency=currency,
+    )
+
+    if (analytics := cache.get(cache_key)) is not None:
+        return analytics
+
+    analytics = build_subscription_analytics(user, group_by=group_by, bucket=bucket, currency=currency, today=today)
+    cache.set(cache_key, analytics, timeout=CACHE_TIMEOUT)
+    return analytics
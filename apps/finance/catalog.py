@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.finance.models import SubscriptionService, SubscriptionServiceCategory
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CatalogSnapshot:
+    """Every service and category, loaded together for one catalog version."""
+
+    version: int
+    services: dict[int, SubscriptionService] = field(default_factory=dict)
+    services_by_name: dict[str, SubscriptionService] = field(default_factory=dict)
+    categories: dict[int, SubscriptionServiceCategory] = field(default_factory=dict)
+    category_services: dict[int | None, list[SubscriptionService]] = field(default_factory=dict)
+    payload: list[dict[str, Any]] = field(default_factory=list)
+    etag: str = ""
+
+
+class ServiceCatalog:
+    """Process-local cache of the subscription service catalog.
+
+    The whole catalog (a few hundred rows) is loaded with two queries and kept in
+    memory. A version stamp in the shared cache (Redis) tells processes when to
+    reload: saving or deleting a service or category sets a new stamp (see
+    `apps.finance.signals`), and every process compares its snapshot with the stamp
+    at most once per `FINANCE_CATALOG_VERSION_CHECK_SECONDS`.
+
+    Returned model instances are shared by the whole process and must be treated as read-only.
+    """
+
+    VERSION_KEY = "finance_catalog:version"
+
+    def __init__(self):
+        self._snapshot: CatalogSnapshot | None = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    # ----------------------------------------------------
+    # Lookups
+    # ----------------------------------------------------
+    def get_service(self, service_id: int) -> SubscriptionService | None:
+        return self.snapshot.services.get(service_id)
+
+    def get_service_by_name(self, name: str) -> SubscriptionService | None:
+        return self.snapshot.services_by_name.get(name)
+
+    def get_category(self, category_id: int) -> SubscriptionServiceCategory | None:
+        return self.snapshot.categories.get(category_id)
+
+    def categories(self) -> list[SubscriptionServiceCategory]:
+        return list(self.snapshot.categories.values())
+
+    def services_in_category(self, category: SubscriptionServiceCategory | int | None) -> list[SubscriptionService]:
+        """Services of a category (instance or id), ordered by name; None for services without a category."""
+        category_id = category.pk if isinstance(category, SubscriptionServiceCategory) else category
+        return list(self.snapshot.category_services.get(category_id, []))
+
+    def as_payload(self) -> tuple[list[dict[str, Any]], str]:
+        """Serialized catalog and its ETag, built once per version."""
+        snapshot = self.snapshot
+        return snapshot.payload, snapshot.etag
+
+    # ----------------------------------------------------
+    # Versioning
+    # ----------------------------------------------------
+    @property
+    def snapshot(self) -> CatalogSnapshot:
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if snapshot is not None and now - self._checked_at < settings.FINANCE_CATALOG_VERSION_CHECK_SECONDS:
+            return snapshot
+
+        version = cache.get_or_set(self.VERSION_KEY, time.time_ns, timeout=None)
+        self._checked_at = now
+        if snapshot is not None and snapshot.version == version:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != version:
+                self._snapshot = self._load(version)
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Publish a new version so every process reloads the catalog."""
+        cache.set(self.VERSION_KEY, time.time_ns(), timeout=None)
+        self._snapshot = None
+
+    def _load(self, version: int) -> CatalogSnapshot:
+        snapshot = CatalogSnapshot(version=version)
+        snapshot.categories = {
+            category.pk: category for category in SubscriptionServiceCategory.objects.order_by("name")
+        }
+
+        category_services: dict[int | None, list[SubscriptionService]] = defaultdict(list)
+        for service in SubscriptionService.objects.order_by("name"):
+            # Share the category instances instead of loading them again with select_related
+            if service.category_id is not None:
+                service.category = snapshot.categories[service.category_id]
+            snapshot.services[service.pk] = service
+            snapshot.services_by_name[service.name] = service
+            category_services[service.category_id].append(service)
+        snapshot.category_services = dict(category_services)
+
+        snapshot.payload = self._serialize(snapshot)
+        snapshot.etag = f'"{hashlib.md5(repr(snapshot.payload).encode("utf-8")).hexdigest()}"'
+
+        logger.info(f"Loaded service catalog version {version}: {len(snapshot.services)} services")
+        return snapshot
+
+    def _serialize(self, snapshot: CatalogSnapshot) -> list[dict[str, Any]]:
+        def service_data(service: SubscriptionService) -> dict[str, Any]:
+            return {
+                "id": service.pk,
+                "name": service.name,
+                "website_url": service.website_url,
+                "logo_url": service.logo_url,
+                "amount": str(service.amount) if service.amount is not None else None,
+                "currency": service.currency,
+                "free_trial_days": service.free_trial_days,
+                "is_active": service.is_active,
+            }
+
+        categories = [
+            {
+                "id": category.pk,
+                "name": category.name,
+                "services": [service_data(service) for service in snapshot.category_services.get(category.pk, [])],
+            }
+            for category in snapshot.categories.values()
+        ]
+        if uncategorized := snapshot.category_services.get(None):
+            categories.append(
+                {"id": None, "name": None, "services": [service_data(service) for service in uncategorized]}
+            )
+        return categories
+
+
+catalog = ServiceCatalog()
@@ -18,6 +18,16 @@ class SubscriptionStatusChoices(models.TextChoices):
     PENDING = "pending", "Pending Activation"
 
 
+class AnalyticsGroupByChoices(models.TextChoices):
+    CATEGORY = "category", "Category"
+    SERVICE = "service", "Service"
+    CURRENCY = "currency", "Currency"
+
+
+class AnalyticsBucketChoices(models.TextChoices):
+    MONTH = "month", "Month"
+
+
 class BillTypeChoices(models.TextChoices):
     ELECTRICITY = "electricity", "Electricity"
     NATURAL_GAS = "natural_gas", "Natural Gas"
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import csv
+import io
+import logging
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.db import transaction
+
+from apps.finance.analytics import invalidate_subscription_analytics
+from apps.finance.ledger import refresh_projected_charges
+from apps.finance.models import UserSubscription
+from apps.finance.serializers import UserSubscriptionSerializer
+from apps.user.models import User
+
+
+logger = logging.getLogger(__name__)
+
+MAX_BULK_ROWS = 500
+
+
+@dataclass
+class BulkCreateResult:
+    created: list[UserSubscription] = field(default_factory=list)
+    # One entry per invalid row: {"row": index, "errors": {field: [messages]}}
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+
+def parse_subscription_csv(csv_file: Any) -> list[dict[str, str]]:
+    """Read subscription rows from a CSV file whose header names `UserSubscriptionSerializer` fields.
+
+    Empty cells are dropped so optional fields fall back to their defaults.
+    """
+    content = csv_file.read()
+    if isinstance(content, bytes):
+        try:
+            content = content.decode("utf-8-sig")
+        except UnicodeDecodeError:
+            content = content.decode("latin-1")
+
+    try:
+        dialect = csv.Sniffer().sniff(content.split("\n", 1)[0], delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    return [
+        {key.strip(): value.strip() for key, value in row.items() if key and value and value.strip()}
+        for row in csv.DictReader(io.StringIO(content), dialect=dialect)
+    ]
+
+
+class SubscriptionBulkCreateService:
+    """Create many subscriptions of a user with a constant number of queries.
+
+    Referenced services are resolved from the in-process catalog (`apps.finance.catalog`),
+    every row is validated in a single pass, and valid batches are inserted with one
+    `bulk_create`. A batch with any invalid row creates nothing.
+    """
+
+    def __init__(self, user: User):
+        self.user = user
+
+    def create(self, rows: list[dict[str, Any]]) -> BulkCreateResult:
+        """Validate and insert `rows`.
+
+        Args:
+            rows: Subscription data, `service` given as an ID or exact name
+
+        Returns:
+            BulkCreateResult: Created subscriptions, or per-row errors if any row is invalid
+        """
+        result = BulkCreateResult()
+        subscriptions = []
+
+        for index, row in enumerate(rows):
+            serializer = UserSubscriptionSerializer(data=row)
+            if serializer.is_valid():
+                subscriptions.append(UserSubscription(user=self.user, **serializer.validated_data))
+            else:
+                result.errors.append({"row": index, "errors": serializer.errors})
+
+        if result.errors:
+            return result
+
+        with transaction.atomic():
+            result.created = UserSubscription.objects.bulk_create(subscriptions)
+            # bulk_create sends no post_save signals, so do what apps.finance.signals would
+            transaction.on_commit(lambda: refresh_projected_charges(result.created))
+            transaction.on_commit(lambda: invalidate_subscription_analytics(self.user.pk))
+
+        logger.info(f"Bulk created {len(result.created)} subscriptions for user {self.user.pk}")
+        return result
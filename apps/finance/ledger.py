@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import datetime
+import logging
+
+from collections.abc import Iterable
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Sum
+
+from apps.finance.enums import SubscriptionStatusChoices
+from apps.finance.models import ProjectedCharge, UserSubscription
+from apps.user.models import User
+
+
+logger = logging.getLogger(__name__)
+
+# Rolling window of projected charges, long enough to include the next annual charge
+PROJECTION_HORIZON_DAYS = 366
+REFRESH_BATCH_SIZE = 1000
+
+
+def get_horizon_end(today: datetime.date | None = None) -> datetime.date:
+    return (today or datetime.date.today()) + datetime.timedelta(days=PROJECTION_HORIZON_DAYS)
+
+
+def project_billing_dates(
+    subscription: UserSubscription,
+    start_date: datetime.date,
+    end_date: datetime.date,
+) -> list[datetime.date]:
+    """Billing dates of `subscription` in [start_date, end_date).
+
+    Dates follow `UserSubscription.refresh_next_billing_date`: the billing
+    interval is added to the previous billing date, starting from `next_billing_date`.
+    """
+    dates = []
+    interval = subscription.billing_interval
+    billing_date = subscription.next_billing_date
+
+    while billing_date < end_date:
+        if billing_date >= start_date:
+            dates.append(billing_date)
+        billing_date = billing_date + interval
+
+    return dates
+
+
+def build_projected_charges(
+    subscription: UserSubscription,
+    start_date: datetime.date,
+    end_date: datetime.date,
+) -> list[ProjectedCharge]:
+    if subscription.status != SubscriptionStatusChoices.ACTIVE:
+        return []
+
+    return [
+        ProjectedCharge(
+            subscription_id=subscription.pk,
+            user_id=subscription.user_id,
+            billing_date=billing_date,
+            amount=subscription.amount,
+            currency=subscription.currency,
+        )
+        for billing_date in project_billing_dates(subscription, start_date, end_date)
+    ]
+
+
+def refresh_projected_charges(
+    subscriptions: Iterable[UserSubscription],
+    today: datetime.date | None = None,
+) -> int:
+    """Replace the projected charges of `subscriptions` from `today` to the end of the horizon.
+
+    Inactive subscriptions lose their projected charges.
+
+    Returns:
+        int: Number of projected charges created
+    """
+    today = today or datetime.date.today()
+    horizon_end = get_horizon_end(today)
+    subscriptions = list(subscriptions)
+
+    charges = [
+        charge
+        for subscription in subscriptions
+        for charge in build_projected_charges(subscription, today, horizon_end)
+    ]
+
+    with transaction.atomic():
+        ProjectedCharge.objects.filter(subscription__in=[subscription.pk for subscription in subscriptions]).delete()
+        ProjectedCharge.objects.bulk_create(charges, batch_size=REFRESH_BATCH_SIZE)
+
+    return len(charges)
+
+
+def rebuild_projected_charges(today: datetime.date | None = None) -> int:
+    """Roll the ledger forward: drop past charges and re-project every active subscription.
+
+    Returns:
+        int: Number of projected charges created
+    """
+    today = today or datetime.date.today()
+    deleted, _ = ProjectedCharge.objects.filter(billing_date__lt=today).delete()
+
+    subscriptions = UserSubscription.objects.filter(status=SubscriptionStatusChoices.ACTIVE).only(
+        "id", "user_id", "amount", "currency", "billing_cycle", "next_billing_date", "status"
+    )
+
+    created = 0
+    batch: list[UserSubscription] = []
+    for subscription in subscriptions.iterator(chunk_size=REFRESH_BATCH_SIZE):
+        batch.append(subscription)
+        if len(batch) == REFRESH_BATCH_SIZE:
+            created += refresh_projected_charges(batch, today=today)
+            batch = []
+    if batch:
+        created += refresh_projected_charges(batch, today=today)
+
+    logger.info(f"Rebuilt projected charges: {created} created, {deleted} past charges removed")
+    return created
+
+
+def sum_projected_charges(
+    user: User,
+    start_date: datetime.date,
+    end_date: datetime.date,
+) -> dict[str, Decimal]:
+    """Projected spend of `user` in [start_date, end_date) per currency, as one indexed range sum.
+
+    Only dates inside the projection horizon (see `PROJECTION_HORIZON_DAYS`) are covered.
+    """
+    return dict(
+        ProjectedCharge.objects.filter(user=user, billing_date__gte=start_date, billing_date__lt=end_date)
+        .values("currency")
+        .annotate(total=Sum("amount"))
+        .order_by()
+        .values_list("currency", "total")
+    )
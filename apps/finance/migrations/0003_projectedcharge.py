@@ -0,0 +1,74 @@
+# Generated by Django 5.2.2 on 2026-10-19 10:57
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0002_usersubscription"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProjectedCharge",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ("last_updated", models.DateTimeField(auto_now=True)),
+                ("billing_date", models.DateField()),
+                ("amount", models.DecimalField(decimal_places=2, max_digits=12)),
+                (
+                    "currency",
+                    models.CharField(
+                        choices=[
+                            ("TRY", "Turkish Lira"),
+                            ("USD", "US Dollar"),
+                            ("EUR", "Euro"),
+                            ("GBP", "British Pound"),
+                            ("JPY", "Japanese Yen"),
+                            ("CNY", "Chinese Yuan"),
+                            ("RUB", "Russian Ruble"),
+                            ("AUD", "Australian Dollar"),
+                        ],
+                        max_length=3,
+                    ),
+                ),
+                (
+                    "subscription",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="projected_charges",
+                        to="finance.usersubscription",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="projected_charges",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Projected Charge",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "billing_date"],
+                        include=("currency", "amount"),
+                        name="projected_charge_user_date",
+                    ),
+                    models.Index(fields=["billing_date"], name="projected_charge_date"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(fields=("subscription", "billing_date"), name="unique_projected_charge")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0003_projectedcharge"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="usersubscription",
+            index=models.Index(
+                fields=["status", "auto_renewal", "next_billing_date"], name="subscription_renewal_window"
+            ),
+        ),
+    ]
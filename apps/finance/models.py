@@ -1,6 +1,6 @@
 from datetime import date, timedelta
 from dateutil.relativedelta import relativedelta
-from django.db import models
+from django.db import models, transaction
 
 from apps.finance.enums import BillingCycleChoices, SubscriptionStatusChoices
 from apps.user.models import User
@@ -8,6 +8,39 @@ from core.enums import CurrencyChoices, PaymentMethodChoices
 from core.models import BaseModel
 
 
+BILLING_CYCLE_INTERVALS = {
+    BillingCycleChoices.WEEKLY: timedelta(weeks=1),
+    BillingCycleChoices.MONTHLY: relativedelta(months=1),
+    BillingCycleChoices.QUARTERLY: relativedelta(months=3),
+    BillingCycleChoices.SEMI_ANNUALLY: relativedelta(months=6),
+    BillingCycleChoices.ANNUALLY: relativedelta(years=1),
+}
+
+
+class CatalogQuerySet(models.QuerySet):
+    """Bulk writes send no model signals, so they reload the service catalog themselves (see `apps.finance.catalog`)."""
+
+    def _invalidate_catalog(self) -> None:
+        from apps.finance.catalog import catalog
+
+        transaction.on_commit(catalog.invalidate, using=self.db)
+
+    def bulk_create(self, *args, **kwargs):
+        objs = super().bulk_create(*args, **kwargs)
+        self._invalidate_catalog()
+        return objs
+
+    def bulk_update(self, *args, **kwargs):
+        rows = super().bulk_update(*args, **kwargs)
+        self._invalidate_catalog()
+        return rows
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        self._invalidate_catalog()
+        return rows
+
+
 class SubscriptionServiceCategory(BaseModel):
     """
     Model representing a category for subscription services.
@@ -17,6 +50,8 @@ class SubscriptionServiceCategory(BaseModel):
     name = models.CharField(max_length=100, unique=True, verbose_name="Category Name")
     description = models.TextField(null=True, blank=True, verbose_name="Description")
 
+    objects = CatalogQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Subscription Service Category"
         verbose_name_plural = "Subscription Service Categories"
@@ -57,6 +92,8 @@ class SubscriptionService(BaseModel):
 
     is_active = models.BooleanField(default=False, verbose_name="Is Active")
 
+    objects = CatalogQuerySet.as_manager()
+
     def __str__(self):
         return self.name
 
@@ -105,6 +142,15 @@ class UserSubscription(BaseModel):
 
     class Meta:
         verbose_name = "User Subscription"
+        indexes = [
+            # Upcoming renewal scans: equality on status and auto_renewal, range on the billing date
+            models.Index(fields=["status", "auto_renewal", "next_billing_date"], name="subscription_renewal_window"),
+        ]
+
+    @property
+    def billing_interval(self) -> timedelta | relativedelta:
+        """Time between two charges, monthly when the billing cycle is not set."""
+        return BILLING_CYCLE_INTERVALS.get(self.billing_cycle, relativedelta(months=1))
 
     def refresh_next_billing_date(self):
         """Refreshes the next billing date based on the billing cycle.
@@ -113,15 +159,37 @@ class UserSubscription(BaseModel):
         if date.today() < self.next_billing_date:
             raise ValueError("Next billing date is already in the future.")
 
-        billing_cycle = {
-            BillingCycleChoices.WEEKLY: timedelta(weeks=1),
-            BillingCycleChoices.MONTHLY: relativedelta(months=1),
-            BillingCycleChoices.QUARTERLY: relativedelta(months=3),
-            BillingCycleChoices.SEMI_ANNUALLY: relativedelta(months=6),
-            BillingCycleChoices.ANNUALLY: relativedelta(years=1),
-        }
-        self.next_billing_date = self.next_billing_date + billing_cycle.get(
-            self.billing_cycle, relativedelta(months=1)
-        )
+        self.next_billing_date = self.next_billing_date + self.billing_interval
 
         self.save(update_fields=["next_billing_date", "last_updated"])
+
+
+class ProjectedCharge(BaseModel):
+    """An upcoming billing event of a user subscription.
+
+    Rows are derived data maintained by `apps.finance.ledger`: each active subscription
+    is expanded into its charges over a rolling horizon, so spend over any date
+    range is a single indexed range sum.
+    """
+
+    subscription = models.ForeignKey(UserSubscription, on_delete=models.CASCADE, related_name="projected_charges")
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="projected_charges")
+    billing_date = models.DateField()
+    amount = models.DecimalField(max_digits=12, decimal_places=2)
+    currency = models.CharField(max_length=3, choices=CurrencyChoices.choices)
+
+    class Meta:
+        verbose_name = "Projected Charge"
+        constraints = [
+            models.UniqueConstraint(fields=["subscription", "billing_date"], name="unique_projected_charge"),
+        ]
+        indexes = [
+            # Covers the per-user range sums without reading the table
+            models.Index(
+                fields=["user", "billing_date"], include=["currency", "amount"], name="projected_charge_user_date"
+            ),
+            models.Index(fields=["billing_date"], name="projected_charge_date"),
+        ]
+
+    def __str__(self):
+        return f"{self.subscription_id} {self.billing_date} {self.amount} {self.currency}"
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import datetime
+import logging
+
+from collections import defaultdict
+from dateutil.relativedelta import relativedelta
+
+from django.db import transaction
+from django.db.models import Case, DateField, QuerySet, Value, When
+from django.utils import timezone
+
+from apps.finance.enums import SubscriptionStatusChoices
+from apps.finance.models import BILLING_CYCLE_INTERVALS, UserSubscription
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bound of WHEN branches in a single UPDATE statement
+RENEWAL_BATCH_SIZE = 500
+
+
+def advance_billing_date(
+    billing_date: datetime.date,
+    interval: datetime.timedelta | relativedelta,
+    today: datetime.date,
+) -> datetime.date:
+    """First billing date on or after `today` reached by adding `interval` to `billing_date` repeatedly.
+
+    Month based intervals are chained one period at a time, as `refresh_next_billing_date`
+    does, so a clamped day of month (Jan 31 -> Feb 28) carries over to later periods.
+    """
+    if billing_date >= today:
+        return billing_date
+
+    if isinstance(interval, datetime.timedelta):
+        periods = -((billing_date - today) // interval)
+        return billing_date + periods * interval
+
+    while billing_date < today:
+        billing_date = billing_date + interval
+    return billing_date
+
+
+def upcoming_renewals(start: datetime.date, days: int) -> QuerySet[UserSubscription]:
+    """Active auto-renewing subscriptions billed within `days` days from `start`, inclusive.
+
+    A plain date range, so it works across month and year boundaries and is answered from
+    the (status, auto_renewal, next_billing_date) index in billing date order.
+    """
+    return UserSubscription.objects.filter(
+        status=SubscriptionStatusChoices.ACTIVE,
+        auto_renewal=True,
+        next_billing_date__range=(start, start + datetime.timedelta(days=days)),
+        is_active=True,
+    ).order_by("next_billing_date", "pk")
+
+
+def renew_overdue_subscriptions(today: datetime.date | None = None) -> int:
+    """Move the next billing date of every overdue active subscription to its first billing date on or after today.
+
+    Overdue subscriptions sharing a billing cycle and next billing date renew to the
+    same date, so new dates are computed once per distinct (cycle, date) pair and
+    written with one ``UPDATE ... SET next_billing_date = CASE ...`` per billing cycle
+    (split every `RENEWAL_BATCH_SIZE` dates). The cost depends on the number of distinct
+    overdue dates, not subscriptions.
+
+    Projected charges need no refresh: the ledger already projects overdue subscriptions
+    from today along the same chain of billing dates.
+
+    Args:
+        today: Reference date, today by default
+
+    Returns:
+        int: Number of subscriptions advanced
+    """
+    today = today or datetime.date.today()
+    overdue = UserSubscription.objects.filter(next_billing_date__lt=today, status=SubscriptionStatusChoices.ACTIVE)
+
+    dates_by_cycle: dict[str | None, list[datetime.date]] = defaultdict(list)
+    for billing_cycle, billing_date in overdue.values_list("billing_cycle", "next_billing_date").distinct().order_by():
+        dates_by_cycle[billing_cycle].append(billing_date)
+
+    advanced = 0
+    now = timezone.now()
+    with transaction.atomic():
+        for billing_cycle, billing_dates in dates_by_cycle.items():
+            interval = BILLING_CYCLE_INTERVALS.get(billing_cycle, relativedelta(months=1))
+
+            for start in range(0, len(billing_dates), RENEWAL_BATCH_SIZE):
+                batch = billing_dates[start : start + RENEWAL_BATCH_SIZE]
+                advanced += overdue.filter(billing_cycle=billing_cycle, next_billing_date__in=batch).update(
+                    next_billing_date=Case(
+                        *[
+                            When(
+                                next_billing_date=billing_date,
+                                then=Value(advance_billing_date(billing_date, interval, today)),
+                            )
+                            for billing_date in batch
+                        ],
+                        output_field=DateField(),
+                    ),
+                    last_updated=now,
+                )
+
+    logger.info(f"Renewed {advanced} overdue subscriptions across {len(dates_by_cycle)} billing cycles")
+    return advanced
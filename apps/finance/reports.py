@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import datetime
+import logging
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+
+from django.db.models import Count, QuerySet, Sum
+
+from apps.finance.enums import SubscriptionStatusChoices
+from apps.finance.models import UserSubscription
+from core.enums import CurrencyChoices
+from core.money import Money
+from core.services.exchange_rates import ExchangeRateProvider
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SubscriptionExpenseReport:
+    """Subscription expenses billed in [start_date, end_date), converted to `currency`."""
+
+    start_date: datetime.date
+    end_date: datetime.date
+    currency: str
+    total: Decimal = Decimal("0")
+    subscription_count: int = 0
+    # Sums in the subscriptions' own currencies
+    currency_totals: dict[str, Decimal] = field(default_factory=dict)
+    # Converted totals per user id
+    user_totals: dict[str, Decimal] = field(default_factory=dict)
+    rates: dict[str, Decimal] = field(default_factory=dict)
+
+    @property
+    def total_money(self) -> Money:
+        return Money(self.total, self.currency)
+
+
+def convert_currency_totals(
+    currency_totals: dict[str, Decimal],
+    currency: str = CurrencyChoices.TRY,
+    exchange_rate_provider: ExchangeRateProvider | None = None,
+) -> Decimal:
+    """Convert per-currency sums to `currency`, one rate per currency, each rounded to the target precision."""
+    # Sums keep the column's decimal places; only the converted results are rounded to the target currency
+    moneys = [Money.from_quantized(amount, code) for code, amount in currency_totals.items()]
+    converted = Money.convert_many(moneys, currency, rate_source=exchange_rate_provider or ExchangeRateProvider())
+    return Money.round_amount(Money.sum(converted, currency=currency).amount, currency)
+
+
+def build_subscription_expense_report(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    currency: str = CurrencyChoices.TRY,
+    exchange_rate_provider: ExchangeRateProvider | None = None,
+    queryset: QuerySet[UserSubscription] | None = None,
+) -> SubscriptionExpenseReport:
+    """Total the active subscriptions billed between `start_date` (inclusive) and `end_date` (exclusive).
+
+    Amounts are summed by the database grouped by user and currency, then every
+    currency is converted with a single rate. The global total converts each
+    currency sum once and rounds it to the target currency precision; user totals
+    are rounded per currency the same way, so cost depends on the number of
+    users and currencies, not subscriptions.
+
+    Args:
+        start_date: First billing date included
+        end_date: First billing date excluded
+        currency: Currency of the converted totals
+        exchange_rate_provider: Rate source, a new ExchangeRateProvider by default
+        queryset: Subscriptions to report on, all subscriptions by default
+
+    Returns:
+        SubscriptionExpenseReport: Global and per-user totals
+    """
+    if queryset is None:
+        queryset = UserSubscription.objects.all()
+
+    rows = (
+        queryset.filter(
+            next_billing_date__gte=start_date,
+            next_billing_date__lt=end_date,
+            status=SubscriptionStatusChoices.ACTIVE,
+        )
+        .values("user_id", "currency")
+        .annotate(amount=Sum("amount"), subscriptions=Count("id"))
+        .order_by()
+    )
+
+    report = SubscriptionExpenseReport(start_date=start_date, end_date=end_date, currency=currency)
+    user_currency_totals: dict[str, dict[str, Decimal]] = defaultdict(dict)
+
+    for row in rows:
+        report.currency_totals[row["currency"]] = (
+            report.currency_totals.get(row["currency"], Decimal("0")) + row["amount"]
+        )
+        report.subscription_count += row["subscriptions"]
+        user_currency_totals[row["user_id"]][row["currency"]] = row["amount"]
+
+    provider = exchange_rate_provider or ExchangeRateProvider()
+    report.rates = {code: provider.get_rate(code, currency) for code in report.currency_totals}
+
+    report.total = convert_currency_totals(report.currency_totals, currency, provider)
+    report.user_totals = {
+        user_id: convert_currency_totals(totals, currency, provider)
+        for user_id, totals in user_currency_totals.items()
+    }
+
+    logger.info(
+        f"Built expense report for {start_date} - {end_date}: {report.subscription_count} subscriptions, "
+        f"{len(report.currency_totals)} currencies, {len(report.user_totals)} users"
+    )
+    return report
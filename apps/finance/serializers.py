@@ -1,9 +1,35 @@
 from rest_framework import serializers
 
+from apps.finance.catalog import catalog
+from apps.finance.enums import AnalyticsBucketChoices, AnalyticsGroupByChoices
 from apps.finance.models import UserSubscription
 
 
+class CatalogServiceField(serializers.Field):
+    """`service` given as an ID or exact service name, resolved from the in-process catalog without queries."""
+
+    default_error_messages = {"does_not_exist": "Subscription service '{value}' does not exist."}
+
+    def to_internal_value(self, data):
+        value = str(data).strip()
+        service = catalog.get_service(int(value)) if value.isdigit() else None
+        if service is None:
+            service = catalog.get_service_by_name(value)
+        if service is None:
+            self.fail("does_not_exist", value=value)
+        return service
+
+    def get_attribute(self, instance):
+        # Represent the foreign key without loading the related service
+        return instance.service_id
+
+    def to_representation(self, value):
+        return value
+
+
 class UserSubscriptionSerializer(serializers.ModelSerializer):
+    service = CatalogServiceField()
+
     class Meta:
         model = UserSubscription
         fields = (
@@ -31,3 +57,24 @@ class UserSubscriptionSerializer(serializers.ModelSerializer):
         
         # Create the UserSubscription instance
         return super().create(validated_data)
+
+
+class SubscriptionAnalyticsQuerySerializer(serializers.Serializer):
+    group_by = serializers.ChoiceField(
+        choices=AnalyticsGroupByChoices.choices,
+        default=AnalyticsGroupByChoices.CATEGORY,
+    )
+    bucket = serializers.ChoiceField(choices=AnalyticsBucketChoices.choices, required=False, allow_null=True)
+
+
+class SubscriptionCSVImportSerializer(serializers.Serializer):
+    file = serializers.FileField(help_text="CSV file with a header row", allow_empty_file=False)
+
+    def validate_file(self, value):
+        if not value.name.lower().endswith(".csv"):
+            raise serializers.ValidationError("Invalid file format. Please upload a .csv file.")
+
+        if value.size > 1024 * 1024:  # 1MB limit
+            raise serializers.ValidationError("File too large. Maximum size is 1MB.")
+
+        return value
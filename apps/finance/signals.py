@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.finance.analytics import invalidate_subscription_analytics
+from apps.finance.catalog import catalog
+from apps.finance.ledger import refresh_projected_charges
+from apps.finance.models import SubscriptionService, SubscriptionServiceCategory, UserSubscription
+
+
+@receiver(post_save, sender=UserSubscription)
+def refresh_subscription_projected_charges(sender, instance: UserSubscription, **kwargs) -> None:
+    """Re-project the charges of a subscription once its change is committed."""
+    transaction.on_commit(lambda: refresh_projected_charges([instance]))
+
+
+@receiver(post_save, sender=UserSubscription)
+@receiver(post_delete, sender=UserSubscription)
+def invalidate_user_subscription_analytics(sender, instance: UserSubscription, **kwargs) -> None:
+    """Drop the cached analytics of the owner once the change (and its projected charges) is committed."""
+    transaction.on_commit(lambda: invalidate_subscription_analytics(instance.user_id))
+
+
+@receiver(post_save, sender=SubscriptionService)
+@receiver(post_delete, sender=SubscriptionService)
+@receiver(post_save, sender=SubscriptionServiceCategory)
+@receiver(post_delete, sender=SubscriptionServiceCategory)
+def invalidate_service_catalog(sender, instance, **kwargs) -> None:
+    """Make every process reload the service catalog once the change is committed."""
+    transaction.on_commit(catalog.invalidate)
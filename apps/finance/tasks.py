@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+from apps.finance.ledger import rebuild_projected_charges
+
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, name="task_rebuild_projected_charges")
+def task_rebuild_projected_charges(self) -> str:
+    """Daily: move the projected charges horizon forward and drop past charges."""
+    created = rebuild_projected_charges()
+    return f"Created {created} projected charges"
@@ -1,9 +1,22 @@
 from django.urls import path
 
-from apps.finance.views import UserSubscriptionCreateAPIView, ActiveSubscriptionListAPIView
+from apps.finance.views import (
+    ActiveSubscriptionListAPIView,
+    ServiceCatalogAPIView,
+    SubscriptionAnalyticsAPIView,
+    UserSubscriptionBulkCreateAPIView,
+    UserSubscriptionCreateAPIView,
+)
 
 
 urlpatterns = [
     path("subscriptions/create", UserSubscriptionCreateAPIView.as_view(), name="user-subscription-create-api"),
+    path(
+        "subscriptions/bulk-create",
+        UserSubscriptionBulkCreateAPIView.as_view(),
+        name="user-subscription-bulk-create-api",
+    ),
     path("my/subscriptions", ActiveSubscriptionListAPIView.as_view(), name="active-subscriptions-list-api"),
+    path("catalog", ServiceCatalogAPIView.as_view(), name="service-catalog-api"),
+    path("analytics", SubscriptionAnalyticsAPIView.as_view(), name="subscription-analytics-api"),
 ]
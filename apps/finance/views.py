@@ -1,7 +1,17 @@
+from rest_framework.parsers import JSONParser, MultiPartParser
+from rest_framework.response import Response
+
+from apps.finance.analytics import get_subscription_analytics
+from apps.finance.catalog import catalog
+from apps.finance.imports import MAX_BULK_ROWS, SubscriptionBulkCreateService, parse_subscription_csv
 from apps.finance.models import UserSubscription
-from apps.finance.serializers import UserSubscriptionSerializer
+from apps.finance.serializers import (
+    SubscriptionAnalyticsQuerySerializer,
+    SubscriptionCSVImportSerializer,
+    UserSubscriptionSerializer,
+)
 from core.permissions import IsOwner
-from core.views import BaseCreateAPIView, BaseListAPIView
+from core.views import BaseAPIView, BaseCreateAPIView, BaseListAPIView
 
 
 class UserSubscriptionCreateAPIView(BaseCreateAPIView):
@@ -10,7 +20,8 @@ class UserSubscriptionCreateAPIView(BaseCreateAPIView):
 
     def post(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        with self.track_serializer():
+            serializer.is_valid(raise_exception=True)
         serializer.save()
 
         return self.success_response(
@@ -19,6 +30,58 @@ class UserSubscriptionCreateAPIView(BaseCreateAPIView):
         )
 
 
+class UserSubscriptionBulkCreateAPIView(BaseAPIView):
+    """Create many subscriptions at once from a JSON list or an uploaded CSV file (`file`).
+
+    All rows are validated first; if any row is invalid nothing is created and the
+    errors are returned per row index.
+    """
+
+    permission_classes = [IsOwner]
+    serializer_class = SubscriptionCSVImportSerializer
+    parser_classes = [JSONParser, MultiPartParser]
+
+    def post(self, request, *args, **kwargs):
+        user = request.user
+        if user.is_anonymous:
+            return self.error_response(
+                status_code=403,
+                error_message="You must be logged in to create subscriptions.",
+            )
+
+        if isinstance(request.data, list):
+            rows = request.data
+        else:
+            serializer = self.get_serializer(data=request.data)
+            with self.track_serializer():
+                serializer.is_valid(raise_exception=True)
+            rows = parse_subscription_csv(serializer.validated_data["file"])
+
+        if not rows:
+            return self.error_response(status_code=400, error_message="No subscriptions provided.")
+        if len(rows) > MAX_BULK_ROWS:
+            return self.error_response(
+                status_code=400,
+                error_message=f"Too many subscriptions. Maximum is {MAX_BULK_ROWS} per request.",
+            )
+
+        with self.track_serializer():
+            result = SubscriptionBulkCreateService(user=user).create(rows)
+
+        if result.errors:
+            return self.error_response(
+                status_code=400,
+                error_message="No subscriptions were created, some rows are invalid.",
+                errors=result.errors,
+            )
+
+        return self.success_response(
+            data={"created": len(result.created), "ids": [subscription.pk for subscription in result.created]},
+            status_code=201,
+            message="User subscriptions created successfully",
+        )
+
+
 class ActiveSubscriptionListAPIView(BaseListAPIView):
     permission_classes = [IsOwner]
     serializer_class = UserSubscriptionSerializer
@@ -31,9 +94,60 @@ class ActiveSubscriptionListAPIView(BaseListAPIView):
                 error_message="You must be logged in to view your subscriptions.",
             )
 
-        data = self.get_serializer(
-            UserSubscription.objects.filter(user=user, status="active"),
-            many=True,
-        ).data
+        with self.track_serializer():
+            data = self.get_serializer(
+                UserSubscription.objects.filter(user=user, status="active"),
+                many=True,
+            ).data
+
+        return self.success_response(data=data, status_code=200)
+
+
+class SubscriptionAnalyticsAPIView(BaseAPIView):
+    """Normalized monthly subscription spend of the user, grouped by category, service or currency.
+
+    Query params: `group_by` (category, service, currency) and optional `bucket=month`
+    for projected charges per calendar month. Results are cached per user until one
+    of their subscriptions changes.
+    """
+
+    permission_classes = [IsOwner]
+    serializer_class = SubscriptionAnalyticsQuerySerializer
+
+    def get(self, request, *args, **kwargs):
+        user = request.user
+        if user.is_anonymous:
+            return self.error_response(
+                status_code=403,
+                error_message="You must be logged in to view your subscription analytics.",
+            )
+
+        serializer = self.get_serializer(data=request.query_params)
+        with self.track_serializer():
+            serializer.is_valid(raise_exception=True)
 
+        data = get_subscription_analytics(
+            user,
+            group_by=serializer.validated_data["group_by"],
+            bucket=serializer.validated_data.get("bucket"),
+        )
         return self.success_response(data=data, status_code=200)
+
+
+class ServiceCatalogAPIView(BaseAPIView):
+    """Read-only service catalog grouped by category, served from the in-process catalog.
+
+    Responses carry an ETag; a request with a matching If-None-Match gets 304 Not Modified.
+    """
+
+    def get(self, request, *args, **kwargs):
+        data, etag = catalog.as_payload()
+
+        if etag in request.headers.get("If-None-Match", ""):
+            response = Response(status=304)
+        else:
+            response = self.success_response(data=data, status_code=200)
+
+        response["ETag"] = etag
+        response["Cache-Control"] = "private, no-cache"
+        return response
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import datetime
+import html
+import logging
+
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from apps.contact.models import Contact
+from apps.finance.models import UserSubscription
+from apps.finance.renewals import upcoming_renewals
+from apps.reminder.enums import DeliveryStatusChoices, ReminderDigestChoices
+from apps.reminder.models import ReminderDelivery
+from apps.thirdparty.telegram.apis import TelegramReminderAPI, get_reminder_chat_id
+from apps.user.models import User
+
+
+logger = logging.getLogger(__name__)
+
+# Users handled by one `task_send_reminder_digests` call
+DIGEST_USER_BATCH_SIZE = 200
+
+
+def render_birthday_digest(contacts: list[Contact]) -> str:
+    message = "🎂 <b>Upcoming Birthdays:</b>\n\n"
+    for contact in contacts:
+        message += f"• {html.escape(contact.display_name)} - {contact.birthday.strftime('%d %B %Y')}\n"
+    return message
+
+
+def render_renewal_digest(subscriptions: list[UserSubscription]) -> str:
+    message = "🔔 <b>Subscription Auto Renewal Reminder:</b>\n\n"
+    for subscription in subscriptions:
+        message += f"• <b>Service:</b> {html.escape(subscription.service.name)}\n"
+        message += f"• <b>Plan:</b> {html.escape(subscription.plan_name or '-')}\n"
+        message += f"• <b>Next Billing Date:</b> {subscription.next_billing_date.strftime('%d %B %Y')}\n"
+        message += f"• <b>Amount:</b> {subscription.amount} {subscription.currency}\n"
+        message += f"• <b>Website:</b> {subscription.service.website_url}\n"
+        message += "\n"
+    return message
+
+
+@dataclass(frozen=True)
+class ReminderDigest:
+    """How one kind of digest finds its items and renders them."""
+
+    kind: str
+    days: int
+    # (start, days) -> queryset of every user's items in the window, with a `user_id` column
+    items: Callable[[datetime.date, int], QuerySet]
+    render: Callable[[list], str]
+
+
+DIGESTS: dict[str, ReminderDigest] = {
+    ReminderDigestChoices.BIRTHDAYS: ReminderDigest(
+        kind=ReminderDigestChoices.BIRTHDAYS,
+        days=30,
+        items=lambda start, days: Contact.objects.upcoming_birthdays(start, days),
+        render=render_birthday_digest,
+    ),
+    ReminderDigestChoices.RENEWALS: ReminderDigest(
+        kind=ReminderDigestChoices.RENEWALS,
+        days=7,
+        items=lambda start, days: upcoming_renewals(start, days).select_related("service"),
+        render=render_renewal_digest,
+    ),
+}
+
+
+def iter_user_batches(
+    kind: str, scheduled_for: datetime.date, batch_size: int = DIGEST_USER_BATCH_SIZE
+) -> Iterator[list[str]]:
+    """IDs of the users with something to report, streamed from the database in batches."""
+    digest = DIGESTS[kind]
+    user_ids = (
+        digest.items(scheduled_for, digest.days).order_by("user_id").values_list("user_id", flat=True).distinct()
+    )
+
+    batch = []
+    for user_id in user_ids.iterator(chunk_size=batch_size):
+        batch.append(user_id)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def send_reminder_digests(kind: str, user_ids: list[str], scheduled_for: datetime.date) -> dict[str, int]:
+    """Render and send one digest to each user of a batch, recording every delivery.
+
+    Items of the whole batch are loaded with one query. Users whose digest was already
+    sent for `scheduled_for` are skipped, so a retried batch does not send twice. A
+    failed delivery is recorded and does not stop the rest of the batch.
+
+    Returns:
+        dict: Number of deliveries per status
+    """
+    digest = DIGESTS[kind]
+
+    ReminderDelivery.objects.bulk_create(
+        [ReminderDelivery(user_id=user_id, kind=kind, scheduled_for=scheduled_for) for user_id in user_ids],
+        ignore_conflicts=True,
+    )
+    deliveries = {
+        delivery.user_id: delivery
+        for delivery in ReminderDelivery.objects.filter(
+            user_id__in=user_ids, kind=kind, scheduled_for=scheduled_for
+        ).exclude(status=DeliveryStatusChoices.SENT)
+    }
+    chat_ids = dict(User.objects.filter(pk__in=deliveries).values_list("pk", "telegram_chat_id"))
+
+    items_by_user = defaultdict(list)
+    for item in digest.items(scheduled_for, digest.days).filter(user_id__in=deliveries):
+        items_by_user[item.user_id].append(item)
+
+    client = TelegramReminderAPI()
+    counts = defaultdict(int)
+    for user_id, delivery in deliveries.items():
+        items = items_by_user.get(user_id, [])
+        chat_id = get_reminder_chat_id(chat_ids.get(user_id))
+        update = {"chat_id": chat_id or "", "item_count": len(items), "error": ""}
+
+        if not items or not chat_id:
+            update["status"] = DeliveryStatusChoices.SKIPPED
+        else:
+            try:
+                client.send_message(digest.render(items), chat_id=chat_id)
+            except Exception as err:
+                logger.error(f"Failed to send {kind} digest to user {user_id}: {err}")
+                update.update(status=DeliveryStatusChoices.FAILED, error=str(err))
+            else:
+                update.update(status=DeliveryStatusChoices.SENT, sent_at=timezone.now())
+
+        # Recorded right away so a worker crash mid-batch does not resend delivered digests
+        ReminderDelivery.objects.filter(pk=delivery.pk).update(**update, last_updated=timezone.now())
+        counts[update["status"]] += 1
+
+    logger.info(f"Sent {kind} digests for {scheduled_for} to {len(user_ids)} users: {dict(counts)}")
+    return dict(counts)
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import datetime
+import html
+import logging
+
+from collections import defaultdict
+
+from dateutil.relativedelta import relativedelta
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.finance.models import BILLING_CYCLE_INTERVALS
+from apps.finance.renewals import advance_billing_date
+from apps.reminder.enums import ReminderStatusChoices
+from apps.reminder.models import FinanceReminder
+from apps.thirdparty.telegram.apis import TelegramReminderAPI, get_reminder_chat_id
+
+
+logger = logging.getLogger(__name__)
+
+DISPATCH_BATCH_SIZE = 100
+# Reminders left in PROCESSING for longer than this belonged to a worker that died and are queued again
+PROCESSING_TIMEOUT = datetime.timedelta(minutes=15)
+
+WAITING_STATUSES = [ReminderStatusChoices.PENDING, ReminderStatusChoices.SNOOZED]
+
+
+def due_reminders(now: datetime.datetime) -> QuerySet[FinanceReminder]:
+    """Reminders waiting to be sent whose snooze or reminder date has passed, oldest first.
+
+    Matches the `finance_reminder_due_queue` partial index.
+    """
+    return (
+        FinanceReminder.objects.filter(is_notified=False, status__in=WAITING_STATUSES)
+        .alias(due_at=Coalesce("snoozed_until", "reminder_date"))
+        .filter(due_at__lte=now)
+        .order_by("due_at")
+    )
+
+
+def claim_due_reminders(now: datetime.datetime, batch_size: int = DISPATCH_BATCH_SIZE) -> list[int]:
+    """Lock a batch of due reminders and mark them PROCESSING with one UPDATE.
+
+    `SKIP LOCKED` makes concurrent workers claim disjoint batches instead of waiting on
+    each other; once the transaction commits the PROCESSING status keeps them out of
+    other workers' queues.
+    """
+    with transaction.atomic():
+        reminder_ids = list(
+            due_reminders(now)
+            .select_for_update(skip_locked=True, of=("self",))
+            .values_list("pk", flat=True)[:batch_size]
+        )
+        if reminder_ids:
+            FinanceReminder.objects.filter(pk__in=reminder_ids).update(
+                status=ReminderStatusChoices.PROCESSING, scheduled_at=now, last_updated=now
+            )
+    return reminder_ids
+
+
+def release_stale_reminders(now: datetime.datetime) -> int:
+    """Queue again the reminders claimed by a worker that never finished them."""
+    return FinanceReminder.objects.filter(
+        status=ReminderStatusChoices.PROCESSING, is_notified=False, scheduled_at__lt=now - PROCESSING_TIMEOUT
+    ).update(status=ReminderStatusChoices.PENDING, last_updated=now)
+
+
+def render_reminder(reminder: FinanceReminder) -> str:
+    message = f"⏰ <b>{html.escape(reminder.title)}</b>\n\n"
+    if reminder.description:
+        message += f"{html.escape(reminder.description)}\n\n"
+    if reminder.amount is not None:
+        message += f"• <b>Amount:</b> {reminder.amount} {reminder.currency}\n"
+    if reminder.due_date:
+        message += f"• <b>Due Date:</b> {reminder.due_date.strftime('%d %B %Y')}\n"
+    if reminder.subscription_id:
+        message += f"• <b>Service:</b> {html.escape(reminder.subscription.name)}\n"
+    return message
+
+
+def next_occurrence(reminder: FinanceReminder, now: datetime.datetime) -> datetime.datetime:
+    """First occurrence of a recurring reminder after `now`, skipping the ones missed while it was not dispatched."""
+    interval = BILLING_CYCLE_INTERVALS.get(reminder.recurrence, relativedelta(months=1))
+    occurrence = advance_billing_date(reminder.reminder_date, interval, now)
+    return occurrence if occurrence > now else occurrence + interval
+
+
+def dispatch_reminders(reminder_ids: list[int], now: datetime.datetime) -> dict[str, int]:
+    """Send claimed reminders and move them to their next state with a few set-based updates.
+
+    Sent one-off reminders are COMPLETED and notified, sent recurring reminders go back to
+    PENDING at their next occurrence with the snooze cleared, failed ones and the ones of
+    users without a Telegram chat become FAILED.
+
+    Returns:
+        dict: Number of reminders per outcome
+    """
+    reminders = FinanceReminder.objects.filter(pk__in=reminder_ids).select_related("user", "subscription")
+
+    client = TelegramReminderAPI()
+    sent, recurring, failed = [], [], []
+    for reminder in reminders:
+        chat_id = get_reminder_chat_id(reminder.user.telegram_chat_id)
+        if chat_id is None:
+            logger.warning(f"Reminder {reminder.pk} not sent, user {reminder.user_id} has no Telegram chat")
+            failed.append(reminder.pk)
+            continue
+
+        try:
+            client.send_message(render_reminder(reminder), chat_id=chat_id)
+        except Exception as err:
+            logger.error(f"Failed to send reminder {reminder.pk}: {err}")
+            failed.append(reminder.pk)
+            continue
+
+        if reminder.is_recurring:
+            reminder.reminder_date = next_occurrence(reminder, now)
+            recurring.append(reminder)
+        else:
+            sent.append(reminder.pk)
+
+    with transaction.atomic():
+        FinanceReminder.objects.filter(pk__in=sent).update(
+            status=ReminderStatusChoices.COMPLETED, is_notified=True, last_updated=now
+        )
+        FinanceReminder.objects.filter(pk__in=failed).update(status=ReminderStatusChoices.FAILED, last_updated=now)
+
+        # Next occurrences differ per reminder: one UPDATE ... CASE for the dates, one for the shared fields
+        FinanceReminder.objects.bulk_update(recurring, ["reminder_date"], batch_size=DISPATCH_BATCH_SIZE)
+        FinanceReminder.objects.filter(pk__in=[reminder.pk for reminder in recurring]).update(
+            status=ReminderStatusChoices.PENDING,
+            is_notified=False,
+            snoozed_until=None,
+            snooze_count=0,
+            last_updated=now,
+        )
+
+    counts = {"completed": len(sent), "recurring": len(recurring), "failed": len(failed)}
+    return {outcome: count for outcome, count in counts.items() if count}
+
+
+def dispatch_due_reminders(
+    now: datetime.datetime | None = None, batch_size: int = DISPATCH_BATCH_SIZE, max_batches: int = 50
+) -> dict[str, int]:
+    """Claim and send due reminders batch by batch until the queue is empty or `max_batches` is reached.
+
+    Safe to run on several workers at once, each claims its own batches.
+    """
+    now = now or timezone.now()
+    released = release_stale_reminders(now)
+    if released:
+        logger.warning(f"Released {released} reminders stuck in processing")
+
+    totals = defaultdict(int)
+    for _ in range(max_batches):
+        reminder_ids = claim_due_reminders(now, batch_size)
+        if not reminder_ids:
+            break
+        for outcome, count in dispatch_reminders(reminder_ids, now).items():
+            totals[outcome] += count
+
+    logger.info(f"Dispatched due reminders: {dict(totals)}")
+    return dict(totals)
@@ -29,3 +29,17 @@ class ReminderStatusChoices(models.TextChoices):
     FAILED = "failed", "Failed"
     EXPIRED = "expired", "Expired"
     SNOOZED = "snoozed", "Snoozed"
+
+
+class ReminderDigestChoices(models.TextChoices):
+    """Kinds of per-user reminder digests sent by the scheduled reminder jobs"""
+
+    BIRTHDAYS = "birthdays", "Upcoming Birthdays"
+    RENEWALS = "renewals", "Subscription Renewals"
+
+
+class DeliveryStatusChoices(models.TextChoices):
+    PENDING = "pending", "Pending"
+    SENT = "sent", "Sent"
+    SKIPPED = "skipped", "Skipped"
+    FAILED = "failed", "Failed"
@@ -0,0 +1,42 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:16
+
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0004_usersubscription_renewal_window_index"),
+        ("reminder", "0002_reminderdelivery"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="financereminder",
+            name="recurrence",
+            field=models.CharField(
+                blank=True,
+                choices=[
+                    ("weekly", "Weekly"),
+                    ("monthly", "Monthly"),
+                    ("quarterly", "Quarterly"),
+                    ("semi_annually", "Semi-Annually"),
+                    ("annually", "Annually"),
+                ],
+                max_length=20,
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="financereminder",
+            index=models.Index(
+                models.F("status"),
+                django.db.models.functions.comparison.Coalesce("snoozed_until", "reminder_date"),
+                condition=models.Q(("is_notified", False)),
+                name="finance_reminder_due_queue",
+            ),
+        ),
+    ]
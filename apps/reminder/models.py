@@ -1,7 +1,15 @@
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Coalesce
 
+from apps.finance.enums import BillingCycleChoices
 from apps.finance.models import SubscriptionService
-from apps.reminder.enums import ReminderStatusChoices, ExpenseCategoryChoices
+from apps.reminder.enums import (
+    DeliveryStatusChoices,
+    ExpenseCategoryChoices,
+    ReminderDigestChoices,
+    ReminderStatusChoices,
+)
 from core.models import BaseModel
 from core.enums import CurrencyChoices, PaymentMethodChoices
 
@@ -24,6 +32,8 @@ class BaseReminder(BaseModel):
 
     is_notified = models.BooleanField(default=False, verbose_name="Is Notified")
     is_recurring = models.BooleanField(default=False, verbose_name="Is Recurring")
+    # Interval between occurrences of a recurring reminder, monthly when not set
+    recurrence = models.CharField(max_length=20, choices=BillingCycleChoices.choices, null=True, blank=True)
 
     snoozed_until = models.DateTimeField(null=True, blank=True)
     snooze_count = models.PositiveIntegerField(default=0)
@@ -43,7 +53,9 @@ class BaseReminder(BaseModel):
         self.snoozed_until = snooze_until
         self.snooze_count += 1
         self.status = ReminderStatusChoices.SNOOZED
-        self.save(update_fields=["snoozed_until", "snooze_count", "status", "last_updated"])
+        # Due again at snoozed_until, see apps.reminder.dispatcher
+        self.is_notified = False
+        self.save(update_fields=["snoozed_until", "snooze_count", "status", "is_notified", "last_updated"])
 
     def mark_as_processing(self):
         self.status = ReminderStatusChoices.PROCESSING
@@ -100,3 +112,41 @@ class FinanceReminder(BaseReminder):
     class Meta:
         verbose_name = "Finance Reminder"
         verbose_name_plural = "Finance Reminders"
+        indexes = [
+            # Queue of the dispatcher: reminders waiting to be sent, by the time they are due
+            models.Index(
+                F("status"),
+                Coalesce("snoozed_until", "reminder_date"),
+                condition=Q(is_notified=False),
+                name="finance_reminder_due_queue",
+            ),
+        ]
+
+
+class ReminderDelivery(BaseModel):
+    """Delivery of one reminder digest to one user for one scheduled date.
+
+    Written by `apps.reminder.digests`; a digest already sent for the same
+    (user, kind, scheduled_for) is never sent again, so retried batches are safe.
+    """
+
+    user = models.ForeignKey("user.User", on_delete=models.CASCADE, related_name="reminder_deliveries")
+    kind = models.CharField(max_length=20, choices=ReminderDigestChoices.choices)
+    scheduled_for = models.DateField()
+    status = models.CharField(
+        max_length=20, choices=DeliveryStatusChoices.choices, default=DeliveryStatusChoices.PENDING
+    )
+    chat_id = models.CharField(max_length=32, blank=True, default="")
+    item_count = models.PositiveIntegerField(default=0)
+    sent_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        verbose_name = "Reminder Delivery"
+        verbose_name_plural = "Reminder Deliveries"
+        constraints = [
+            models.UniqueConstraint(fields=["user", "kind", "scheduled_for"], name="unique_reminder_delivery"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} {self.scheduled_for} {self.user_id} {self.status}"
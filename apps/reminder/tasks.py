@@ -1,90 +1,72 @@
-from datetime import date, timedelta
-from decimal import Decimal
-from django.db import models
+import logging
 
-from apps.contact.models import Contact
-from apps.finance.enums import SubscriptionStatusChoices
-from apps.finance.models import UserSubscription
+from datetime import date
+
+from celery import shared_task
+
+from apps.finance.renewals import renew_overdue_subscriptions
+from apps.finance.reports import build_subscription_expense_report
+from apps.reminder.digests import iter_user_batches, send_reminder_digests
+from apps.reminder.dispatcher import dispatch_due_reminders
+from apps.reminder.enums import ReminderDigestChoices
 from apps.thirdparty.telegram.apis import TelegramReminderAPI
 from core.enums import CurrencyChoices
-from core.money import Money
-from core.services.exchange_rate_api import ExchangeRateAPI
+
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, name="task_schedule_reminder_digests")
+def task_schedule_reminder_digests(self, kind: str, scheduled_for: str | None = None) -> int:
+    """Fan a reminder digest out to Celery, one `task_send_reminder_digests` per batch of users.
+
+    Only user IDs are read here; each batch task loads its own users' items.
+    Returns the number of batches queued.
+    """
+    scheduled_for = date.fromisoformat(scheduled_for) if scheduled_for else date.today()
+
+    batches = 0
+    for user_ids in iter_user_batches(kind, scheduled_for):
+        task_send_reminder_digests.delay(kind, user_ids, scheduled_for.isoformat())  # type: ignore
+        batches += 1
+
+    logger.info(f"Queued {batches} {kind} digest batches for {scheduled_for}")
+    return batches
+
+
+@shared_task(bind=True, name="task_send_reminder_digests")
+def task_send_reminder_digests(self, kind: str, user_ids: list[str], scheduled_for: str) -> dict[str, int]:
+    """Send one digest to each user of a batch, see `apps.reminder.digests.send_reminder_digests`."""
+    return send_reminder_digests(kind, user_ids, date.fromisoformat(scheduled_for))
+
+
+@shared_task(bind=True, name="task_dispatch_due_reminders")
+def task_dispatch_due_reminders(self) -> dict[str, int]:
+    """Every minute: send the finance reminders that are due. Several workers may run it concurrently."""
+    return dispatch_due_reminders()
 
 
 def generate_birthday_reminders_in_30_days():
-    """Generates reminders for contacts with upcoming birthdays in the next 30 days
-    and sends them via Telegram."""
-    today = date.today()
-    end_date = today + timedelta(days=30)
-
-    if today.year == end_date.year:
-        contacts = Contact.objects.filter(
-            models.Q(is_active=True, birthday__isnull=False)
-            & (
-                models.Q(birthday__month__gt=today.month)
-                | models.Q(birthday__month=today.month, birthday__day__gte=today.day)
-            )
-            & (
-                models.Q(birthday__month__lt=end_date.month)
-                | models.Q(birthday__month=end_date.month, birthday__day__lte=end_date.day)
-            )
-        ).order_by("-birthday")
-
-        for contact in contacts:
-            message = "🎂 <b>Upcoming Birthdays:</b>\n\n"
-            message += f"• {contact.display_name} - {contact.birthday.strftime("%d %B %Y")}\n"
-        TelegramReminderAPI().send_message(message)
+    """Sends each user a digest of their contacts with birthdays in the next 30 days via Telegram."""
+    task_schedule_reminder_digests.delay(ReminderDigestChoices.BIRTHDAYS)  # type: ignore
 
     return True
 
 
 def generate_auto_renewal_subscription_reminders():
-    """Generates reminders for user subscriptions that are set to auto-renew
-    within the next 7 days and sends them via Telegram."""
-    today = date.today()
-    end_date = today + timedelta(days=7)
-
-    user_subscriptions = UserSubscription.objects.filter(
-        models.Q(is_active=True, auto_renewal=True, next_billing_date__isnull=False)
-        & (
-            models.Q(next_billing_date__month__gt=today.month)
-            | models.Q(next_billing_date__month=today.month, next_billing_date__day__gte=today.day)
-        )
-        & (
-            models.Q(next_billing_date__month__lt=end_date.month)
-            | models.Q(next_billing_date__month=end_date.month, next_billing_date__day__lte=end_date.day)
-        ),
-        status=SubscriptionStatusChoices.ACTIVE,
-    ).select_related("user", "service")
-
-    message = "🔔 <b>Subscription Auto Renewal Reminder:</b>\n\n"
-    for subscription in user_subscriptions:
-        if subscription.user:
-            message += f"• <b>Service:</b> {subscription.service.name}\n"
-            message += f"• <b>Plan:</b> {subscription.plan_name}\n"
-            message += f"• <b>Next Billing Date:</b> {subscription.next_billing_date.strftime('%d %B %Y')}\n"
-            message += f"• <b>Amount:</b> {subscription.amount} {subscription.currency}\n"
-            message += f"• <b>Website:</b> {subscription.service.website_url}\n"
-            message += "\n"
-
-    TelegramReminderAPI().send_message(message)
+    """Sends each user a digest of their subscriptions set to auto-renew
+    within the next 7 days via Telegram."""
+    task_schedule_reminder_digests.delay(ReminderDigestChoices.RENEWALS)  # type: ignore
 
     return True
 
 
 def refresh_next_billing_dates():
-    """Refreshes the next billing dates for all active user subscriptions
-    that have a next billing date in the past based on their billing cycle.
+    """Advances the next billing dates of all active user subscriptions
+    that have a next billing date in the past, by as many billing cycles as
+    needed to reach today. Returns the number of subscriptions advanced.
     """
-    today = date.today()
-    user_subscriptions = UserSubscription.objects.filter(
-        next_billing_date__lt=today, status=SubscriptionStatusChoices.ACTIVE
-    )
-
-    for subscription in user_subscriptions:
-        subscription.refresh_next_billing_date()
-
-    return True
+    return renew_overdue_subscriptions()
 
 
 def monthly_subscription_expense_report():
@@ -95,31 +77,10 @@ def monthly_subscription_expense_report():
     start_date = today.replace(day=1)
     end_date = (start_date + relativedelta(months=1)).replace(day=1)
 
-    user_subscriptions = UserSubscription.objects.filter(
-        next_billing_date__gte=start_date,
-        next_billing_date__lt=end_date,
-        status=SubscriptionStatusChoices.ACTIVE,
-    )
-
-    total_amount = Decimal("0.00")
-    for user_subscription in user_subscriptions:
-        conversion_rate = Decimal("1.00")
-
-        if user_subscription.currency != CurrencyChoices.TRY:
-            conversion_rate = ExchangeRateAPI().get_exchange_rate(
-                base_currency=user_subscription.currency,
-                target_currency=CurrencyChoices.TRY,
-            )
-
-        moneyed_conversition_rate = Money(
-            amount=str(conversion_rate),
-            currency=CurrencyChoices.TRY,
-        ).amount
-
-        total_amount += (user_subscription.amount * moneyed_conversition_rate).quantize(Decimal("0.01"))
+    report = build_subscription_expense_report(start_date, end_date, currency=CurrencyChoices.TRY)
 
     message = "💰 <b>This Month's Subscription Amount:</b>\n\n"
-    message += f"• <b>Total Amount:</b> {total_amount} 'TRY'\n"
+    message += f"• <b>Total Amount:</b> {report.total} 'TRY'\n"
     message += "\n"
     TelegramReminderAPI().send_message(message)
 
@@ -138,24 +99,8 @@ def next_month_subscription_expense_report():
         start_date = date(year=today.year, month=today.month + 1, day=1)
         end_date = date(year=today.year, month=today.month + 2, day=1)
 
-    user_subscriptions = UserSubscription.objects.filter(
-        next_billing_date__gte=start_date,
-        next_billing_date__lt=end_date,
-        status=SubscriptionStatusChoices.ACTIVE,
-    )
-
-    total_amount = Decimal("0.00")
-    for user_subscription in user_subscriptions:
-
-        if user_subscription.currency != CurrencyChoices.TRY:
-            conversion_rate = ExchangeRateAPI().get_exchange_rate(
-                base_currency=user_subscription.currency,
-                target_currency=CurrencyChoices.TRY,
-            )
-        else:
-            conversion_rate = Decimal("1.00")
-
-        total_amount += user_subscription.amount * conversion_rate
+    report = build_subscription_expense_report(start_date, end_date, currency=CurrencyChoices.TRY)
+    total_amount = report.total
 
     message += f"• <b>Next Month's Total Amount:</b> {total_amount} 'TRY'\n"
     message += "\n"
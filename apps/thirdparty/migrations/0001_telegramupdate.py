@@ -0,0 +1,46 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = []
+
+    operations = [
+        migrations.CreateModel(
+            name="TelegramUpdate",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("is_active", models.BooleanField(default=True)),
+                ("created_at", models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ("last_updated", models.DateTimeField(auto_now=True)),
+                ("update_id", models.BigIntegerField(unique=True)),
+                ("chat_id", models.BigIntegerField(blank=True, null=True)),
+                ("payload", models.JSONField()),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("received", "Received"), ("processed", "Processed"), ("failed", "Failed")],
+                        default="received",
+                        max_length=20,
+                    ),
+                ),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "verbose_name": "Telegram Update",
+                "indexes": [
+                    models.Index(
+                        condition=models.Q(("status", "received")),
+                        fields=["chat_id", "update_id"],
+                        name="telegram_update_pending",
+                    )
+                ],
+            },
+        ),
+    ]
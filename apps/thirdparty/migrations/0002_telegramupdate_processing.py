@@ -0,0 +1,27 @@
+# Generated by Django 5.2.2 on 2026-10-19 12:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("thirdparty", "0001_telegramupdate"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="telegramupdate",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("received", "Received"),
+                    ("processing", "Processing"),
+                    ("processed", "Processed"),
+                    ("failed", "Failed"),
+                ],
+                default="received",
+                max_length=20,
+            ),
+        ),
+    ]
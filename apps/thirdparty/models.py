@@ -0,0 +1 @@
+from apps.thirdparty.telegram.models import TelegramUpdate  # noqa: F401
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import re
+import unicodedata
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.finance.analytics import get_analytics_version
+from apps.thirdparty.ollama.client import OllamaClient, OllamaError, get_ollama_client
+from apps.thirdparty.ollama.enums import InferenceLaneChoices
+from apps.thirdparty.ollama.gateway import inference_gateway
+
+
+logger = logging.getLogger(__name__)
+
+ANSWER_KEY = "ollama_answer:{user_id}:{version}:{context}:{question}"
+INDEX_KEY = "ollama_answer_index:{user_id}:{version}:{context}"
+# Embeddings kept per user and financial context, the most recent first
+INDEX_SIZE = 50
+
+PUNCTUATION_RE = re.compile(r"[^\w\s]")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_question(text: str) -> str:
+    """Fold the differences that do not change a question: case, punctuation and spacing.
+
+    "İ", "I" and "ı" all fold to "i" like `intents.fold_text` does, so Turkish and English
+    capitals compare equal to their lower case; `str.lower` alone would turn "İ" into "i"
+    plus a combining dot.
+    """
+    text = unicodedata.normalize("NFC", text).replace("İ", "i").replace("I", "i").replace("ı", "i").lower()
+    return WHITESPACE_RE.sub(" ", PUNCTUATION_RE.sub(" ", text)).strip()
+
+
+def hash_context(user_context: dict[str, Any]) -> str:
+    data = json.dumps(user_context, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:32]
+
+
+def cosine_similarity(a: list[float], b: list[float]) -> float:
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return sum(x * y for x, y in zip(a, b)) / norm if norm else 0.0
+
+
+class AnswerCache:
+    """Cached AI answer to one user's question about their finances.
+
+    Answers are keyed by the user's subscription version (see `apps.finance.analytics`),
+    a hash of the financial context the prompt is built from and the normalized question,
+    so they are dropped as soon as a subscription changes or the figures move.
+
+    With `OLLAMA_EMBEDDING_MODEL` set, a question without an exact match is also compared
+    with the embeddings of the questions answered for the same context, and the closest
+    answer above `OLLAMA_ANSWER_SIMILARITY_THRESHOLD` is reused.
+    """
+
+    def __init__(self, user_id: Any, user_context: dict[str, Any], question: str, client: OllamaClient | None = None):
+        self.question = question
+        self.client = client
+        self.embedding_model = settings.OLLAMA_EMBEDDING_MODEL
+        version = get_analytics_version(user_id)
+        context = hash_context(user_context)
+        question_hash = hashlib.sha256(normalize_question(question).encode("utf-8")).hexdigest()[:32]
+        self.key = ANSWER_KEY.format(user_id=user_id, version=version, context=context, question=question_hash)
+        self.index_key = INDEX_KEY.format(user_id=user_id, version=version, context=context)
+        self._embedding: list[float] | None = None
+
+    def get(self, semantic: bool = True) -> str | None:
+        """Cached answer to the question, or with `semantic` to the most similar question."""
+        answer = cache.get(self.key)
+        if answer is None and semantic and self.embedding_model:
+            answer = self._get_similar()
+        return answer
+
+    def set(self, answer: str) -> None:
+        cache.set(self.key, answer, settings.OLLAMA_ANSWER_CACHE_TIMEOUT)
+        if self.embedding_model and (embedding := self.embedding) is not None:
+            index = [entry for entry in cache.get(self.index_key, []) if entry["key"] != self.key]
+            index.insert(0, {"key": self.key, "embedding": embedding})
+            cache.set(self.index_key, index[:INDEX_SIZE], settings.OLLAMA_ANSWER_CACHE_TIMEOUT)
+
+    def record(self, pieces: Iterable[str]) -> Iterator[str]:
+        """Pass the pieces of an answer through and cache the whole answer once it is complete."""
+        answer = ""
+        for piece in pieces:
+            answer += piece
+            yield piece
+        if answer.strip():
+            self.set(answer)
+
+    @property
+    def embedding(self) -> list[float] | None:
+        if self._embedding is None:
+            try:
+                client = self.client or get_ollama_client()
+                # Counts against the inference concurrency like the answers; a busy gateway skips the lookup
+                with inference_gateway.slot(InferenceLaneChoices.INTERACTIVE):
+                    self._embedding = client.embed(self.question.strip(), self.embedding_model)
+            except OllamaError as err:
+                logger.warning(f"Could not embed question, semantic cache skipped: {err}")
+        return self._embedding
+
+    def _get_similar(self) -> str | None:
+        index = cache.get(self.index_key)
+        if not index or (embedding := self.embedding) is None:
+            return None
+
+        similarity, key = max((cosine_similarity(embedding, entry["embedding"]), entry["key"]) for entry in index)
+        if similarity < settings.OLLAMA_ANSWER_SIMILARITY_THRESHOLD:
+            return None
+        logger.info(f"Semantic answer cache hit (similarity {similarity:.3f})")
+        return cache.get(key)
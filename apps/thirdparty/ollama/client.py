@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaError(ValueError):
+    """A completion that failed on every model it was tried with, or broke off mid-stream."""
+
+    def __init__(self, message: str, status_code: int | None = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass
+class GenerationMetrics:
+    """Timings of one completion. Durations are in seconds."""
+
+    model: str
+    time_to_first_token: float | None
+    total_time: float
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    # Ollama's own measure of the generation, without queueing and model loading
+    eval_duration: float = 0.0
+
+    @property
+    def tokens_per_second(self) -> float:
+        duration = self.eval_duration or self.total_time - (self.time_to_first_token or 0)
+        return round(self.completion_tokens / duration, 2) if duration > 0 else 0.0
+
+    def to_log_fields(self) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "ttft_ms": round(self.time_to_first_token * 1000, 2) if self.time_to_first_token is not None else None,
+            "total_ms": round(self.total_time * 1000, 2),
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "tokens_per_second": self.tokens_per_second,
+        }
+
+
+@dataclass
+class Completion:
+    content: str
+    metrics: GenerationMetrics
+
+
+class CompletionStream:
+    """Iterator over the text pieces of a streamed completion.
+
+    Models are tried in order: a model that fails before producing any text (connection
+    error, timeout, HTTP error, error line in the stream) hands over to the next one. Once
+    text was produced a failure raises `OllamaError`, as the caller may already have shown it.
+
+    After the iteration `model`, `content` and `metrics` describe the completion.
+    """
+
+    def __init__(
+        self,
+        client: OllamaClient,
+        path: str,
+        payload: dict[str, Any],
+        models: list[str],
+        extract: Callable[[dict[str, Any]], str],
+    ):
+        self.client = client
+        self.path = path
+        self.payload = payload
+        self.models = models
+        self.extract = extract
+        self.model: str | None = None
+        self.content = ""
+        self.metrics: GenerationMetrics | None = None
+
+    def __iter__(self) -> Iterator[str]:
+        errors = []
+        for model in self.models:
+            try:
+                yield from self._stream(model)
+                return
+            except (requests.RequestException, ValueError) as err:
+                if self.content:
+                    raise OllamaError(f"{model} failed mid-stream: {err}") from err
+                logger.warning(f"Ollama model {model} failed: {err}")
+                errors.append(f"{model}: {err}")
+
+        raise OllamaError(f"Ollama completion failed ({'; '.join(errors)})")
+
+    def _stream(self, model: str) -> Iterator[str]:
+        started = time.perf_counter()
+        first_token_at = None
+        with self.client.session.post(
+            f"{self.client.base_url}{self.path}",
+            json={**self.payload, "model": model, "stream": True},
+            stream=True,
+            timeout=(self.client.CONNECT_TIMEOUT, self.client.timeout),
+        ) as response:
+            if not response.ok:
+                raise OllamaError(f"HTTP {response.status_code}: {response.text[:200]}", response.status_code)
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                chunk = json.loads(line)
+                if "error" in chunk:
+                    raise OllamaError(chunk["error"])
+
+                if token := self.extract(chunk):
+                    if first_token_at is None:
+                        first_token_at = time.perf_counter()
+                    self.content += token
+                    yield token
+
+                if chunk.get("done"):
+                    self.model = model
+                    self.metrics = GenerationMetrics(
+                        model=model,
+                        time_to_first_token=first_token_at - started if first_token_at is not None else None,
+                        total_time=time.perf_counter() - started,
+                        prompt_tokens=chunk.get("prompt_eval_count", 0),
+                        completion_tokens=chunk.get("eval_count", 0),
+                        eval_duration=chunk.get("eval_duration", 0) / 1e9,
+                    )
+                    logger.info(f"Ollama completion: {self.metrics.to_log_fields()}")
+                    return
+
+        raise OllamaError("Stream ended before the completion was done")
+
+    def collect(self) -> Completion:
+        """Consume the stream and return the whole completion."""
+        for _ in self:
+            pass
+        return Completion(content=self.content, metrics=self.metrics)
+
+
+class OllamaClient:
+    """Ollama chat and generate client sharing one pooled HTTP session across threads.
+
+    Completions are streamed (NDJSON, one JSON object per line) so callers can show text as
+    it is generated. `MAX_TOKENS` and `TEMPERATURE` of `OLLAMA_CONFIG` are sent as the
+    `num_predict` and `temperature` options of every request, with `KEEP_ALIVE` so the model
+    and its evaluated prompt prefix stay loaded between questions. Without an explicit model
+    `DEFAULT_MODEL` is used, falling back to `FALLBACK_MODEL` when it fails or times out.
+    """
+
+    CONNECT_TIMEOUT = 5
+    POOL_SIZE = 8
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        default_model: str | None = None,
+        fallback_model: str | None = None,
+        timeout: float | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+        keep_alive: str | None = None,
+    ):
+        config = settings.OLLAMA_CONFIG
+        self.base_url = (base_url or config["BASE_URL"]).rstrip("/")
+        self.default_model = default_model or config["DEFAULT_MODEL"]
+        self.fallback_model = fallback_model or config["FALLBACK_MODEL"]
+        self.timeout = timeout or config["TIMEOUT"]
+        self.max_tokens = max_tokens or config["MAX_TOKENS"]
+        self.temperature = temperature if temperature is not None else config["TEMPERATURE"]
+        self.keep_alive = keep_alive or config["KEEP_ALIVE"]
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    @property
+    def options(self) -> dict[str, Any]:
+        return {"num_predict": self.max_tokens, "temperature": self.temperature}
+
+    def _models(self, model: str | None) -> list[str]:
+        if model:
+            return [model]
+        return list(dict.fromkeys([self.default_model, self.fallback_model]))
+
+    def stream_chat(self, messages: list[dict[str, str]], model: str | None = None) -> CompletionStream:
+        """Stream the assistant's reply to `messages` ({"role", "content"} dicts) from /api/chat."""
+        return CompletionStream(
+            self,
+            "/api/chat",
+            {"messages": messages, "options": self.options, "keep_alive": self.keep_alive},
+            self._models(model),
+            extract=lambda chunk: (chunk.get("message") or {}).get("content", ""),
+        )
+
+    def stream_generate(self, prompt: str, system: str | None = None, model: str | None = None) -> CompletionStream:
+        """Stream the completion of a single prompt from /api/generate."""
+        payload = {"prompt": prompt, "options": self.options, "keep_alive": self.keep_alive}
+        if system:
+            payload["system"] = system
+        return CompletionStream(
+            self, "/api/generate", payload, self._models(model), extract=lambda chunk: chunk.get("response", "")
+        )
+
+    def embed(self, text: str, model: str) -> list[float]:
+        """Embedding vector of `text` from /api/embeddings. Embedding models have no fallback."""
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/embeddings",
+                json={"model": model, "prompt": text},
+                timeout=(self.CONNECT_TIMEOUT, self.timeout),
+            )
+        except requests.RequestException as err:
+            raise OllamaError(f"Embedding request failed: {err}") from err
+        if not response.ok:
+            raise OllamaError(f"HTTP {response.status_code}: {response.text[:200]}", response.status_code)
+        try:
+            return response.json()["embedding"]
+        except (ValueError, KeyError, TypeError) as err:
+            raise OllamaError(f"Unexpected embedding response: {response.text[:200]}") from err
+
+    def chat(self, messages: list[dict[str, str]], model: str | None = None) -> Completion:
+        return self.stream_chat(messages, model).collect()
+
+    def generate(self, prompt: str, system: str | None = None, model: str | None = None) -> Completion:
+        return self.stream_generate(prompt, system, model).collect()
+
+
+_client: OllamaClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_ollama_client() -> OllamaClient:
+    """Process-wide client, so every caller shares its connection pool."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = OllamaClient()
+        return _client
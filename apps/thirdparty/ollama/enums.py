@@ -0,0 +1,12 @@
+from django.db import models
+
+
+class CircuitStateChoices(models.TextChoices):
+    CLOSED = "closed", "Closed"
+    OPEN = "open", "Open"
+    HALF_OPEN = "half_open", "Half Open"
+
+
+class InferenceLaneChoices(models.TextChoices):
+    INTERACTIVE = "interactive", "Interactive"
+    BATCH = "batch", "Batch"
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, NoReturn
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.thirdparty.ollama.client import OllamaError
+from apps.thirdparty.ollama.enums import InferenceLaneChoices
+
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceBusy(OllamaError):
+    """No inference slot for a request: its lane's queue is full or the wait timed out."""
+
+    def __init__(self, message: str, lane: str):
+        super().__init__(message)
+        self.lane = lane
+
+
+@dataclass
+class Lease:
+    """A held slot or queue position. Expires after `timeout` seconds unless refreshed."""
+
+    key: str
+    token: str
+    lane: str
+    timeout: int
+    refresh_interval: float
+    clock: Callable[[], float] = time.monotonic
+    refreshed_at: float = field(default=0.0)
+
+    def __post_init__(self):
+        self.refreshed_at = self.clock()
+
+    def refresh(self) -> None:
+        """Extend the lease, at most once per `refresh_interval`."""
+        if self.clock() - self.refreshed_at >= self.refresh_interval:
+            cache.touch(self.key, self.timeout)
+            self.refreshed_at = self.clock()
+
+
+class InferenceGateway:
+    """Bounded, prioritized access to Ollama shared by every worker through the cache (Redis).
+
+    At most `OLLAMA_GATEWAY["CONCURRENCY"]` generations run at once: each holds one of that many
+    slot keys, taken with an atomic `add` and leased so a crashed worker's slot frees itself.
+    Waiting requests hold one of `MAX_QUEUE` queue position keys of their lane the same way,
+    refreshed while they poll, so a worker killed while waiting drops out of the queue within
+    `QUEUE_LEASE_TIMEOUT` seconds. Batch requests only take a slot while no interactive request
+    is waiting. A request finding every queue position of its lane taken, or not getting a slot
+    within `QUEUE_TIMEOUT` seconds, raises `InferenceBusy` so the caller can answer "busy" right
+    away instead of piling up on Ollama.
+    """
+
+    SLOT_KEY = "ollama:gateway:slot:{slot}"
+    QUEUE_KEY = "ollama:gateway:queue:{lane}:{position}"
+    REJECTED_KEY = "ollama:gateway:rejected:{lane}"
+    LEASE_TIMEOUT = 120
+    LEASE_REFRESH_INTERVAL = 10
+    QUEUE_LEASE_TIMEOUT = 5
+    QUEUE_REFRESH_INTERVAL = 1
+    POLL_INTERVAL = 0.1
+
+    def __init__(self, sleep: Callable[[float], None] = time.sleep, clock: Callable[[], float] = time.monotonic):
+        self._sleep = sleep
+        self._clock = clock
+
+    @property
+    def config(self) -> dict[str, Any]:
+        return settings.OLLAMA_GATEWAY
+
+    def slot_keys(self) -> list[str]:
+        return [self.SLOT_KEY.format(slot=slot) for slot in range(self.config["CONCURRENCY"])]
+
+    def queue_keys(self, lane: str) -> list[str]:
+        return [
+            self.QUEUE_KEY.format(lane=lane, position=position) for position in range(self.config["MAX_QUEUE"][lane])
+        ]
+
+    # ----------------------------------------------------
+    # Metrics
+    # ----------------------------------------------------
+    def waiting(self, lane: str) -> int:
+        return len(cache.get_many(self.queue_keys(lane)))
+
+    def in_flight(self) -> int:
+        return len(cache.get_many(self.slot_keys()))
+
+    def stats(self) -> dict[str, Any]:
+        """Queue depth per lane, busy slots and requests turned away per lane since the counters were created."""
+        lanes = InferenceLaneChoices.values
+        rejected = cache.get_many([self.REJECTED_KEY.format(lane=lane) for lane in lanes])
+        return {
+            "concurrency": self.config["CONCURRENCY"],
+            "in_flight": self.in_flight(),
+            "waiting": {lane: self.waiting(lane) for lane in lanes},
+            "rejected": {lane: rejected.get(self.REJECTED_KEY.format(lane=lane), 0) for lane in lanes},
+        }
+
+    # ----------------------------------------------------
+    # Slots
+    # ----------------------------------------------------
+    @contextmanager
+    def slot(self, lane: str = InferenceLaneChoices.INTERACTIVE) -> Iterator[Lease]:
+        """Hold an inference slot for the duration of the block."""
+        lease = self.acquire(lane)
+        try:
+            yield lease
+        finally:
+            self.release(lease)
+
+    def stream(self, pieces: Iterable[str], lane: str = InferenceLaneChoices.INTERACTIVE) -> Iterator[str]:
+        """Pass a completion stream through while holding a slot, taken when the iteration starts."""
+        with self.slot(lane) as lease:
+            for piece in pieces:
+                lease.refresh()
+                yield piece
+
+    def acquire(self, lane: str) -> Lease:
+        position = self._take(self.queue_keys(lane), lane, self.QUEUE_LEASE_TIMEOUT, self.QUEUE_REFRESH_INTERVAL)
+        if position is None:
+            self._reject(lane, f"Inference queue is full ({self.config['MAX_QUEUE'][lane]} {lane} requests waiting)")
+
+        started = self._clock()
+        try:
+            while True:
+                if lane == InferenceLaneChoices.INTERACTIVE or not self.waiting(InferenceLaneChoices.INTERACTIVE):
+                    lease = self._take(self.slot_keys(), lane, self.LEASE_TIMEOUT, self.LEASE_REFRESH_INTERVAL)
+                    if lease is not None:
+                        waited_ms = round((self._clock() - started) * 1000, 2)
+                        logger.info(f"Inference slot taken ({lane}) after {waited_ms} ms")
+                        return lease
+
+                if self._clock() - started >= self.config["QUEUE_TIMEOUT"][lane]:
+                    self._reject(lane, f"No inference slot free after {self.config['QUEUE_TIMEOUT'][lane]}s")
+                self._sleep(self.POLL_INTERVAL)
+                position.refresh()
+        finally:
+            self.release(position)
+
+    def release(self, lease: Lease) -> None:
+        if cache.get(lease.key) == lease.token:
+            cache.delete(lease.key)
+
+    def _take(self, keys: list[str], lane: str, timeout: int, refresh_interval: float) -> Lease | None:
+        """Lease the first free key of `keys`, None when they are all taken."""
+        token = uuid.uuid4().hex
+        for key in keys:
+            if cache.add(key, token, timeout):
+                return Lease(key, token, lane, timeout, refresh_interval, clock=self._clock)
+        return None
+
+    def _reject(self, lane: str, message: str) -> NoReturn:
+        rejected_key = self.REJECTED_KEY.format(lane=lane)
+        cache.add(rejected_key, 0, timeout=None)
+        cache.incr(rejected_key)
+        logger.warning(f"Inference request rejected ({lane}): {message}")
+        raise InferenceBusy(message, lane)
+
+
+inference_gateway = InferenceGateway()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.thirdparty.ollama.enums import CircuitStateChoices
+from apps.thirdparty.ollama.services import OllamaService
+
+
+logger = logging.getLogger(__name__)
+
+# health_check statuses meaning Ollama answered, whether or not the models are there
+REACHABLE_STATUSES = ("healthy", "unhealthy")
+
+
+class OllamaHealthMonitor:
+    """Ollama health status probed in the background and read from the shared cache.
+
+    `task_probe_ollama_health` probes `/api/tags` every `OLLAMA_HEALTH_CHECK_INTERVAL`
+    seconds with a short timeout and caches the result, so readers never wait on Ollama.
+
+    Probes feed a circuit breaker: after `FAILURE_THRESHOLD` failed probes in a row the
+    circuit opens and Ollama is not probed (nor used for chat) for `RESET_TIMEOUT` seconds.
+    The next probe is a half-open trial that closes the circuit again or keeps it open.
+    """
+
+    STATUS_KEY = "ollama:health:status"
+    CIRCUIT_KEY = "ollama:health:circuit"
+    PROBE_LOCK_KEY = "ollama:health:probe"
+    PROBE_QUEUED_KEY = "ollama:health:probe_queued"
+    FAILURE_THRESHOLD = 3
+    RESET_TIMEOUT = 60
+    PROBE_TIMEOUT = 5
+
+    def __init__(self, clock: Callable[[], float] = time.time):
+        self._clock = clock
+
+    @property
+    def ttl(self) -> int:
+        # Outlives a few missed probes and the open circuit, so readers rarely find nothing cached
+        return max(settings.OLLAMA_HEALTH_CHECK_INTERVAL * 4, self.RESET_TIMEOUT * 2)
+
+    # ----------------------------------------------------
+    # Readers
+    # ----------------------------------------------------
+    def get_status(self) -> dict[str, Any]:
+        """Cached health status, never probes in the caller.
+
+        When nothing is cached (beat not running, key evicted) a probe is queued and Ollama is
+        reported unavailable until it has run.
+        """
+        status = cache.get(self.STATUS_KEY)
+        if status is None:
+            self.queue_probe()
+            status = self._unavailable_status("Health status is not available yet")
+        return status
+
+    def is_ready_for_chat(self) -> bool:
+        status = self.get_status()
+        return status["ready_for_chat"] and status.get("circuit_state") == CircuitStateChoices.CLOSED
+
+    def circuit(self) -> dict[str, Any]:
+        return cache.get(self.CIRCUIT_KEY) or {"state": CircuitStateChoices.CLOSED, "failures": 0, "opened_at": None}
+
+    # ----------------------------------------------------
+    # Probing
+    # ----------------------------------------------------
+    def queue_probe(self) -> None:
+        """Queue `task_probe_ollama_health`, once per `PROBE_TIMEOUT * 2` however many readers find nothing cached."""
+        if not cache.add(self.PROBE_QUEUED_KEY, True, self.PROBE_TIMEOUT * 2):
+            return
+
+        from apps.thirdparty.ollama.tasks import task_probe_ollama_health
+
+        task_probe_ollama_health.delay()  # type: ignore
+
+    def probe(self) -> dict[str, Any] | None:
+        """Check Ollama and cache the result.
+
+        Returns:
+            dict | None: The new status, None when the circuit is open or another process is probing
+        """
+        circuit = self.circuit()
+        if circuit["state"] == CircuitStateChoices.OPEN:
+            if self._clock() - circuit["opened_at"] < self.RESET_TIMEOUT:
+                return None
+            circuit["state"] = CircuitStateChoices.HALF_OPEN
+            cache.set(self.CIRCUIT_KEY, circuit, timeout=None)
+
+        if not cache.add(self.PROBE_LOCK_KEY, True, self.PROBE_TIMEOUT * 2):
+            return None
+        try:
+            service = OllamaService()
+            service.timeout = self.PROBE_TIMEOUT
+            status = service.health_check()
+        finally:
+            cache.delete(self.PROBE_LOCK_KEY)
+
+        circuit = self._record(circuit, reachable=status["status"] in REACHABLE_STATUSES)
+        status.update(circuit_state=circuit["state"], checked_at=timezone.now().isoformat())
+        cache.set(self.STATUS_KEY, status, self.ttl)
+        return status
+
+    def _record(self, circuit: dict[str, Any], reachable: bool) -> dict[str, Any]:
+        if reachable:
+            if circuit["state"] != CircuitStateChoices.CLOSED:
+                logger.info("Ollama is reachable again, closing the circuit")
+            circuit = {"state": CircuitStateChoices.CLOSED, "failures": 0, "opened_at": None}
+        else:
+            failures = circuit["failures"] + 1
+            if circuit["state"] == CircuitStateChoices.HALF_OPEN or failures >= self.FAILURE_THRESHOLD:
+                logger.warning(f"Ollama failed {failures} health probes, opening the circuit")
+                circuit = {"state": CircuitStateChoices.OPEN, "failures": failures, "opened_at": self._clock()}
+            else:
+                circuit = {"state": CircuitStateChoices.CLOSED, "failures": failures, "opened_at": None}
+
+        cache.set(self.CIRCUIT_KEY, circuit, timeout=None)
+        return circuit
+
+    def _unavailable_status(self, error: str) -> dict[str, Any]:
+        config = settings.OLLAMA_CONFIG
+        return {
+            "status": "unreachable",
+            "ready_for_chat": False,
+            "default_model": config["DEFAULT_MODEL"],
+            "fallback_model": config["FALLBACK_MODEL"],
+            "error": error,
+            "circuit_state": self.circuit()["state"],
+        }
+
+
+health_monitor = OllamaHealthMonitor()
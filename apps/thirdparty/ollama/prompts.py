@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import math
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+
+from apps.thirdparty.telegram.enums import IntentChoices
+
+
+logger = logging.getLogger(__name__)
+
+# Rough average for Turkish and English text with numbers; Ollama reports the exact count after the call
+CHARS_PER_TOKEN = 3.5
+
+# Same text for every user and question: kept first so Ollama can reuse its evaluation while the model
+# stays loaded (`keep_alive`), only the data and the question are evaluated per request
+SYSTEM_PREAMBLE = """You are SkillForge platform's Telegram finance assistant.
+Answer the user's question using only their data in the next message.
+Data is given as tables: a header line naming the columns, then one row per line, columns separated by "|".
+Amounts are in the row's currency, the "try" column is the amount converted to TRY.
+
+Telegram Message Rules:
+1. Respond in Turkish, be friendly and helpful
+2. Use emojis but don't overdo it
+3. Keep explanations short and clear (max 3 paragraphs)
+4. Specify currency units
+5. Write dates in dd/mm/yyyy format
+6. You can provide financial advice"""
+
+
+def estimate_tokens(text: str) -> int:
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+@dataclass
+class Prompt:
+    """Chat messages of a question and their estimated token counts."""
+
+    messages: list[dict[str, str]]
+    preamble_tokens: int
+    context_tokens: int
+    question_tokens: int
+    # Subscription rows left out to stay within the budget, summarized in one line
+    omitted_rows: int = 0
+    token_counts: dict[str, int] = field(init=False)
+
+    def __post_init__(self):
+        self.token_counts = {
+            "preamble": self.preamble_tokens,
+            "context": self.context_tokens,
+            "question": self.question_tokens,
+            "total": self.total_tokens,
+        }
+
+    @property
+    def total_tokens(self) -> int:
+        return self.preamble_tokens + self.context_tokens + self.question_tokens
+
+
+def _parse_date(value: str | None) -> datetime.date:
+    return datetime.datetime.strptime(value, "%d/%m/%Y").date() if value else datetime.date.max
+
+
+def _by_cost(row: dict[str, Any]) -> Any:
+    return -row["amount_try"]
+
+
+# Sort keys of the subscription rows per detected intent, most relevant first
+RANKINGS = {
+    IntentChoices.NEXT_PAYMENT: lambda row: (_parse_date(row["next_date"]), _by_cost(row)),
+    IntentChoices.CATEGORY_BREAKDOWN: lambda row: (row["category"], _by_cost(row)),
+}
+
+
+def rank_subscriptions(
+    subscriptions: list[dict[str, Any]], intent: str | None = None, entities: dict[str, Any] | None = None
+) -> list[dict[str, Any]]:
+    """Subscriptions ordered from the most to the least relevant to the question.
+
+    A service named in the question comes first. Then upcoming ones first for payment date
+    questions, grouped by category for category questions, the most expensive first otherwise.
+    """
+    ranked = sorted(subscriptions, key=RANKINGS.get(intent, _by_cost))
+
+    service = (entities or {}).get("service")
+    if service:
+        ranked.sort(key=lambda row: row["name"] != service)
+    return ranked
+
+
+def format_subscription_row(row: dict[str, Any]) -> str:
+    return "|".join(
+        [
+            row["name"],
+            f"{row['amount']:.2f}",
+            row["currency"],
+            f"{row['amount_try']:.2f}",
+            row["cycle"],
+            row["next_date"] or "-",
+            row["category"],
+        ]
+    )
+
+
+def build_context(user_context: dict[str, Any], rows: list[dict[str, Any]], omitted: list[dict[str, Any]]) -> str:
+    lines = [
+        f"user: {user_context['user_name']}",
+        "totals (TRY): "
+        f"this month remaining {user_context['this_month_remaining_try']:.2f}; "
+        f"next 90 days {user_context['next_90_days_try']:.2f}; "
+        f"monthly estimate {user_context['estimated_monthly_try']:.2f}; "
+        f"yearly estimate {user_context['estimated_yearly_try']:.2f}",
+        "",
+        f"active subscriptions ({user_context['total_count']}):",
+        "name|amount|currency|try|cycle|next|category",
+        *(format_subscription_row(row) for row in rows),
+    ]
+    if omitted:
+        total_try = sum(row["amount_try"] for row in omitted)
+        lines.append(
+            f"(+{len(omitted)} more subscriptions not listed, {total_try:.2f} TRY per billing cycle in total)"
+        )
+
+    lines += ["", "categories (normalized monthly cost):", "category|count|monthly_try"]
+    lines += [
+        f"{name}|{category['count']}|{category['monthly_total']:.2f}"
+        for name, category in user_context["categories"].items()
+    ]
+    return "\n".join(lines)
+
+
+def build_prompt(
+    user_context: dict[str, Any],
+    question: str,
+    intent: str | None = None,
+    entities: dict[str, Any] | None = None,
+    token_budget: int | None = None,
+) -> Prompt:
+    """Chat messages answering `question` from a `get_user_financial_context` dict within a token budget.
+
+    Data is written as compact "|" tables instead of indented JSON. When every subscription
+    does not fit in `token_budget` (`OLLAMA_CONFIG["PROMPT_TOKEN_BUDGET"]` by default), the
+    least relevant ones for the detected intent are summarized in one line.
+    """
+    token_budget = token_budget or settings.OLLAMA_CONFIG["PROMPT_TOKEN_BUDGET"]
+    preamble_tokens = estimate_tokens(SYSTEM_PREAMBLE)
+    question_tokens = estimate_tokens(question)
+
+    ranked = rank_subscriptions(user_context["subscriptions"], intent, entities)
+    # Worst case: no row listed, all of them summarized
+    available = (
+        token_budget - preamble_tokens - question_tokens - estimate_tokens(build_context(user_context, [], ranked))
+    )
+    rows, row_chars = [], 0
+    for row in ranked:
+        row_chars += len(format_subscription_row(row)) + 1
+        # The most relevant row is always listed
+        if rows and row_chars / CHARS_PER_TOKEN > available:
+            break
+        rows.append(row)
+    context = build_context(user_context, rows, ranked[len(rows) :])
+
+    prompt = Prompt(
+        messages=[
+            {"role": "system", "content": SYSTEM_PREAMBLE},
+            {"role": "system", "content": context},
+            {"role": "user", "content": question},
+        ],
+        preamble_tokens=preamble_tokens,
+        context_tokens=estimate_tokens(context),
+        question_tokens=question_tokens,
+        omitted_rows=len(ranked) - len(rows),
+    )
+    logger.info(f"Built prompt: {prompt.token_counts}, {prompt.omitted_rows} subscriptions omitted")
+    return prompt
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from rest_framework import serializers
 
+from apps.thirdparty.ollama.enums import CircuitStateChoices
 from core.serializers import NullableCharSerializer
 
 
@@ -14,3 +15,7 @@ class OllamaStatusSerializer(serializers.Serializer):
     default_model = NullableCharSerializer()
     fallback_model = NullableCharSerializer()
     error = NullableCharSerializer()
+    circuit_state = serializers.ChoiceField(choices=CircuitStateChoices.choices, required=False)
+    checked_at = serializers.DateTimeField(required=False)
+    # Inference gateway slots and queue depth, see apps.thirdparty.ollama.gateway
+    queue = serializers.DictField(required=False)
@@ -4,6 +4,8 @@ import requests
 
 from django.conf import settings
 
+from apps.thirdparty.ollama.client import get_ollama_client
+
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +23,7 @@ class OllamaService:
         """Check Ollama service health and return status matching serializer structure"""
         try:
             # Check if Ollama is running
-            response = requests.get(f"{self.base_url}/api/tags", timeout=self.timeout)
+            response = get_ollama_client().session.get(f"{self.base_url}/api/tags", timeout=self.timeout)
 
             if response.status_code == 200:
                 data = response.json()
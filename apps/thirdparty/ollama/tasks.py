@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+from apps.thirdparty.ollama.health import health_monitor
+
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(bind=True, name="task_probe_ollama_health")
+def task_probe_ollama_health(self) -> str | None:
+    """Refresh the cached Ollama health status. Scheduled every `OLLAMA_HEALTH_CHECK_INTERVAL` seconds."""
+    status = health_monitor.probe()
+    return status["status"] if status else None
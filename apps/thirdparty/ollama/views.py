@@ -4,7 +4,8 @@ import logging
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 
-from apps.thirdparty.ollama.services import OllamaService
+from apps.thirdparty.ollama.gateway import inference_gateway
+from apps.thirdparty.ollama.health import health_monitor
 from apps.thirdparty.ollama.serializers import OllamaStatusSerializer
 from core.views import BaseAPIView
 
@@ -18,8 +19,8 @@ class OllamaHealthCheckAPIView(BaseAPIView):
 
     def get(self, request, *args, **kwargs):
         try:
-            service = OllamaService()
-            status_data = service.health_check()
+            # Probed in the background, see apps.thirdparty.ollama.health
+            status_data = {**health_monitor.get_status(), "queue": inference_gateway.stats()}
 
             # Validate response data with serializer
             serializer = self.get_serializer(data=status_data)
@@ -0,0 +1,6 @@
+# Celery autodiscovery only imports `apps.thirdparty.tasks`
+from apps.thirdparty.telegram.tasks import (  # noqa: F401
+    task_process_telegram_updates,
+    task_requeue_stale_telegram_updates,
+)
+from apps.thirdparty.ollama.tasks import task_probe_ollama_health  # noqa: F401
@@ -1,47 +1,57 @@
 from __future__ import annotations
-import requests
 import logging
 
 from django.conf import settings
 
+from apps.thirdparty.telegram.client import SendResult, TelegramBotClient, get_bot_client
+
 logger = logging.getLogger(__name__)
 
 
+def get_reminder_chat_id(telegram_chat_id: str | None) -> str | None:
+    """Chat a user's reminders go to, None when the user has not linked the reminder bot.
+
+    Reminders hold the user's contacts and amounts, so they only go to the shared
+    TELEGRAM_REMINDER_CHAT_ID when TELEGRAM_REMINDER_SHARED_CHAT_FALLBACK opts in to it.
+    """
+    if telegram_chat_id:
+        return telegram_chat_id
+    if settings.TELEGRAM_REMINDER_SHARED_CHAT_FALLBACK:
+        return settings.TELEGRAM_REMINDER_CHAT_ID or None
+    return None
+
+
 class TelegramReminderAPI:
     """A class to interact with the Telegram Reminder Bot API.
     This class provides methods to send messages to a Telegram chat using the Reminder Bot.
-    """
 
-    BASE_URL = f"https://api.telegram.org"
+    Requests go through the process-wide `TelegramBotClient` of the bot, which pools
+    connections, applies Telegram's rate limits and retries 429 and transient errors.
+    """
 
     def __init__(self) -> None:
         self.reminder_bot_token = getattr(settings, "TELEGRAM_REMINDER_BOT_TOKEN")
         self.reminder_chat_id = getattr(settings, "TELEGRAM_REMINDER_CHAT_ID", "1775999934")
 
     @property
-    def reminder_bot_url(self) -> str:
+    def client(self) -> TelegramBotClient:
         if not self.reminder_bot_token:
             raise ValueError("Telegram Reminder Bot token is not set in settings.")
 
-        return f"{self.BASE_URL}/bot{self.reminder_bot_token}"
+        return get_bot_client(self.reminder_bot_token)
 
-    def send_message(self, message: str) -> bool:
+    def send_message(self, message: str, chat_id: str | None = None) -> bool:
         """
-        Send a message to a Telegram chat.
+        Send a message to a Telegram chat, split in several messages if it is too long.
 
-        :param chat_id: The ID of the chat to send the message to.
-        :param text: The message text.
-        :param parse_mode: The parse mode for formatting (default is HTML).
-        :return: True if the message was sent successfully, False otherwise.
+        :param message: The message text, HTML formatted.
+        :param chat_id: The ID of the chat to send the message to (default is TELEGRAM_REMINDER_CHAT_ID).
+        :return: True if the message was sent successfully.
+        :raises TelegramAPIError: (a ValueError) if Telegram rejected the message or kept failing.
         """
-        url = f"{self.reminder_bot_url}/sendMessage"
-        payload = {"chat_id": self.reminder_chat_id, "text": message, "parse_mode": "HTML"}
-
-        response = requests.post(url, json=payload)
-        if not response.ok:
-            logger.error(
-                f"Failed to send message to chat {self.reminder_chat_id}. "
-                f"Status code: {response.status_code}, Response: {response.text}"
-            )
-            raise ValueError(f"Failed to send message: {response.text}")
+        self.client.send_message(chat_id or self.reminder_chat_id, message)
         return True
+
+    def send_many(self, messages: list[tuple[str, str]]) -> list[SendResult]:
+        """Send (chat_id, message) pairs concurrently; failures are reported per message instead of raised."""
+        return self.client.send_many(messages)
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+import requests
+
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
+
+
+logger = logging.getLogger(__name__)
+
+MESSAGE_MAX_LENGTH = 4096
+RATE_LIMIT_KEY = "telegram:rate:{bot}"
+
+
+class TelegramAPIError(ValueError):
+    """A Bot API request that failed for good (after retries, or with an error that retrying cannot fix)."""
+
+    def __init__(self, description: str, error_code: int | None = None, retry_after: float | None = None):
+        super().__init__(description)
+        self.description = description
+        self.error_code = error_code
+        self.retry_after = retry_after
+
+
+class SharedRateLimit:
+    """At most `limit` calls per `period` seconds, counted in the shared cache (Redis).
+
+    Every process sending for the bot counts against the same per-window counters, so the
+    limit holds across Celery workers and web processes. A caller finding the current window
+    full reserves a call in the next window with room and waits for it to start.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        limit: int,
+        period: float = 1,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.key = key
+        self.limit = limit
+        self.period = period
+        self._clock = clock
+        self._sleep = sleep
+
+    @classmethod
+    def from_rate(cls, key: str, rate: float, **kwargs: Any) -> SharedRateLimit:
+        """Limit of `rate` calls per second: whole calls per second, or one call per 1 / `rate` seconds."""
+        if rate >= 1:
+            return cls(key, round(rate), 1, **kwargs)
+        return cls(key, 1, 1 / rate, **kwargs)
+
+    def acquire(self) -> float:
+        """Block until a call is allowed. Returns the time waited in seconds."""
+        now = self._clock()
+        window = int(now // self.period)
+        while True:
+            window_key = f"{self.key}:{window}"
+            # Kept until the window is over, windows are never reused
+            cache.add(window_key, 0, math.ceil((window + 1) * self.period - now) + 1)
+            try:
+                if cache.incr(window_key) <= self.limit:
+                    break
+            except ValueError:
+                # Expired between add and incr
+                continue
+            window += 1
+
+        wait = max(0.0, window * self.period - now)
+        if wait:
+            self._sleep(wait)
+        return wait
+
+
+def split_message(text: str, limit: int = MESSAGE_MAX_LENGTH) -> list[str]:
+    """Split `text` into chunks of at most `limit` characters, at line breaks where possible.
+
+    Digests format one item per line, so splitting between lines keeps HTML tags balanced;
+    only a single line longer than `limit` is cut mid-line.
+    """
+    if len(text) <= limit:
+        return [text]
+
+    chunks, current = [], ""
+    for line in text.splitlines(keepends=True):
+        while len(line) > limit:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:limit])
+            line = line[limit:]
+        if len(current) + len(line) > limit:
+            chunks.append(current)
+            current = ""
+        current += line
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+@dataclass
+class SendResult:
+    chat_id: str
+    ok: bool
+    messages: list[dict[str, Any]]
+    error: str = ""
+
+
+class TelegramBotClient:
+    """Bot API client sharing one pooled HTTP session across threads and Telegram's rate limits across processes.
+
+    Every request waits for its turn under the bot's global limit (about 30 messages per second)
+    and the chat's limit (1 per second for private chats, 20 per minute for groups). The limits
+    are counted in the shared cache, so every worker and web process sending for the bot stays
+    within them together.
+    429 responses are retried after the `retry_after` Telegram asks for, connection errors and
+    5xx responses with exponential backoff; other errors raise `TelegramAPIError` right away.
+    """
+
+    GLOBAL_RATE = 30
+    PRIVATE_CHAT_RATE = 1
+    GROUP_CHAT_RATE = 20 / 60
+    MAX_RETRIES = 3
+    BACKOFF_SECONDS = 1
+    TIMEOUT = (5, 30)  # connect, read
+    POOL_SIZE = 16
+
+    def __init__(
+        self,
+        token: str,
+        base_url: str | None = None,
+        global_rate: float | None = None,
+        chat_rate: float | None = None,
+        group_chat_rate: float | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+    ):
+        if not token:
+            raise ValueError("Telegram bot token is not set.")
+
+        self.base_url = f"{(base_url or settings.TELEGRAM_API_BASE_URL).rstrip('/')}/bot{token}"
+        self.chat_rate = chat_rate or self.PRIVATE_CHAT_RATE
+        self.group_chat_rate = group_chat_rate or self.GROUP_CHAT_RATE
+        self._sleep = sleep
+        self._clock = clock
+        # The bot ID part of the token, so limits are counted per bot without storing the token
+        self._rate_key = RATE_LIMIT_KEY.format(bot=token.split(":")[0])
+        self._global_limit = SharedRateLimit.from_rate(
+            f"{self._rate_key}:global", global_rate or self.GLOBAL_RATE, clock=clock, sleep=sleep
+        )
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _chat_limit(self, chat_id: str) -> SharedRateLimit:
+        # Group and channel IDs are negative
+        rate = self.group_chat_rate if chat_id.startswith("-") else self.chat_rate
+        return SharedRateLimit.from_rate(
+            f"{self._rate_key}:chat:{chat_id}", rate, clock=self._clock, sleep=self._sleep
+        )
+
+    def call(self, method: str, payload: dict[str, Any], chat_id: str | None = None) -> dict[str, Any]:
+        """Call a Bot API method and return its `result`, retrying rate limits and transient errors."""
+        for attempt in range(self.MAX_RETRIES + 1):
+            if chat_id is not None:
+                self._chat_limit(chat_id).acquire()
+            self._global_limit.acquire()
+
+            try:
+                response = self.session.post(f"{self.base_url}/{method}", json=payload, timeout=self.TIMEOUT)
+            except requests.RequestException as err:
+                error, retry_after = TelegramAPIError(f"Request failed: {err}"), None
+            else:
+                try:
+                    data = response.json()
+                except ValueError:
+                    data = {"description": response.text}
+                if response.ok and data.get("ok"):
+                    return data["result"]
+
+                retry_after = (data.get("parameters") or {}).get("retry_after")
+                error = TelegramAPIError(data.get("description", response.text), response.status_code, retry_after)
+                if response.status_code != 429 and response.status_code < 500:
+                    raise error
+
+            if attempt == self.MAX_RETRIES:
+                raise error
+
+            delay = retry_after if retry_after is not None else self.BACKOFF_SECONDS * 2**attempt
+            logger.warning(f"Telegram {method} failed ({error}), retrying in {delay}s")
+            self._sleep(delay)
+
+        raise AssertionError("unreachable")
+
+    def send_message(self, chat_id: str | int, text: str, parse_mode: str | None = "HTML") -> list[dict[str, Any]]:
+        """Send `text` to a chat, split into several messages when longer than Telegram allows.
+
+        Args:
+            parse_mode: Telegram formatting of `text`, None for plain text
+
+        Returns:
+            list: The sent Message objects
+        """
+        chat_id = str(chat_id)
+        messages = []
+        for chunk in split_message(text):
+            payload = {"chat_id": chat_id, "text": chunk}
+            if parse_mode:
+                payload["parse_mode"] = parse_mode
+            messages.append(self.call("sendMessage", payload, chat_id=chat_id))
+        return messages
+
+    def send_many(self, messages: Iterable[tuple[str | int, str]], max_workers: int = 8) -> list[SendResult]:
+        """Send many (chat_id, text) messages concurrently on a thread pool.
+
+        Rate limits are shared by the threads, so this is as fast as Telegram allows. A failed
+        message does not stop the others.
+
+        Returns:
+            list: One SendResult per message, in input order
+        """
+
+        def send(message: tuple[str | int, str]) -> SendResult:
+            chat_id, text = str(message[0]), message[1]
+            try:
+                return SendResult(chat_id=chat_id, ok=True, messages=self.send_message(chat_id, text))
+            except TelegramAPIError as err:
+                logger.error(f"Failed to send message to chat {chat_id}: {err}")
+                return SendResult(chat_id=chat_id, ok=False, messages=[], error=str(err))
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="telegram-send") as executor:
+            return list(executor.map(send, messages))
+
+
+_clients: dict[str, TelegramBotClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_bot_client(token: str) -> TelegramBotClient:
+    """Process-wide client of a bot, so its connections and rate limits are shared by every caller."""
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = _clients[token] = TelegramBotClient(token)
+        return client
@@ -0,0 +1,16 @@
+from django.db import models
+
+
+class TelegramUpdateStatusChoices(models.TextChoices):
+    RECEIVED = "received", "Received"
+    PROCESSING = "processing", "Processing"
+    PROCESSED = "processed", "Processed"
+    FAILED = "failed", "Failed"
+
+
+class IntentChoices(models.TextChoices):
+    MONTHLY_TOTAL = "monthly_total", "Monthly Total"
+    MOST_EXPENSIVE = "most_expensive", "Most Expensive Subscription"
+    SERVICE_ACTIVE = "service_active", "Service Active"
+    CATEGORY_BREAKDOWN = "category_breakdown", "Category Breakdown"
+    NEXT_PAYMENT = "next_payment", "Next Payment"
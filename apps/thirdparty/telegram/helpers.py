@@ -1,7 +1,17 @@
+from datetime import date, timedelta
+from decimal import Decimal
 from typing import Dict, Any, Optional
+from dateutil.relativedelta import relativedelta
+
+from apps.finance.analytics import UNCATEGORIZED, get_subscription_analytics
+from apps.finance.enums import AnalyticsGroupByChoices
+from apps.finance.ledger import sum_projected_charges
 from apps.finance.models import UserSubscription
+from apps.finance.reports import convert_currency_totals
 from apps.user.models import User
-import json
+from core.enums import CurrencyChoices
+from core.money import Money
+from core.services.exchange_rates import ExchangeRateProvider
 
 
 def get_telegram_welcome_message(user: User) -> str:
@@ -87,87 +97,75 @@ You can talk to me after adding subscriptions! 💪
 
 
 def get_user_financial_context(user: User) -> Optional[Dict[str, Any]]:
-    """Get user's financial context"""
-    subscriptions = UserSubscription.objects.filter(user=user, status="active").select_related(
-        "subscription_service", "subscription_service__category"
+    """Get user's financial context
+
+    Totals are range sums over the projected charges ledger (see `apps.finance.ledger`),
+    so every billing cycle is counted as often as it is actually charged, converted
+    to TRY with the daily exchange rates.
+    """
+    subscriptions = list(
+        UserSubscription.objects.filter(user=user, status="active").select_related("service", "service__category")
     )
 
-    if not subscriptions.exists():
+    if not subscriptions:
         return None
 
-    total_monthly_try = 0
-    subscription_list = []
-    categories = {}
-
-    for sub in subscriptions:
-        amount_try = float(sub.amount)
-        if sub.currency == "USD":
-            amount_try *= 30
-        elif sub.currency == "EUR":
-            amount_try *= 32
-
-        total_monthly_try += amount_try
-
-        category_name = sub.subscription_service.category.name if sub.subscription_service.category else "Other"
-        if category_name not in categories:
-            categories[category_name] = {"count": 0, "total": 0}
-        categories[category_name]["count"] += 1
-        categories[category_name]["total"] += amount_try
-
-        subscription_list.append(
-            {
-                "name": sub.subscription_service.name,
-                "amount": float(sub.amount),
-                "currency": sub.currency,
-                "amount_try": round(amount_try, 2),
-                "cycle": sub.billing_cycle,
-                "next_date": sub.next_billing_date.strftime("%d/%m/%Y") if sub.next_billing_date else None,
-                "category": category_name,
-            }
+    exchange_rate_provider = ExchangeRateProvider()
+    today = date.today()
+    next_month_start = today.replace(day=1) + relativedelta(months=1)
+
+    def projected_try(end_date: date) -> Decimal:
+        return convert_currency_totals(
+            sum_projected_charges(user, today, end_date), CurrencyChoices.TRY, exchange_rate_provider
         )
 
+    this_month_try = projected_try(next_month_start)
+    next_90_days_try = projected_try(today + timedelta(days=90))
+    yearly_try = projected_try(today + timedelta(days=365))
+
+    amounts_try = Money.convert_many(
+        [Money.from_quantized(sub.amount, sub.currency) for sub in subscriptions],
+        CurrencyChoices.TRY,
+        rate_source=exchange_rate_provider,
+    )
+    subscription_list = [
+        {
+            "name": sub.service.name,
+            "amount": float(sub.amount),
+            "currency": sub.currency,
+            "amount_try": float(amount_try.amount),
+            "cycle": sub.billing_cycle,
+            "next_date": sub.next_billing_date.strftime("%d/%m/%Y") if sub.next_billing_date else None,
+            "category": sub.service.category.name if sub.service.category else UNCATEGORIZED,
+        }
+        for sub, amount_try in zip(subscriptions, amounts_try)
+    ]
+
+    # Normalized monthly cost per category, aggregated in SQL
+    categories = {
+        group["key"]: {"count": group["subscription_count"], "monthly_total": float(group["monthly_cost"])}
+        for group in get_subscription_analytics(user, group_by=AnalyticsGroupByChoices.CATEGORY)["groups"]
+    }
+
     return {
         "user_name": user.get_full_name() or user.username,
         "subscriptions": subscription_list,
         "total_count": len(subscription_list),
-        "estimated_monthly_try": round(total_monthly_try, 2),
-        "estimated_yearly_try": round(total_monthly_try * 12, 2),
+        "this_month_remaining_try": float(this_month_try),
+        "next_90_days_try": float(next_90_days_try),
+        "estimated_monthly_try": float(Money.round_amount(yearly_try / 12, CurrencyChoices.TRY)),
+        "estimated_yearly_try": float(yearly_try),
         "categories": categories,
     }
 
 
-def create_system_prompt(user_context: Dict[str, Any]) -> str:
-    """Create system prompt for AI"""
-    return f"""You are SkillForge platform's Telegram finance assistant. 
-
-User: {user_context['user_name']}
-Total Subscriptions: {user_context['total_count']} items
-Monthly Estimate: {user_context['estimated_monthly_try']} TRY
-Yearly Estimate: {user_context['estimated_yearly_try']} TRY
-
-Active Subscriptions:
-{json.dumps(user_context['subscriptions'], ensure_ascii=False, indent=2)}
-
-Category Analysis:
-{json.dumps(user_context['categories'], ensure_ascii=False, indent=2)}
-
-Telegram Message Rules:
-1. Respond in Turkish, be friendly and helpful
-2. Use emojis but don't overdo it
-3. Keep explanations short and clear (max 3 paragraphs)
-4. Specify currency units
-5. Write dates in dd/mm/yyyy format
-6. You can provide financial advice
-
-Answer the user's question using their personal data."""
-
-
 def format_telegram_error(error_type: str) -> str:
     """Format error messages for Telegram"""
     error_messages = {
         "no_data": "📭 You don't have any subscriptions yet. You can add them via web interface.",
         "ai_unavailable": "🤖 AI service is not active right now. Check with /status.",
         "timeout": "⏱️ AI timed out. Please try again.",
+        "busy": "🚦 AI is busy right now. Please try again in a minute.",
         "invalid_query": "❓ I couldn't understand the question. Please ask more clearly.",
         "permission_denied": "🔒 You don't have permission for this operation.",
         "user_not_found": "👤 User not found. Please link your account first.",
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import re
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any
+
+from dateutil.relativedelta import relativedelta
+
+from apps.finance.analytics import get_subscription_analytics
+from apps.finance.catalog import catalog
+from apps.finance.enums import AnalyticsGroupByChoices, SubscriptionStatusChoices
+from apps.finance.ledger import sum_projected_charges
+from apps.finance.models import ProjectedCharge, UserSubscription
+from apps.finance.reports import convert_currency_totals
+from apps.thirdparty.telegram.enums import IntentChoices
+from apps.thirdparty.telegram.helpers import get_no_subscription_message
+from apps.user.models import User
+from core.enums import CurrencyChoices
+
+
+logger = logging.getLogger(__name__)
+
+# Classifications below this confidence are left to the AI assistant
+MIN_CONFIDENCE = 0.8
+# Keyword hints: not answered from the database, only used to rank the AI assistant's prompt data
+HINT_CONFIDENCE = 0.5
+
+TURKISH_ASCII = str.maketrans("çğıöşüâîû", "cgiosuaiu")
+NON_WORD_RE = re.compile(r"[^\w\s]")
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fold_text(text: str) -> str:
+    """Lower-case ASCII form of a message, so patterns match with or without Turkish letters."""
+    text = text.replace("İ", "i").replace("I", "i").lower().translate(TURKISH_ASCII)
+    return WHITESPACE_RE.sub(" ", NON_WORD_RE.sub(" ", text)).strip()
+
+
+@dataclass(frozen=True)
+class IntentPattern:
+    id: int
+    intent: str
+    language: str
+    regex: re.Pattern
+    confidence: float = 0.9
+    # Intents about one subscription are only recognized with a known service in the message
+    requires_service: bool = False
+
+
+def pattern(pattern_id: int, intent: str, language: str, regex: str, **kwargs: Any) -> IntentPattern:
+    return IntentPattern(pattern_id, intent, language, re.compile(regex), **kwargs)
+
+
+# Matched against `fold_text` output in order, the first match wins
+PATTERNS = [
+    pattern(1, IntentChoices.MOST_EXPENSIVE, "tr", r"\ben (pahali|cok (para|tutan|ode\w*)|yuksek)"),
+    pattern(2, IntentChoices.MOST_EXPENSIVE, "en", r"\b(most expensive|priciest|costs? the most|highest|biggest)\b"),
+    pattern(3, IntentChoices.CATEGORY_BREAKDOWN, "tr", r"\bkategori\w*"),
+    pattern(4, IntentChoices.CATEGORY_BREAKDOWN, "en", r"\b(categor(y|ies)|breakdown)\b"),
+    pattern(
+        5,
+        IntentChoices.NEXT_PAYMENT,
+        "tr",
+        r"\b(siradaki|sonraki|yaklasan|ilk) (odeme|fatura|yenileme|cekim)|\b(odeme\w*|yenilen\w*|cekil\w*) ne zaman"
+        r"|\bne zaman (odeme|yenilen|cekil|ode)\w*",
+    ),
+    pattern(
+        6,
+        IntentChoices.NEXT_PAYMENT,
+        "en",
+        r"\b(next|upcoming) (payment|charge|bill|renewal)\b"
+        r"|\bwhen (is|do|will|does)\b.*\b(pay|charged?|renew\w*|due)\b",
+    ),
+    pattern(
+        7,
+        IntentChoices.SERVICE_ACTIVE,
+        "tr",
+        r"\b(aktif|acik|devam ediyor|var|iptal)( \w+)? mi\b|\babone (miyim|mi)\b|\babonelig\w* (aktif|var)\b",
+        requires_service=True,
+    ),
+    pattern(
+        8,
+        IntentChoices.SERVICE_ACTIVE,
+        "en",
+        r"\b(is|are)\b.*\b(active|running)\b|\bam i (still )?(subscribed|paying)\b|\bdo i (still )?have\b",
+        requires_service=True,
+    ),
+    pattern(
+        9,
+        IntentChoices.MONTHLY_TOTAL,
+        "tr",
+        r"^(?=.*\b(bu ay|aylik|ayda|her ay))(?=.*\b(ne kadar|kac|toplam|tutar|harca|ode|masraf))",
+    ),
+    pattern(
+        10,
+        IntentChoices.MONTHLY_TOTAL,
+        "en",
+        r"^(?=.*\b(this month|monthly|per month|a month|each month)\b)(?=.*\b(how much|total|spend|pay|cost))",
+    ),
+    # Keyword hints below MIN_CONFIDENCE: left to the AI assistant, whose prompt lists the
+    # subscriptions most relevant to the hinted intent first (apps.thirdparty.ollama.prompts)
+    pattern(
+        11, IntentChoices.NEXT_PAYMENT, "tr", r"\b(odeme|yenile|fatura|cekim|cekil)\w*", confidence=HINT_CONFIDENCE
+    ),
+    pattern(
+        12,
+        IntentChoices.NEXT_PAYMENT,
+        "en",
+        r"\b(payments?|renew\w*|bills?|billing|due)\b",
+        confidence=HINT_CONFIDENCE,
+    ),
+    pattern(
+        13, IntentChoices.CATEGORY_BREAKDOWN, "tr", r"\b(tur(u|leri)?|cesit\w*|grup\w*)\b", confidence=HINT_CONFIDENCE
+    ),
+    pattern(14, IntentChoices.CATEGORY_BREAKDOWN, "en", r"\b(types?|kinds?|groups?)\b", confidence=HINT_CONFIDENCE),
+]
+
+
+def find_service(folded_text: str) -> dict[str, Any] | None:
+    """Catalog service named in a message; the longest name wins ("YouTube Premium" over "YouTube")."""
+    matches = [
+        service
+        for name, service in catalog.snapshot.services_by_name.items()
+        if re.search(rf"\b{re.escape(fold_text(name))}\b", folded_text)
+    ]
+    if not matches:
+        return None
+    service = max(matches, key=lambda service: len(service.name))
+    return {"service": service.name, "service_id": service.pk}
+
+
+def classify_message(text: str) -> dict[str, Any]:
+    """Recognize the intent of a finance question with rules, in the shape of `ProcessedMessageSerializer`.
+
+    Returns:
+        dict: intent, confidence, entities, original_text and pattern_id; intent and
+            pattern_id are None when no pattern matches
+    """
+    folded = fold_text(text)
+    service = find_service(folded)
+
+    for intent_pattern in PATTERNS:
+        if intent_pattern.requires_service and service is None:
+            continue
+        if intent_pattern.regex.search(folded):
+            entities = {"language": intent_pattern.language, **(service or {})}
+            return {
+                "intent": intent_pattern.intent,
+                "confidence": intent_pattern.confidence,
+                "entities": entities,
+                "original_text": text,
+                "pattern_id": intent_pattern.id,
+            }
+
+    return {"intent": None, "confidence": 0.0, "entities": service or {}, "original_text": text, "pattern_id": None}
+
+
+# ----------------------------------------------------
+# Answers
+# ----------------------------------------------------
+def format_amount(amount: Decimal | str, currency: str = CurrencyChoices.TRY) -> str:
+    return f"{Decimal(amount):,.2f} {currency}"
+
+
+def format_date(date: datetime.date) -> str:
+    return date.strftime("%d/%m/%Y")
+
+
+def answer_monthly_total(user: User, entities: dict[str, Any], tr: bool) -> str | None:
+    analytics = get_subscription_analytics(user, group_by=AnalyticsGroupByChoices.CATEGORY)
+    if not analytics["groups"]:
+        return None
+
+    today = datetime.date.today()
+    next_month_start = today.replace(day=1) + relativedelta(months=1)
+    remaining = convert_currency_totals(sum_projected_charges(user, today, next_month_start))
+    count = sum(group["subscription_count"] for group in analytics["groups"])
+    if tr:
+        return (
+            f"💰 Bu ay kalan ödemeleriniz: {format_amount(remaining)}\n"
+            f"📅 Aylık ortalama: {format_amount(analytics['monthly_total'])} ({count} abonelik)"
+        )
+    return (
+        f"💰 Left to pay this month: {format_amount(remaining)}\n"
+        f"📅 Monthly average: {format_amount(analytics['monthly_total'])} ({count} subscriptions)"
+    )
+
+
+def answer_most_expensive(user: User, entities: dict[str, Any], tr: bool) -> str | None:
+    groups = get_subscription_analytics(user, group_by=AnalyticsGroupByChoices.SERVICE)["groups"]
+    if not groups:
+        return None
+
+    top = groups[0]
+    if tr:
+        return f"💸 En pahalı aboneliğiniz {top['key']}: aylık {format_amount(top['monthly_cost'])}"
+    return f"💸 Your most expensive subscription is {top['key']}: {format_amount(top['monthly_cost'])} a month"
+
+
+def answer_category_breakdown(user: User, entities: dict[str, Any], tr: bool) -> str | None:
+    analytics = get_subscription_analytics(user, group_by=AnalyticsGroupByChoices.CATEGORY)
+    if not analytics["groups"]:
+        return None
+
+    lines = ["📊 Kategorilere göre aylık harcama:" if tr else "📊 Monthly spend by category:"]
+    for group in analytics["groups"]:
+        lines.append(f"• {group['key']}: {format_amount(group['monthly_cost'])} ({group['subscription_count']})")
+    lines.append(f"{'Toplam' if tr else 'Total'}: {format_amount(analytics['monthly_total'])}")
+    return "\n".join(lines)
+
+
+def answer_next_payment(user: User, entities: dict[str, Any], tr: bool) -> str | None:
+    charges = ProjectedCharge.objects.filter(user=user, billing_date__gte=datetime.date.today())
+    if "service_id" in entities:
+        charges = charges.filter(subscription__service_id=entities["service_id"])
+    charge = charges.select_related("subscription__service").order_by("billing_date").first()
+
+    if charge is None:
+        if "service_id" in entities:
+            service = entities["service"]
+            return f"📭 Yaklaşan bir {service} ödemeniz yok." if tr else f"📭 You have no upcoming {service} payment."
+        return None
+
+    name = charge.subscription.service.name
+    amount = format_amount(charge.amount, charge.currency)
+    if tr:
+        return f"📅 Sıradaki ödemeniz: {name}, {format_date(charge.billing_date)} tarihinde {amount}"
+    return f"📅 Your next payment: {name}, {amount} on {format_date(charge.billing_date)}"
+
+
+def answer_service_active(user: User, entities: dict[str, Any], tr: bool) -> str | None:
+    service = entities["service"]
+    subscription = (
+        UserSubscription.objects.filter(
+            user=user,
+            service_id=entities["service_id"],
+            status__in=[SubscriptionStatusChoices.ACTIVE, SubscriptionStatusChoices.TRIAL],
+        )
+        .order_by("next_billing_date")
+        .first()
+    )
+    if subscription is None:
+        return f"❌ Aktif bir {service} aboneliğiniz yok." if tr else f"❌ You have no active {service} subscription."
+
+    amount = format_amount(subscription.amount, subscription.currency)
+    next_date = format_date(subscription.next_billing_date) if subscription.next_billing_date else "-"
+    if tr:
+        return f"✅ {service} aboneliğiniz aktif. Sonraki ödeme: {next_date}, {amount}"
+    return f"✅ Your {service} subscription is active. Next payment: {amount} on {next_date}"
+
+
+ANSWERS: dict[str, Callable[[User, dict[str, Any], bool], str | None]] = {
+    IntentChoices.MONTHLY_TOTAL: answer_monthly_total,
+    IntentChoices.MOST_EXPENSIVE: answer_most_expensive,
+    IntentChoices.CATEGORY_BREAKDOWN: answer_category_breakdown,
+    IntentChoices.NEXT_PAYMENT: answer_next_payment,
+    IntentChoices.SERVICE_ACTIVE: answer_service_active,
+}
+
+
+def answer_intent(user: User, processed: dict[str, Any]) -> str | None:
+    """Answer a classified message from the database, None when it needs the AI assistant.
+
+    Answers use the same cached aggregates and ledger sums as the finance reports, in the
+    language of the matched pattern. Users without active subscriptions get the usual
+    no-subscription message.
+    """
+    if processed["intent"] is None or processed["confidence"] < MIN_CONFIDENCE:
+        return None
+
+    entities = processed["entities"]
+    answer = ANSWERS[processed["intent"]](user, entities, entities.get("language") == "tr")
+    return answer if answer is not None else get_no_subscription_message(user)
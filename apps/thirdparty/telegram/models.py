@@ -0,0 +1,34 @@
+from django.db import models
+
+from apps.thirdparty.telegram.enums import TelegramUpdateStatusChoices
+from core.models import BaseModel
+
+
+class TelegramUpdate(BaseModel):
+    """A raw update received by the bot webhook, processed asynchronously.
+
+    `update_id` is unique so updates Telegram delivers again are stored once; updates of
+    a chat are processed in `update_id` order (see `apps.thirdparty.telegram.updates`).
+    """
+
+    update_id = models.BigIntegerField(unique=True)
+    chat_id = models.BigIntegerField(null=True, blank=True)
+    payload = models.JSONField()
+    status = models.CharField(
+        max_length=20, choices=TelegramUpdateStatusChoices.choices, default=TelegramUpdateStatusChoices.RECEIVED
+    )
+    processed_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        verbose_name = "Telegram Update"
+        indexes = [
+            models.Index(
+                fields=["chat_id", "update_id"],
+                condition=models.Q(status=TelegramUpdateStatusChoices.RECEIVED),
+                name="telegram_update_pending",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.update_id} {self.chat_id} {self.status}"
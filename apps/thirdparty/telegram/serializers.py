@@ -7,7 +7,8 @@ class TelegramWebhookSerializer(serializers.Serializer):
     """Serializer for incoming Telegram webhook data"""
 
     update_id = serializers.IntegerField()
-    message = serializers.DictField()
+    # Other update types (edited messages, callbacks, ...) are accepted and stored as they are
+    message = serializers.DictField(required=False)
 
     def validate_message(self, value):
         """Validate message structure"""
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+
+from apps.thirdparty.telegram.updates import process_chat_updates, sweep_stale_updates
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait before trying again when another worker is processing the chat
+CHAT_BUSY_RETRY_COUNTDOWN = 1
+
+
+@shared_task(bind=True, name="task_process_telegram_updates", max_retries=None)
+def task_process_telegram_updates(self, chat_id: int) -> int:
+    """Process the received updates of a chat in order. Routed to the `telegram` queue.
+
+    If another worker holds the chat, retry shortly: the holder may have checked for
+    new updates just before this one was stored.
+    """
+    processed = process_chat_updates(chat_id)
+    if processed is None:
+        raise self.retry(countdown=CHAT_BUSY_RETRY_COUNTDOWN)
+    return processed
+
+
+@shared_task(bind=True, name="task_requeue_stale_telegram_updates")
+def task_requeue_stale_telegram_updates(self) -> int:
+    """Queue the processing of chats whose received updates were left behind. Scheduled by beat.
+
+    Returns:
+        int: Number of chats queued
+    """
+    chat_ids = sweep_stale_updates()
+    for chat_id in chat_ids:
+        task_process_telegram_updates.delay(chat_id)
+    if chat_ids:
+        logger.warning(f"Requeued stale Telegram updates of {len(chat_ids)} chats")
+    return len(chat_ids)
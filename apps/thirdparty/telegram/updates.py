@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from apps.thirdparty.ollama.answer_cache import AnswerCache
+from apps.thirdparty.ollama.client import OllamaError, get_ollama_client
+from apps.thirdparty.ollama.enums import InferenceLaneChoices
+from apps.thirdparty.ollama.gateway import InferenceBusy, inference_gateway
+from apps.thirdparty.ollama.health import health_monitor
+from apps.thirdparty.ollama.prompts import build_prompt
+from apps.thirdparty.telegram.apis import TelegramReminderAPI
+from apps.thirdparty.telegram.client import TelegramBotClient, split_message
+from apps.thirdparty.telegram.enums import TelegramUpdateStatusChoices
+from apps.thirdparty.telegram.helpers import (
+    format_telegram_error,
+    get_ai_unavailable_message,
+    get_no_subscription_message,
+    get_telegram_help_message,
+    get_telegram_welcome_message,
+    get_user_financial_context,
+)
+from apps.thirdparty.telegram.intents import answer_intent, classify_message
+from apps.thirdparty.telegram.models import TelegramUpdate
+from apps.user.models import User
+
+
+logger = logging.getLogger(__name__)
+
+CHAT_LOCK_KEY = "telegram:chat:{chat_id}:lock"
+# Longer than processing one update takes, refreshed before each update; a crashed worker's lock expires after it
+CHAT_LOCK_TIMEOUT = 300
+# Received updates older than this are handed to a worker again by the sweep (see `sweep_stale_updates`)
+STALE_UPDATE_AGE = 60
+# Updates still processing after this long belong to a worker that died while answering them
+PROCESSING_TIMEOUT = 2 * CHAT_LOCK_TIMEOUT
+# Minimum seconds between two edits of a streamed answer; Telegram allows about one message per second per chat
+STREAM_EDIT_INTERVAL = 1.5
+
+# Update types carrying the chat they belong to in `chat`
+CHAT_UPDATE_TYPES = ("message", "edited_message", "channel_post", "edited_channel_post", "my_chat_member")
+
+
+def get_chat_id(payload: dict[str, Any]) -> int | None:
+    for update_type in CHAT_UPDATE_TYPES:
+        if update_type in payload:
+            return payload[update_type].get("chat", {}).get("id")
+    callback_message = payload.get("callback_query", {}).get("message")
+    if callback_message:
+        return callback_message.get("chat", {}).get("id")
+    return None
+
+
+def store_update(payload: dict[str, Any]) -> TelegramUpdate | None:
+    """Persist a raw update with one INSERT. Returns None for an update that was already received.
+
+    Updates without a chat (inline queries and the like) are not processed and stored as processed.
+    """
+    chat_id = get_chat_id(payload)
+    try:
+        with transaction.atomic():
+            return TelegramUpdate.objects.create(
+                update_id=payload["update_id"],
+                chat_id=chat_id,
+                payload=payload,
+                status=TelegramUpdateStatusChoices.RECEIVED if chat_id else TelegramUpdateStatusChoices.PROCESSED,
+            )
+    except IntegrityError:
+        return None
+
+
+@contextmanager
+def chat_lock(chat_id: int) -> Iterator[str | None]:
+    """Hold the processing lock of a chat, yields its token or None if another worker holds it."""
+    key = CHAT_LOCK_KEY.format(chat_id=chat_id)
+    token = uuid.uuid4().hex
+    acquired = cache.add(key, token, CHAT_LOCK_TIMEOUT)
+    try:
+        yield token if acquired else None
+    finally:
+        if acquired and cache.get(key) == token:
+            cache.delete(key)
+
+
+def refresh_chat_lock(chat_id: int, token: str) -> bool:
+    """Extend a held chat lock by another `CHAT_LOCK_TIMEOUT`. False if it expired and another worker took the chat."""
+    key = CHAT_LOCK_KEY.format(chat_id=chat_id)
+    if cache.get(key) != token:
+        return False
+    return cache.touch(key, CHAT_LOCK_TIMEOUT)
+
+
+def process_chat_updates(chat_id: int) -> int | None:
+    """Process the received updates of a chat one by one, in `update_id` order.
+
+    Only one worker processes a chat at a time; the lock is refreshed before each update
+    so a long backlog never outlives it. Each update is claimed with a conditional UPDATE
+    (RECEIVED to PROCESSING) before it is handled, so it is answered once even if a lock
+    expired. The loop runs until the chat has no received updates left, so updates stored
+    while it runs are handled too.
+
+    Returns:
+        int | None: Number of updates processed, None if another worker holds the chat
+    """
+    with chat_lock(chat_id) as token:
+        if token is None:
+            return None
+
+        processed = 0
+        pending = TelegramUpdate.objects.filter(chat_id=chat_id, status=TelegramUpdateStatusChoices.RECEIVED)
+        while (update := pending.order_by("update_id").first()) is not None:
+            if not refresh_chat_lock(chat_id, token):
+                logger.warning(f"Lost the lock of Telegram chat {chat_id}, leaving its updates to the new holder")
+                break
+            if not pending.filter(pk=update.pk).update(
+                status=TelegramUpdateStatusChoices.PROCESSING, last_updated=timezone.now()
+            ):
+                continue
+
+            try:
+                handle_update(update.payload)
+            except Exception as err:
+                logger.exception(f"Failed to process Telegram update {update.update_id}: {err}")
+                result = {"status": TelegramUpdateStatusChoices.FAILED, "error": str(err)}
+            else:
+                result = {"status": TelegramUpdateStatusChoices.PROCESSED, "error": ""}
+
+            now = timezone.now()
+            TelegramUpdate.objects.filter(pk=update.pk).update(**result, processed_at=now, last_updated=now)
+            processed += 1
+
+        return processed
+
+
+def sweep_stale_updates() -> list[int]:
+    """Find the chats whose updates were left behind.
+
+    A received update waits at most a few seconds for its task; one older than
+    `STALE_UPDATE_AGE` lost it (the broker dropped it, or the enqueue after commit
+    failed). Updates still processing after `PROCESSING_TIMEOUT` belong to a worker
+    that died mid-answer; they are marked failed rather than answered twice.
+
+    Returns:
+        list[int]: Chats with stale received updates, to process again
+    """
+    now = timezone.now()
+    interrupted = TelegramUpdate.objects.filter(
+        status=TelegramUpdateStatusChoices.PROCESSING, last_updated__lt=now - timedelta(seconds=PROCESSING_TIMEOUT)
+    ).update(status=TelegramUpdateStatusChoices.FAILED, error="Interrupted", processed_at=now, last_updated=now)
+    if interrupted:
+        logger.warning(f"Marked {interrupted} interrupted Telegram updates as failed")
+
+    return list(
+        TelegramUpdate.objects.filter(
+            status=TelegramUpdateStatusChoices.RECEIVED, created_at__lt=now - timedelta(seconds=STALE_UPDATE_AGE)
+        )
+        .order_by("chat_id")
+        .values_list("chat_id", flat=True)
+        .distinct()
+    )
+
+
+def handle_update(payload: dict[str, Any]) -> None:
+    """Reply to a text message; other updates need no action."""
+    message = payload.get("message")
+    if not message or not message.get("text"):
+        return
+
+    chat_id = message["chat"]["id"]
+    reply = build_reply(chat_id, message["text"].strip())
+    client = TelegramReminderAPI().client
+    if isinstance(reply, str):
+        if reply:
+            client.send_message(chat_id, reply, parse_mode=None)
+    else:
+        stream_reply(client, chat_id, reply)
+
+
+def build_reply(chat_id: int, text: str) -> str | Iterable[str]:
+    """Reply to a message: a text, or the pieces of an answer still being generated."""
+    command = text.split()[0].split("@")[0].lower() if text.startswith("/") else None
+    if command == "/help":
+        return get_telegram_help_message()
+    if command == "/status":
+        health = health_monitor.get_status()
+        return f"🤖 AI status: {health['status']}"
+
+    user = User.objects.filter(telegram_chat_id=str(chat_id)).first()
+    if user is None:
+        return format_telegram_error("user_not_found")
+    if command == "/start":
+        return get_telegram_welcome_message(user)
+    return answer_question(user, text)
+
+
+def answer_question(user: User, text: str) -> str | Iterable[str]:
+    """Answer common questions from the database, the others with the AI assistant."""
+    processed = classify_message(text)
+    logger.info(f"Classified message: intent={processed['intent']} pattern={processed['pattern_id']}")
+    if (answer := answer_intent(user, processed)) is not None:
+        return answer
+
+    user_context = get_user_financial_context(user)
+    if user_context is None:
+        return get_no_subscription_message(user)
+
+    answer_cache = AnswerCache(user.pk, user_context, text)
+    # Matching reworded questions needs an embedding from Ollama, only tried when it can answer
+    ready = health_monitor.is_ready_for_chat()
+    if (answer := answer_cache.get(semantic=ready)) is not None:
+        return answer
+    if not ready:
+        return get_ai_unavailable_message()
+
+    prompt = build_prompt(user_context, text, intent=processed["intent"], entities=processed["entities"])
+    stream = get_ollama_client().stream_chat(prompt.messages)
+    return answer_cache.record(inference_gateway.stream(stream, InferenceLaneChoices.INTERACTIVE))
+
+
+def stream_reply(client: TelegramBotClient, chat_id: int, pieces: Iterable[str]) -> None:
+    """Show an answer while it is generated.
+
+    The first piece is sent as a new message right away, which is then edited at most every
+    `STREAM_EDIT_INTERVAL` seconds as the answer grows. The final edit shows the whole answer;
+    the part longer than one Telegram message is sent as follow-up messages.
+    """
+    chat_id = str(chat_id)
+    message_id, text, shown, edited_at = None, "", "", 0.0
+
+    def show(preview: str) -> None:
+        nonlocal message_id, shown, edited_at
+        payload = {"chat_id": chat_id, "text": preview}
+        if message_id is None:
+            message_id = client.call("sendMessage", payload, chat_id=chat_id)["message_id"]
+        elif preview != shown:
+            client.call("editMessageText", {**payload, "message_id": message_id}, chat_id=chat_id)
+        shown, edited_at = preview, time.monotonic()
+
+    try:
+        for piece in pieces:
+            text += piece
+            if text.strip() and time.monotonic() - edited_at >= STREAM_EDIT_INTERVAL:
+                show(split_message(text)[0])
+    except InferenceBusy as err:
+        # Raised before the first piece: Ollama is saturated, answer right away instead of queueing
+        logger.warning(f"AI answer for chat {chat_id} rejected: {err}")
+        text = format_telegram_error("busy")
+    except OllamaError as err:
+        logger.warning(f"AI answer for chat {chat_id} failed: {err}")
+        text = f"{text}\n\n{format_telegram_error('timeout')}" if text.strip() else get_ai_unavailable_message()
+
+    chunks = split_message(text.strip() or format_telegram_error("invalid_query"))
+    show(chunks[0])
+    for chunk in chunks[1:]:
+        client.send_message(chat_id, chunk, parse_mode=None)
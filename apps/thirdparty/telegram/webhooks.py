@@ -1,17 +1,27 @@
 from __future__ import annotations
+import hmac
 import logging
 
+from django.conf import settings
+from django.db import transaction
 from rest_framework.permissions import AllowAny
 from rest_framework import status
 
 from apps.thirdparty.telegram.serializers import TelegramWebhookSerializer
+from apps.thirdparty.telegram.tasks import task_process_telegram_updates
+from apps.thirdparty.telegram.updates import store_update
 from core.views import BaseAPIView
 
 logger = logging.getLogger(__name__)
 
 
 class TelegramReminderWebhookAPIView(BaseAPIView):
-    """Webhook for Telegram Reminder Bot to receive messages."""
+    """Webhook for Telegram Reminder Bot to receive messages.
+
+    The raw update is stored and acknowledged right away; replies are produced by
+    `task_process_telegram_updates` on the `telegram` Celery queue, in order per chat.
+    Updates Telegram delivers again are recognized by `update_id` and not processed twice.
+    """
 
     permission_classes = [AllowAny]
     authentication_classes = []
@@ -22,19 +32,18 @@ class TelegramReminderWebhookAPIView(BaseAPIView):
 
     def post(self, request, *args, **kwargs):
         """Handle incoming webhook messages from the Telegram Reminder Bot."""
+        secret = settings.TELEGRAM_WEBHOOK_SECRET
+        if secret and not hmac.compare_digest(request.headers.get("X-Telegram-Bot-Api-Secret-Token", ""), secret):
+            return self.error_response(error_message="Invalid secret token", status_code=status.HTTP_403_FORBIDDEN)
 
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        webhook_data = serializer.validated_data
-
-        if "message" in webhook_data:
-            message = webhook_data["message"]
-            text = message.get("text", "")
-            user_id = message["from"]["id"]
-            # chat_id = message["chat"]["id"]
-            username = message["from"].get("username", "Unknown")
-
-            logger.info(f"Received message from user ID {user_id}: {text}")
+        update = store_update(request.data)
+        if update is None:
+            logger.info(f"Ignored duplicate Telegram update {serializer.validated_data['update_id']}")
+        elif update.chat_id is not None:
+            chat_id = update.chat_id
+            transaction.on_commit(lambda: task_process_telegram_updates.delay(chat_id))  # type: ignore
 
-            return self.success_response(status_code=status.HTTP_200_OK)
+        return self.success_response(status_code=status.HTTP_200_OK)
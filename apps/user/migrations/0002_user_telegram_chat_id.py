@@ -0,0 +1,18 @@
+# Generated by Django 5.2.2 on 2026-10-19 11:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="telegram_chat_id",
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+    ]
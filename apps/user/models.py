@@ -8,6 +8,8 @@ from core.fields import ULIDField
 class User(AbstractUser):
     id = ULIDField(primary_key=True, editable=False)
     email = models.EmailField(max_length=255, unique=True)
+    # Private chat of the user with the reminder bot, reminders are not sent when empty
+    telegram_chat_id = models.CharField(max_length=32, null=True, blank=True)
 
     def __str__(self):
         return self.email
@@ -0,0 +1,93 @@
+"""Run the benchmark scenarios and write the results to JSON.
+
+Usage:
+    python -m benchmarks --size 1000 --repeat 3 --output benchmark-results/$(git rev-parse --short HEAD).json
+    python -m benchmarks --scenarios vcard_parse vcard_import --size 10000
+    python -m benchmarks compare old.json new.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import subprocess
+import sys
+
+from pathlib import Path
+from typing import Any
+
+
+def get_git_commit() -> str | None:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "HEAD"], text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "skillforge.settings.base")
+    django.setup()
+
+    from benchmarks.scenarios import run_scenarios
+
+    results = run_scenarios(size=args.size, repeat=args.repeat, names=args.scenarios, seed=args.seed)
+    return {
+        "commit": get_git_commit(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "size": args.size,
+        "repeat": args.repeat,
+        "seed": args.seed,
+        "results": [result.to_dict() for result in results],
+    }
+
+
+def compare(old_path: str, new_path: str) -> str:
+    """Return a table of median timings and query counts between two result files."""
+    old = {result["name"]: result for result in json.loads(Path(old_path).read_text())["results"]}
+    new = {result["name"]: result for result in json.loads(Path(new_path).read_text())["results"]}
+
+    lines = [f"{'scenario':<28}{'old ms':>12}{'new ms':>12}{'change':>10}{'queries':>16}"]
+    for name in sorted(old.keys() & new.keys()):
+        old_ms, new_ms = old[name]["median_ms"], new[name]["median_ms"]
+        change = f"{(new_ms - old_ms) / old_ms * 100:+.1f}%" if old_ms else "n/a"
+        queries = f"{old[name]['queries']} -> {new[name]['queries']}"
+        lines.append(f"{name:<28}{old_ms:>12.2f}{new_ms:>12.2f}{change:>10}{queries:>16}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+
+    if argv and argv[0] == "compare":
+        parser = argparse.ArgumentParser(prog="python -m benchmarks compare")
+        parser.add_argument("old")
+        parser.add_argument("new")
+        compare_args = parser.parse_args(argv[1:])
+        print(compare(compare_args.old, compare_args.new))
+        return 0
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--size", type=int, default=1000, help="Number of contacts, subscriptions and vCards")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per scenario")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for the data generators")
+    parser.add_argument("--scenarios", nargs="*", default=None, help="Scenario names (default: all)")
+    parser.add_argument("--output", default=None, help="JSON output path (default: stdout)")
+    args = parser.parse_args(argv)
+
+    report = json.dumps(run(args), indent=2)
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(report)
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
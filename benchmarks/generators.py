@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import base64
+import datetime
+import random
+
+from decimal import Decimal
+
+from apps.contact.enums import SourceTextChoices
+from apps.contact.models import Contact
+from apps.finance.enums import BillingCycleChoices, SubscriptionStatusChoices
+from apps.finance.models import SubscriptionService, UserSubscription
+from apps.user.models import User
+from core.enums import CurrencyChoices, PaymentMethodChoices
+
+
+FIRST_NAMES = ["Ahmet", "Ayşe", "Mehmet", "Zeynep", "José", "Chloé", "Jürgen", "Françoise", "John", "Jane"]
+LAST_NAMES = ["Yılmaz", "Kaya", "Demir", "Çelik", "Müller", "Dubois", "García", "Smith", "Doe", "Öztürk"]
+ORGANIZATIONS = ["Acme Corp", "Globex", "Initech", "Umbrella", "Stark Industries", "Wayne Enterprises"]
+
+# Names that survive a latin-1 round trip, used for non-UTF8 files
+LATIN1_FIRST_NAMES = ["José", "Chloé", "Jürgen", "Françoise", "Ömer", "Björn", "John", "Jane"]
+LATIN1_LAST_NAMES = ["Müller", "Dubois", "García", "Øvergård", "Smith", "Doe"]
+
+VCARD_LINE_LENGTH = 75
+BULK_BATCH_SIZE = 1000
+
+
+def fold_vcard_line(line: str) -> str:
+    """Fold a content line at 75 characters as described in RFC 6350 section 3.2."""
+    if len(line) <= VCARD_LINE_LENGTH:
+        return line
+
+    parts = [line[:VCARD_LINE_LENGTH]]
+    parts.extend(
+        " " + line[i : i + VCARD_LINE_LENGTH - 1] for i in range(VCARD_LINE_LENGTH, len(line), VCARD_LINE_LENGTH - 1)
+    )
+    return "\r\n".join(parts)
+
+
+def generate_photo(rng: random.Random, size: int = 2048) -> bytes:
+    """Return JPEG-framed random bytes (SOI/APP0 header ... EOI) of roughly `size` bytes."""
+    return b"\xff\xd8\xff\xe0\x00\x10JFIF\x00" + rng.randbytes(size) + b"\xff\xd9"
+
+
+def generate_phone(rng: random.Random) -> str:
+    return f"05{rng.randint(30, 59)} {rng.randint(100, 999)} {rng.randint(10, 99)} {rng.randint(10, 99)}"
+
+
+def generate_vcard(
+    rng: random.Random,
+    index: int,
+    with_photo: bool = False,
+    latin1_only: bool = False,
+) -> str:
+    """Generate a single vCard 3.0 entry with CRLF line endings and folded long lines."""
+    first_name = rng.choice(LATIN1_FIRST_NAMES if latin1_only else FIRST_NAMES)
+    last_name = rng.choice(LATIN1_LAST_NAMES if latin1_only else LAST_NAMES)
+    birthday = datetime.date(1950, 1, 1) + datetime.timedelta(days=rng.randint(0, 365 * 55))
+
+    lines = [
+        "BEGIN:VCARD",
+        "VERSION:3.0",
+        f"N:{last_name};{first_name};;;",
+        f"FN:{first_name} {last_name}",
+        f"TEL;TYPE=CELL:{generate_phone(rng)}",
+        f"EMAIL;TYPE=INTERNET:{first_name.lower()}.{index}@example.com",
+        f"ORG:{rng.choice(ORGANIZATIONS)}",
+        f"TITLE:Engineer {index}",
+        f"BDAY:{birthday.isoformat()}",
+        f"ADR;TYPE=HOME:;;{index} Main St;Istanbul;Marmara;34000;Turkey",
+        f"NOTE:{' '.join(['Benchmark note'] * rng.randint(1, 12))}",
+    ]
+
+    if rng.random() < 0.5:
+        lines.append(f"TEL;TYPE=WORK:{generate_phone(rng)}")
+
+    if with_photo:
+        photo = base64.b64encode(generate_photo(rng)).decode("ascii")
+        lines.append(f"PHOTO;ENCODING=b;TYPE=JPEG:{photo}")
+
+    lines.append("END:VCARD")
+    return "\r\n".join(fold_vcard_line(line) for line in lines)
+
+
+def generate_vcard_file(
+    count: int,
+    photo_ratio: float = 0.1,
+    encoding: str = "utf-8",
+    seed: int = 42,
+) -> bytes:
+    """Generate an encoded vCard file with `count` cards.
+
+    Args:
+        count: Number of cards (1k-100k for realistic runs)
+        photo_ratio: Share of cards with an embedded base64 JPEG photo
+        encoding: File encoding; "latin-1" exercises the service's non-UTF8 fallback
+        seed: Random seed so runs are reproducible across commits
+    """
+    rng = random.Random(seed)
+    latin1_only = encoding.lower().replace("_", "-") in ("latin-1", "iso-8859-1")
+
+    cards = [generate_vcard(rng, i, rng.random() < photo_ratio, latin1_only) for i in range(count)]
+    return ("\r\n".join(cards) + "\r\n").encode(encoding)
+
+
+def create_contacts(user: User, count: int, duplicate_ratio: float = 0.1, seed: int = 42) -> int:
+    """Bulk insert `count` contacts for `user`, `duplicate_ratio` of them sharing a mobile phone."""
+    rng = random.Random(seed)
+    phones: list[str] = []
+    contacts = []
+
+    for i in range(count):
+        if phones and rng.random() < duplicate_ratio:
+            mobile_phone = rng.choice(phones)
+        else:
+            mobile_phone = f"+90{rng.randint(5300000000, 5599999999)}"
+            phones.append(mobile_phone)
+
+        first_name = rng.choice(FIRST_NAMES)
+        last_name = rng.choice(LAST_NAMES)
+        contacts.append(
+            Contact(
+                user=user,
+                first_name=first_name,
+                last_name=last_name,
+                full_name=f"{first_name} {last_name}",
+                email=f"{first_name.lower()}.{i}@example.com",
+                mobile_phone=mobile_phone,
+                organization=rng.choice(ORGANIZATIONS),
+                birthday=datetime.date(1950, 1, 1) + datetime.timedelta(days=rng.randint(0, 365 * 55)),
+                import_source=SourceTextChoices.VCARD,
+                external_id=f"benchmark_{seed}_{i}",
+            )
+        )
+
+    Contact.objects.bulk_create(contacts, batch_size=BULK_BATCH_SIZE)
+    return count
+
+
+def create_subscription_services(count: int = 50) -> list[SubscriptionService]:
+    """Create (or reuse) a catalog of `count` benchmark subscription services."""
+    SubscriptionService.objects.bulk_create(
+        [SubscriptionService(name=f"Benchmark Service {i}", is_active=True) for i in range(count)],
+        ignore_conflicts=True,
+    )
+    return list(SubscriptionService.objects.filter(name__startswith="Benchmark Service ").order_by("id"))
+
+
+def create_subscriptions(user: User, count: int, seed: int = 42) -> int:
+    """Bulk insert `count` active subscriptions for `user` billed within the current month."""
+    rng = random.Random(seed)
+    services = create_subscription_services()
+    today = datetime.date.today()
+    month_start = today.replace(day=1)
+
+    subscriptions = [
+        UserSubscription(
+            user=user,
+            service=rng.choice(services),
+            plan_name=rng.choice(["Basic", "Premium", "Family"]),
+            amount=Decimal(rng.randint(100, 100_000)) / 100,
+            currency=rng.choice([CurrencyChoices.TRY, CurrencyChoices.USD, CurrencyChoices.EUR, CurrencyChoices.GBP]),
+            billing_cycle=rng.choice(BillingCycleChoices.values),
+            started_at=month_start - datetime.timedelta(days=rng.randint(30, 900)),
+            next_billing_date=month_start + datetime.timedelta(days=rng.randint(0, 27)),
+            status=SubscriptionStatusChoices.ACTIVE,
+            auto_renewal=rng.random() < 0.7,
+            payment_method=PaymentMethodChoices.CREDIT_CARD,
+        )
+        for _ in range(count)
+    ]
+
+    UserSubscription.objects.bulk_create(subscriptions, batch_size=BULK_BATCH_SIZE)
+    return count
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import statistics
+import time
+
+from dataclasses import dataclass, field
+from typing import Any, Callable
+from unittest import mock
+
+import vobject
+
+from django.contrib import admin
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection, transaction
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from apps.contact.admin import ContactAdmin
+from apps.contact.models import Contact
+from apps.contact.vcard.adapter import VCardAdapter
+from apps.contact.vcard.services import VCardImportService
+from apps.contact.views import ContactListAPIView
+from apps.user.models import User
+from benchmarks import generators
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    size: int
+    timings_ms: list[float] = field(default_factory=list)
+    queries: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "size": self.size,
+            "repeat": len(self.timings_ms),
+            "min_ms": round(min(self.timings_ms), 3),
+            "median_ms": round(statistics.median(self.timings_ms), 3),
+            "mean_ms": round(statistics.fmean(self.timings_ms), 3),
+            "max_ms": round(max(self.timings_ms), 3),
+            "queries": self.queries,
+        }
+
+
+@dataclass
+class BenchmarkContext:
+    """Data shared by the scenarios of one run."""
+
+    user: User
+    size: int
+    vcard_content: bytes
+    latin1_vcard_content: bytes
+
+
+SCENARIOS: dict[str, Callable[[BenchmarkContext], Any]] = {}
+
+
+def scenario(name: str) -> Callable:
+    """Register a benchmark scenario under `name`."""
+
+    def decorator(func: Callable[[BenchmarkContext], Any]) -> Callable[[BenchmarkContext], Any]:
+        SCENARIOS[name] = func
+        return func
+
+    return decorator
+
+
+def measure(name: str, func: Callable[[], Any], size: int, repeat: int) -> BenchmarkResult:
+    """Run `func` `repeat` times, each inside a rolled back transaction so runs are independent."""
+    result = BenchmarkResult(name=name, size=size)
+
+    for _ in range(repeat):
+        with transaction.atomic():
+            with CaptureQueriesContext(connection) as queries:
+                start = time.perf_counter()
+                func()
+                result.timings_ms.append((time.perf_counter() - start) * 1000)
+            result.queries = len(queries)
+            transaction.set_rollback(True)
+
+    return result
+
+
+# ----------------------------------------------------
+# Scenarios
+# ----------------------------------------------------
+@scenario("vcard_parse")
+def vcard_parse(context: BenchmarkContext) -> None:
+    content = context.vcard_content.decode("utf-8")
+    for vcard in vobject.readComponents(content):
+        VCardAdapter(vcard).to_contact_dict()
+
+
+@scenario("vcard_parse_latin1")
+def vcard_parse_latin1(context: BenchmarkContext) -> None:
+    content = context.latin1_vcard_content.decode("latin-1")
+    for vcard in vobject.readComponents(content):
+        VCardAdapter(vcard).to_contact_dict()
+
+
+@scenario("vcard_import")
+def vcard_import(context: BenchmarkContext) -> None:
+    from apps.contact.tasks import task_save_contact
+
+    vcard_file = SimpleUploadedFile("benchmark.vcf", context.vcard_content, content_type="text/vcard")
+
+    # Run the save tasks inline instead of going through the broker
+    with mock.patch.object(
+        task_save_contact, "delay", side_effect=lambda **kwargs: task_save_contact.apply(kwargs=kwargs)
+    ):
+        VCardImportService(user=context.user, vcard_file=vcard_file).save_vcards()
+
+
+@scenario("contact_search")
+def contact_search(context: BenchmarkContext) -> None:
+    for keyword in ("ahmet", "smith", "+90532", "example.com"):
+        list(Contact.search(context.user, keyword)[:100])
+
+
+@scenario("duplicate_detection")
+def duplicate_detection(context: BenchmarkContext) -> None:
+    list(Contact.objects.duplicate_numbers(context.user.id))
+
+
+@scenario("contact_list_pagination")
+def contact_list_pagination(context: BenchmarkContext) -> None:
+    factory = APIRequestFactory()
+    view = ContactListAPIView.as_view()
+    last_page = max(context.size // 25, 1)
+
+    for page in (1, last_page // 2 or 1, last_page):
+        request = factory.get("/api/v1/contact/list", {"page": page})
+        force_authenticate(request, user=context.user)
+        view(request).render()
+
+
+@scenario("monthly_expense_report")
+def monthly_expense_report(context: BenchmarkContext) -> None:
+    from apps.reminder.tasks import monthly_subscription_expense_report
+    from core.services.exchange_rates import ExchangeRateProvider, StaticExchangeRateClient
+
+    # Rates come from the local stub so upstream latency is not measured
+    with mock.patch(
+        "apps.finance.reports.ExchangeRateProvider", lambda: ExchangeRateProvider(client=StaticExchangeRateClient())
+    ), mock.patch("apps.reminder.tasks.TelegramReminderAPI"):
+        monthly_subscription_expense_report()
+
+
+@scenario("money_aggregation")
+def money_aggregation(context: BenchmarkContext) -> None:
+    from core.money import Money
+
+    # 100 Money objects per subscription, as created when aggregating reports in Python
+    amounts = [Money(f"{index % 1000}.99", "TRY") for index in range(context.size * 100)]
+    Money.sum(amounts)
+    Money.sum(amount * 2 for amount in amounts[: context.size])
+
+
+@scenario("contact_bulk_backup")
+def contact_bulk_backup(context: BenchmarkContext) -> None:
+    request = RequestFactory().post("/admin/contact/contact/bulk_backup")
+    request.user = context.user
+    request._messages = CookieStorage(request)
+
+    ContactAdmin(Contact, admin.site).bulk_backup_view(request)
+
+
+def build_context(size: int, seed: int = 42) -> BenchmarkContext:
+    """Create the benchmark user with `size` contacts and subscriptions, and the vCard payloads."""
+    user, _ = User.objects.get_or_create(
+        username="benchmark@skillforge.example", defaults={"email": "benchmark@skillforge.example"}
+    )
+    generators.create_contacts(user, size, seed=seed)
+    generators.create_subscriptions(user, size, seed=seed)
+
+    return BenchmarkContext(
+        user=user,
+        size=size,
+        vcard_content=generators.generate_vcard_file(size, seed=seed),
+        latin1_vcard_content=generators.generate_vcard_file(size, encoding="latin-1", seed=seed),
+    )
+
+
+def run_scenarios(
+    size: int,
+    repeat: int = 3,
+    names: list[str] | None = None,
+    seed: int = 42,
+) -> list[BenchmarkResult]:
+    """Seed the data and run the selected scenarios (all by default). Nothing is persisted."""
+    results = []
+
+    with transaction.atomic():
+        context = build_context(size, seed=seed)
+
+        for name in names or list(SCENARIOS):
+            results.append(measure(name, lambda: SCENARIOS[name](context), size=size, repeat=repeat))
+
+        transaction.set_rollback(True)
+
+    return results
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from django.contrib import admin
+
+from core.pagination import EstimatedCountPaginator
+
+
+class LargeTableAdminMixin:
+    """ModelAdmin mixin for changelists backed by large tables.
+
+    - Uses an estimated row count instead of `SELECT COUNT(*)` for the unfiltered changelist
+    - Skips the second "full result" count query when filters are applied
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+class InputListFilter(admin.SimpleListFilter):
+    """List filter rendered as a free-text input instead of a list of choices.
+
+    Unlike field-based list filters it never queries the distinct values of the column
+    when the changelist renders. `autocomplete_url_name` may point to an admin view that
+    returns `{"results": [...]}` suggestions for the typed prefix.
+    """
+
+    template = "admin/input_filter.html"
+    autocomplete_url_name: str | None = None
+
+    def lookups(self, request, model_admin):
+        return ()
+
+    def has_output(self) -> bool:
+        return True
+
+    def choices(self, changelist):
+        yield {
+            "selected": self.value() is None,
+            "value": self.value() or "",
+            "query_string": changelist.get_query_string(remove=[self.parameter_name]),
+            # Other active filters are kept as hidden inputs when the form is submitted
+            "query_parts": [
+                (key, value)
+                for key, values in changelist.get_filters_params().items()
+                for value in values
+                if key != self.parameter_name
+            ],
+            "autocomplete_url_name": self.autocomplete_url_name,
+        }
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import logging
+import time
+
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUEST_METRICS = {
+    "ENABLED": True,
+    "SERVER_TIMING": True,
+    "QUERY_BUDGET": 50,
+    "LATENCY_BUDGET_MS": 1000,
+}
+
+
+def get_request_metrics_config() -> dict[str, Any]:
+    """Return REQUEST_METRICS settings merged over the defaults."""
+    return {**DEFAULT_REQUEST_METRICS, **getattr(settings, "REQUEST_METRICS", {})}
+
+
+@dataclass
+class RequestMetrics:
+    """Per-request counters filled by RequestMetricsMiddleware and BaseAPIView.
+
+    Also acts as a `connection.execute_wrapper` so every SQL query run while
+    the request is processed is counted and timed.
+    """
+
+    started_at: float = field(default_factory=time.perf_counter)
+    query_count: int = 0
+    db_time: float = 0.0
+    serializer_time: float = 0.0
+    total_time: float = 0.0
+    view_name: str | None = None
+    query_budget: int | None = None
+    latency_budget_ms: float | None = None
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict[str, Any]) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.query_count += 1
+
+    def finish(self) -> None:
+        self.total_time = time.perf_counter() - self.started_at
+
+    @property
+    def total_ms(self) -> float:
+        return round(self.total_time * 1000, 2)
+
+    @property
+    def db_ms(self) -> float:
+        return round(self.db_time * 1000, 2)
+
+    @property
+    def serializer_ms(self) -> float:
+        return round(self.serializer_time * 1000, 2)
+
+    @property
+    def exceeded_budgets(self) -> list[str]:
+        exceeded = []
+        if self.query_budget is not None and self.query_count > self.query_budget:
+            exceeded.append("queries")
+        if self.latency_budget_ms is not None and self.total_ms > self.latency_budget_ms:
+            exceeded.append("latency")
+        return exceeded
+
+    def server_timing(self) -> str:
+        """Format the metrics as a `Server-Timing` header value."""
+        return ", ".join(
+            [
+                f'db;dur={self.db_ms};desc="{self.query_count} queries"',
+                f"serializer;dur={self.serializer_ms}",
+                f"total;dur={self.total_ms}",
+            ]
+        )
+
+    def to_log_fields(self) -> dict[str, Any]:
+        return {
+            "view": self.view_name,
+            "query_count": self.query_count,
+            "db_ms": self.db_ms,
+            "serializer_ms": self.serializer_ms,
+            "total_ms": self.total_ms,
+            "query_budget": self.query_budget,
+            "latency_budget_ms": self.latency_budget_ms,
+        }
+
+
+class RequestMetricsMiddleware:
+    """Record query count, DB time, serializer time and total time for every request.
+
+    Metrics are attached to the request as `request.metrics`, returned in a
+    `Server-Timing` header and logged as structured fields on the `core.metrics` logger.
+    Views may override the global budgets with `query_budget` / `latency_budget_ms`
+    class attributes (see `core.views.BaseAPIView`); exceeding a budget logs a warning.
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response = get_response
+        self.config = get_request_metrics_config()
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if not self.config["ENABLED"]:
+            return self.get_response(request)
+
+        metrics = RequestMetrics(
+            query_budget=self.config["QUERY_BUDGET"],
+            latency_budget_ms=self.config["LATENCY_BUDGET_MS"],
+        )
+        request.metrics = metrics  # type: ignore[attr-defined]
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(metrics))
+            response = self.get_response(request)
+
+        metrics.finish()
+
+        if self.config["SERVER_TIMING"]:
+            response["Server-Timing"] = metrics.server_timing()
+
+        log_fields = {"method": request.method, "path": request.path, "status": response.status_code}
+        log_fields.update(metrics.to_log_fields())
+
+        if exceeded := metrics.exceeded_budgets:
+            logger.warning(
+                f"Request budget exceeded ({', '.join(exceeded)}) for {request.method} {request.path}",
+                extra=log_fields,
+            )
+        else:
+            logger.info(f"{request.method} {request.path}", extra=log_fields)
+
+        return response
+
+    def process_view(self, request: HttpRequest, view_func: Callable, view_args: Any, view_kwargs: Any) -> None:
+        metrics: RequestMetrics | None = getattr(request, "metrics", None)
+        if metrics is None:
+            return None
+
+        # DRF views expose the class as `cls`, Django class-based views as `view_class`
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        metrics.view_name = getattr(view_class, "__name__", None) or getattr(view_func, "__name__", None)
+
+        if (query_budget := getattr(view_class, "query_budget", None)) is not None:
+            metrics.query_budget = query_budget
+        if (latency_budget_ms := getattr(view_class, "latency_budget_ms", None)) is not None:
+            metrics.latency_budget_ms = latency_budget_ms
+
+        return None
@@ -22,3 +22,26 @@ class BaseModel(models.Model):
 
     class Meta:
         abstract = True
+
+
+class ExchangeRate(BaseModel):
+    """Daily conversion rate from `base_currency` to `target_currency`.
+
+    Rows are written one full base-currency table at a time by
+    `core.services.exchange_rates.ExchangeRateProvider`.
+    """
+
+    base_currency = models.CharField(max_length=3)
+    target_currency = models.CharField(max_length=3)
+    rate = models.DecimalField(max_digits=20, decimal_places=8)
+    date = models.DateField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["base_currency", "date", "target_currency"], name="unique_exchange_rate_per_day"
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.base_currency}/{self.target_currency} {self.rate} ({self.date})"
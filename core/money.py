@@ -1,22 +1,35 @@
 from __future__ import annotations
 
+import datetime
 import logging
+import sys
 
+from collections.abc import Iterable
 from decimal import ROUND_HALF_EVEN, Decimal
-from typing import Any, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Union
 from moneyed import Money as MoneyedMoney, Currency
 
 from core.enums import CurrencyChoices
 
+if TYPE_CHECKING:
+    from core.services.exchange_rates import RateSource
+
 Number = Union[Decimal, float, str, int]
 
 logger = logging.getLogger(__name__)
 
 
 class Money:
-    """A class to represent money with a specific currency."""
+    """A class to represent money with a specific currency.
+
+    Instances are immutable value objects holding a Decimal already rounded to the
+    currency precision and an interned currency code. Quantizers and normalized
+    currency codes are cached per currency, and results of operations that cannot
+    change the precision (addition, subtraction, abs) skip rounding entirely.
+    """
+
+    __slots__ = ("_amount", "_currency_code")
 
-    money: MoneyedMoney
     CURRENCY_PRECISION = {
         "JPY": 0,
         "KRW": 0,
@@ -28,38 +41,176 @@ class Money:
         # Most currencies default to 2 decimals
     }
 
-    def __init__(self, amount: Union[str, int, float, Decimal], currency: str = CurrencyChoices.TRY):
+    # Caches shared by all instances: quantizer per currency code and normalized code per given code
+    _QUANTIZERS: Dict[str, Decimal] = {}
+    _CURRENCY_CODES: Dict[str, str] = {}
+
+    _amount: Decimal
+    _currency_code: str
+
+    def __init__(self, amount: Number, currency: str = CurrencyChoices.TRY):
         """Initialize Money object with automatic rounding.
 
         Args:
             amount: Monetary amount
             currency: 3-letter currency code (USD, EUR, TRY, etc.)
         """
-        currency_code = currency.upper()
+        currency_code = self._get_currency_code(currency)
 
         # Convert to Decimal first
         if isinstance(amount, str):
             amount = amount.replace(",", "").strip()
-        decimal_amount = Decimal(str(amount))
+        decimal_amount = self._to_decimal(amount)
+
+        # Round automatically to the currency precision
+        self._amount = decimal_amount.quantize(self._get_quantizer(currency_code), rounding=ROUND_HALF_EVEN)
+        self._currency_code = currency_code
+
+    @classmethod
+    def from_quantized(cls, amount: Decimal, currency: str = CurrencyChoices.TRY) -> Money:
+        """Create Money from a Decimal that is already rounded to the currency precision.
+
+        No conversion or rounding is done, e.g. for sums returned by the database
+        for a column with the currency's decimal places.
+        """
+        money = object.__new__(cls)
+        money._amount = amount
+        money._currency_code = cls._get_currency_code(currency)
+        return money
+
+    @classmethod
+    def _get_currency_code(cls, currency: str) -> str:
+        try:
+            return cls._CURRENCY_CODES[currency]
+        except KeyError:
+            code = cls._CURRENCY_CODES[currency] = sys.intern(str(currency).upper())
+            return code
+
+    @classmethod
+    def _get_quantizer(cls, currency_code: str) -> Decimal:
+        try:
+            return cls._QUANTIZERS[currency_code]
+        except KeyError:
+            precision = cls.CURRENCY_PRECISION.get(currency_code, 2)
+            quantizer = cls._QUANTIZERS[currency_code] = Decimal(1).scaleb(-precision)
+            return quantizer
+
+    @staticmethod
+    def _to_decimal(value: Number) -> Decimal:
+        if isinstance(value, Decimal):
+            return value
+        if isinstance(value, int):
+            return Decimal(value)
+        # Floats go through str so 99.99 stays 99.99 instead of its binary approximation
+        return Decimal(str(value))
+
+    @classmethod
+    def round_amount(cls, amount: Decimal, currency: str) -> Decimal:
+        """Round a Decimal amount to the precision of `currency` (ROUND_HALF_EVEN)."""
+        return amount.quantize(cls._get_quantizer(cls._get_currency_code(currency)), rounding=ROUND_HALF_EVEN)
+
+    @classmethod
+    def sum(cls, moneys: Iterable[Money], currency: str | None = None) -> Money:
+        """Add up Money objects of one currency without creating intermediate instances.
+
+        Args:
+            moneys: Money objects to add
+            currency: Currency of the result, taken from the first item when not given
+                (TRY for an empty iterable)
 
-        # Get currency precision and round automatically
-        precision = self.CURRENCY_PRECISION.get(currency_code, 2)
-        quantizer = Decimal("0.1") ** precision
-        rounded_amount = decimal_amount.quantize(quantizer, rounding=ROUND_HALF_EVEN)
+        Returns:
+            Money: The total
 
-        # Create internal moneyed object
-        self.money = MoneyedMoney(rounded_amount, Currency(currency_code))
+        Raises:
+            TypeError: If an item has a different currency
+        """
+        currency_code = cls._get_currency_code(currency) if currency else None
+        total = None
+
+        for money in moneys:
+            if currency_code is None:
+                currency_code = money._currency_code
+            elif money._currency_code is not currency_code and money._currency_code != currency_code:
+                raise TypeError("Cannot add or subtract two Money instances with different currencies.")
+            total = money._amount if total is None else total + money._amount
+
+        if currency_code is None:
+            currency_code = cls._get_currency_code(CurrencyChoices.TRY)
+        if total is None:
+            total = Decimal(0).quantize(cls._get_quantizer(currency_code))
+        return cls.from_quantized(total, currency_code)
+
+    @classmethod
+    def convert_many(
+        cls,
+        moneys: Iterable[Money],
+        currency: str,
+        on: datetime.date | None = None,
+        rate_source: RateSource | None = None,
+    ) -> list[Money]:
+        """Convert Money objects to `currency`, looking up each distinct source currency's rate once.
+
+        Args:
+            moneys: Money objects to convert, in any currencies
+            currency: Target currency
+            on: Date of the rates, today by default
+            rate_source: Rate source, `settings.EXCHANGE_RATE_SOURCE` by default
+
+        Returns:
+            list[Money]: Converted objects in the order of `moneys`
+
+        Raises:
+            ValueError: If a rate is not available
+        """
+        currency_code = cls._get_currency_code(currency)
+        rates: Dict[str, Decimal] = {}
+        converted = []
+
+        for money in moneys:
+            if money._currency_code == currency_code:
+                converted.append(money)
+                continue
+
+            rate = rates.get(money._currency_code)
+            if rate is None:
+                rate_source = rate_source or _get_rate_source()
+                rate = rates[money._currency_code] = rate_source.get_rate(money._currency_code, currency_code, on=on)
+            converted.append(cls(money._amount * rate, currency_code))
+
+        return converted
 
     @property
     def amount(self) -> Decimal:
         """Get the amount as Decimal"""
 
-        return self.money.amount
+        return self._amount
 
     @property
     def currency_code(self) -> str:
         """Get currency code as string"""
-        return str(self.money.currency.code)
+        return self._currency_code
+
+    @property
+    def money(self) -> MoneyedMoney:
+        """Equivalent py-moneyed object, for libraries expecting one"""
+        return MoneyedMoney(self._amount, Currency(self._currency_code))
+
+    def convert_to(
+        self,
+        currency: str,
+        on: datetime.date | None = None,
+        rate_source: RateSource | None = None,
+    ) -> Money:
+        """Convert to `currency` with the rate of the day `on` (default: today), rounded to the target precision.
+
+        Raises:
+            ValueError: If the rate is not available
+        """
+        return self.convert_many([self], currency, on=on, rate_source=rate_source)[0]
+
+    def _check_currency(self, other: Money, message: str) -> None:
+        if other._currency_code is not self._currency_code and other._currency_code != self._currency_code:
+            raise TypeError(message)
 
     # ----------------------------------------------------
     # String representations
@@ -67,31 +218,30 @@ class Money:
     def __str__(self) -> str:
         """String representation of Money object"""
 
-        return f"{self.amount} {self.currency_code}"
+        return f"{self._amount} {self._currency_code}"
 
     def __repr__(self) -> str:
         """Detailed string representation for debugging"""
 
-        return f"Money(amount={self.amount}, currency='{self.currency_code}')"
+        return f"Money(amount={self._amount}, currency='{self._currency_code}')"
 
     # ----------------------------------------------------
     # Arithmetic operations
     # ----------------------------------------------------
     def __add__(self, other: Money) -> Money:
-
         """Add two money objects."""
-        result = self.money + other.money
-        return Money(result.amount, str(result.currency))
+        self._check_currency(other, "Cannot add or subtract two Money instances with different currencies.")
+        return Money.from_quantized(self._amount + other._amount, self._currency_code)
 
     def __sub__(self, other: Money) -> Money:
         """Subtract two money objects."""
-        result = self.money - other.money
-        return Money(result.amount, str(result.currency))
+        self._check_currency(other, "Cannot add or subtract two Money instances with different currencies.")
+        return Money.from_quantized(self._amount - other._amount, self._currency_code)
 
     def __mul__(self, multiplier: Union[int, float, Decimal]) -> Money:
         """Multiply money by number."""
-        result_amount = self.amount * Decimal(str(multiplier))
-        return Money(result_amount, self.currency_code)
+        result_amount = self._amount * self._to_decimal(multiplier)
+        return Money(result_amount, self._currency_code)
 
     def __rmul__(self, multiplier: Union[int, float, Decimal]) -> Money:
         """Right multiply."""
@@ -101,8 +251,8 @@ class Money:
         """Divide money by number."""
         if divisor == 0:
             raise ValueError("Cannot divide by zero")
-        result_amount = self.amount / Decimal(str(divisor))
-        return Money(result_amount, self.currency_code)
+        result_amount = self._amount / self._to_decimal(divisor)
+        return Money(result_amount, self._currency_code)
 
     # ----------------------------------------------------
     # Comparison operations
@@ -111,34 +261,41 @@ class Money:
         """Check equality."""
         if not isinstance(other, Money):
             return False
-        return self.money == other.money
+        return self._currency_code == other._currency_code and self._amount == other._amount
+
+    def __hash__(self) -> int:
+        return hash((self._amount, self._currency_code))
 
     def __lt__(self, other: Money) -> bool:
         """Less than."""
-        return self.money < other.money
+        self._check_currency(other, "Cannot compare Money with different currencies.")
+        return self._amount < other._amount
 
     def __le__(self, other: Money) -> bool:
         """Less than or equal."""
-        return self.money <= other.money
+        self._check_currency(other, "Cannot compare Money with different currencies.")
+        return self._amount <= other._amount
 
     def __gt__(self, other: Money) -> bool:
         """Greater than."""
-        return self.money > other.money
+        self._check_currency(other, "Cannot compare Money with different currencies.")
+        return self._amount > other._amount
 
     def __ge__(self, other: Money) -> bool:
         """Greater than or equal."""
-        return self.money >= other.money
+        self._check_currency(other, "Cannot compare Money with different currencies.")
+        return self._amount >= other._amount
 
     # ----------------------------------------------------
     # Utility methods
     # ----------------------------------------------------
     def abs(self) -> Money:
         """Return absolute value."""
-        return Money(abs(self.amount), self.currency_code)
+        return Money.from_quantized(abs(self._amount), self._currency_code)
 
     def copy(self) -> Money:
         """Create a copy of this Money object."""
-        return Money(self.amount, self.currency_code)
+        return Money.from_quantized(self._amount, self._currency_code)
 
     # ----------------------------------------------------
     # Serialization
@@ -146,9 +303,16 @@ class Money:
     def to_dict(self) -> dict:
         """Convert Money object to dictionary representation"""
 
-        return {"amount": str(self.amount), "currency": self.currency_code}
+        return {"amount": str(self._amount), "currency": self._currency_code}
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Money:
         """Create Money from dictionary."""
-        return cls(data['amount'], data['currency'])
+        return cls(data["amount"], data["currency"])
+
+
+def _get_rate_source() -> RateSource:
+    # Imported lazily so Money does not load Django models on import
+    from core.services.exchange_rates import get_rate_source
+
+    return get_rate_source()
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from typing import Any
@@ -39,3 +42,41 @@ class CustomPageNumberPagination(PageNumberPagination):
                 },
             }
         )
+
+
+class EstimatedCountPaginator(Paginator):
+    """Django paginator that avoids `SELECT COUNT(*)` on large, unfiltered tables.
+
+    When the queryset has no WHERE clause, the row count is read from PostgreSQL's
+    planner statistics (`pg_class.reltuples`), which is refreshed by autovacuum/ANALYZE.
+    Filtered querysets and small tables (below `estimate_threshold`) still use an exact count.
+    """
+
+    estimate_threshold = 10_000
+
+    @cached_property
+    def count(self) -> int:
+        query = getattr(self.object_list, "query", None)
+
+        if query is not None and not query.where:
+            estimate = self._estimated_table_count()
+            if estimate >= self.estimate_threshold:
+                return estimate
+
+        return super().count
+
+    def _estimated_table_count(self) -> int:
+        """Return the planner's row estimate for the queryset's table, 0 if unavailable."""
+        connection = connections[self.object_list.db]
+        if connection.vendor != "postgresql":
+            return 0
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                [self.object_list.model._meta.db_table],
+            )
+            row = cursor.fetchone()
+
+        # reltuples is -1 for tables that have never been analyzed
+        return max(int(row[0]), 0) if row else 0
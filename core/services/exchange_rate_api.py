@@ -54,3 +54,32 @@ class ExchangeRateAPI:
             return Decimal("0")
 
         return Decimal(conversion_rate).quantize(Decimal("0.01"))
+
+    def get_latest_rates(self, base_currency: str, target_date: datetime.date | None = None) -> dict[str, Decimal]:
+        """Fetch the whole conversion table of `base_currency` in one request.
+
+        Returns:
+            dict: Rates keyed by target currency code, empty if the request failed
+        """
+        url = self.base_url
+
+        if target_date:
+            url += f"/history/{base_currency}/{target_date.year}/{target_date.month}/{target_date.day}"
+        else:
+            url += f"/latest/{base_currency}"
+
+        try:
+            response = requests.get(url, timeout=self.DEFAULT_TIMEOUT)
+        except requests.RequestException as err:
+            logger.error(f"Failed to fetch exchange rates for {base_currency} on {target_date}: {err}")
+            return {}
+
+        if not response.ok:
+            logger.error(
+                f"Failed to fetch exchange rates for {base_currency} on {target_date}. "
+                f"Status code: {response.status_code}, Response: {response.text}"
+            )
+            return {}
+
+        conversion_rates = response.json().get("conversion_rates") or {}
+        return {currency: Decimal(str(rate)) for currency, rate in conversion_rates.items()}
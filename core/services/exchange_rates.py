@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import datetime
+import logging
+import time
+
+from decimal import Decimal
+from typing import Protocol
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.module_loading import import_string
+
+from core.models import ExchangeRate
+
+
+logger = logging.getLogger(__name__)
+
+# Matches ExchangeRate.rate decimal places
+RATE_PRECISION = Decimal("0.00000001")
+
+
+class ExchangeRateClient(Protocol):
+    """Upstream source of full conversion tables (see `ExchangeRateAPI.get_latest_rates`)."""
+
+    def get_latest_rates(self, base_currency: str, target_date: datetime.date | None = None) -> dict[str, Decimal]: ...
+
+
+class StaticExchangeRateClient:
+    """Local stand-in for the upstream API, used by tests and offline development.
+
+    Rates are derived from `RATES_TO_TRY` (or the `rates` argument), so any pair
+    of the configured currencies can be converted without network access.
+    """
+
+    RATES_TO_TRY = {
+        "TRY": Decimal("1"),
+        "USD": Decimal("40.00"),
+        "EUR": Decimal("45.00"),
+        "GBP": Decimal("52.00"),
+    }
+
+    def __init__(self, rates: dict[str, Decimal] | None = None):
+        self.rates_to_try = rates or self.RATES_TO_TRY
+        self.calls: list[tuple[str, datetime.date | None]] = []
+
+    def get_latest_rates(self, base_currency: str, target_date: datetime.date | None = None) -> dict[str, Decimal]:
+        self.calls.append((base_currency, target_date))
+
+        if base_currency not in self.rates_to_try:
+            return {}
+
+        base_to_try = self.rates_to_try[base_currency]
+        return {currency: base_to_try / rate_to_try for currency, rate_to_try in self.rates_to_try.items()}
+
+
+class RateSource(Protocol):
+    """Anything converting one unit of `base_currency` into `target_currency` (see `core.money.Money.convert_to`)."""
+
+    def get_rate(self, base_currency: str, target_currency: str, on: datetime.date | None = None) -> Decimal: ...
+
+
+def get_exchange_rate_client() -> ExchangeRateClient:
+    """Instantiate the client configured by `settings.EXCHANGE_RATE_CLIENT`."""
+    return import_string(settings.EXCHANGE_RATE_CLIENT)()
+
+
+def get_rate_source() -> RateSource:
+    """Instantiate the rate source configured by `settings.EXCHANGE_RATE_SOURCE`."""
+    return import_string(settings.EXCHANGE_RATE_SOURCE)()
+
+
+class ExchangeRateProvider:
+    """Daily exchange rates backed by the `ExchangeRate` table and the cache.
+
+    Lookups go process memo -> cache -> database -> upstream. Upstream is asked for
+    the full table of a base currency at once, and only by the worker holding the
+    single-flight lock; the others wait for the cache to be filled. If upstream
+    fails the most recent stored table is used.
+
+    One provider is meant to be reused for a whole task or request, e.g.:
+        provider = ExchangeRateProvider()
+        for subscription in subscriptions:
+            rate = provider.get_rate(subscription.currency, CurrencyChoices.TRY)
+    """
+
+    CACHE_KEY = "exchange_rates:{base_currency}:{date}"
+    CACHE_TIMEOUT = 60 * 60 * 6
+    LOCK_KEY = "exchange_rates:lock:{base_currency}:{date}"
+    LOCK_TIMEOUT = 60
+    LOCK_WAIT_SECONDS = 10
+    LOCK_POLL_INTERVAL = 0.1
+
+    def __init__(self, client: ExchangeRateClient | None = None):
+        self._client = client
+        self._rates: dict[tuple[str, datetime.date], dict[str, Decimal]] = {}
+
+    @property
+    def client(self) -> ExchangeRateClient:
+        # Created lazily so cached lookups don't require API credentials
+        if self._client is None:
+            self._client = get_exchange_rate_client()
+        return self._client
+
+    def get_rate(self, base_currency: str, target_currency: str, on: datetime.date | None = None) -> Decimal:
+        """Return the rate converting one unit of `base_currency` into `target_currency`.
+
+        Raises:
+            ValueError: If no rate is available for the pair
+        """
+        if base_currency == target_currency:
+            return Decimal("1")
+
+        rates = self.get_rates(base_currency, on=on)
+        if target_currency not in rates:
+            raise ValueError(f"No exchange rate available for {base_currency} to {target_currency}")
+
+        return rates[target_currency]
+
+    def get_rates(self, base_currency: str, on: datetime.date | None = None) -> dict[str, Decimal]:
+        """Return the full conversion table of `base_currency` for the day `on` (default: today).
+
+        Raises:
+            ValueError: If neither upstream nor the database has rates for `base_currency`
+        """
+        on = on or datetime.date.today()
+        memo_key = (base_currency, on)
+
+        if memo_key not in self._rates:
+            self._rates[memo_key] = self._load_rates(base_currency, on)
+
+        return self._rates[memo_key]
+
+    def _load_rates(self, base_currency: str, on: datetime.date) -> dict[str, Decimal]:
+        cache_key = self.CACHE_KEY.format(base_currency=base_currency, date=on.isoformat())
+
+        if rates := cache.get(cache_key):
+            return rates
+
+        if rates := self._get_stored_rates(base_currency, on):
+            cache.set(cache_key, rates, timeout=self.CACHE_TIMEOUT)
+            return rates
+
+        lock_key = self.LOCK_KEY.format(base_currency=base_currency, date=on.isoformat())
+        if cache.add(lock_key, True, timeout=self.LOCK_TIMEOUT):
+            try:
+                rates = self._fetch_rates(base_currency, on)
+                if rates:
+                    cache.set(cache_key, rates, timeout=self.CACHE_TIMEOUT)
+            finally:
+                cache.delete(lock_key)
+        else:
+            rates = self._wait_for_rates(cache_key)
+
+        if rates:
+            return rates
+
+        return self._get_latest_stored_rates(base_currency, on)
+
+    def _fetch_rates(self, base_currency: str, on: datetime.date) -> dict[str, Decimal]:
+        """Fetch the table from upstream and persist it for the day."""
+        target_date = None if on == datetime.date.today() else on
+        rates = {
+            currency: rate.quantize(RATE_PRECISION)
+            for currency, rate in self.client.get_latest_rates(base_currency, target_date).items()
+        }
+
+        if not rates:
+            return {}
+
+        ExchangeRate.objects.bulk_create(
+            [
+                ExchangeRate(base_currency=base_currency, target_currency=currency, rate=rate, date=on)
+                for currency, rate in rates.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["base_currency", "date", "target_currency"],
+            update_fields=["rate", "last_updated"],
+        )
+        logger.info(f"Stored {len(rates)} exchange rates for {base_currency} on {on}")
+        return rates
+
+    def _wait_for_rates(self, cache_key: str) -> dict[str, Decimal]:
+        """Wait for the lock holder to fill the cache."""
+        deadline = time.monotonic() + self.LOCK_WAIT_SECONDS
+
+        while time.monotonic() < deadline:
+            time.sleep(self.LOCK_POLL_INTERVAL)
+            if rates := cache.get(cache_key):
+                return rates
+
+        logger.warning(f"Timed out waiting for exchange rates {cache_key}")
+        return {}
+
+    def _get_stored_rates(self, base_currency: str, on: datetime.date) -> dict[str, Decimal]:
+        return dict(
+            ExchangeRate.objects.filter(base_currency=base_currency, date=on).values_list("target_currency", "rate")
+        )
+
+    def _get_latest_stored_rates(self, base_currency: str, on: datetime.date) -> dict[str, Decimal]:
+        latest_date = (
+            ExchangeRate.objects.filter(base_currency=base_currency, date__lte=on)
+            .order_by("-date")
+            .values_list("date", flat=True)
+            .first()
+        )
+        if latest_date is None:
+            raise ValueError(f"No exchange rates available for {base_currency}")
+
+        logger.warning(f"Using stored exchange rates of {latest_date} for {base_currency} on {on}")
+        return self._get_stored_rates(base_currency, latest_date)
+
+
+class CrossRateProvider(ExchangeRateProvider):
+    """Exchange rates of any currency pair derived from the daily table of one pivot currency.
+
+    Converting between N currencies needs a single stored/upstream table per day instead
+    of one per base currency: rate(A -> B) = pivot_rate(B) / pivot_rate(A). Derived rates
+    are memoized per (base, target, date) and rounded like stored rates.
+    """
+
+    def __init__(self, client: ExchangeRateClient | None = None, pivot_currency: str | None = None):
+        super().__init__(client=client)
+        self.pivot_currency = pivot_currency or settings.EXCHANGE_RATE_PIVOT_CURRENCY
+        self._cross_rates: dict[tuple[str, str, datetime.date], Decimal] = {}
+
+    def get_rate(self, base_currency: str, target_currency: str, on: datetime.date | None = None) -> Decimal:
+        """Return the rate converting one unit of `base_currency` into `target_currency`.
+
+        Raises:
+            ValueError: If the pivot table has no rate for either currency
+        """
+        if base_currency == target_currency:
+            return Decimal("1")
+
+        on = on or datetime.date.today()
+        memo_key = (base_currency, target_currency, on)
+
+        if memo_key not in self._cross_rates:
+            pivot_rates = {**self.get_rates(self.pivot_currency, on=on), self.pivot_currency: Decimal("1")}
+            if base_currency not in pivot_rates or target_currency not in pivot_rates:
+                raise ValueError(f"No exchange rate available for {base_currency} to {target_currency}")
+
+            self._cross_rates[memo_key] = (pivot_rates[target_currency] / pivot_rates[base_currency]).quantize(
+                RATE_PRECISION
+            )
+
+        return self._cross_rates[memo_key]
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Type
+import time
+
+from contextlib import contextmanager
+from typing import Any, Iterator, Type
 
 from django.conf import settings
 from rest_framework.exceptions import (
@@ -64,12 +67,29 @@ class BaseAPIView(GenericAPIView):
 
     Parent class for specialized views (BaseListAPIView, BaseCreateAPIView, etc.)
     that follow SOLID principles while maintaining uniform API behavior.
+
+    Per-view budgets for `core.metrics.RequestMetricsMiddleware` can be set with
+    `query_budget` and `latency_budget_ms`; `None` falls back to settings.REQUEST_METRICS.
     """
 
+    query_budget: int | None = None
+    latency_budget_ms: float | None = None
+
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.logger = logging.getLogger(__name__)
 
+    @contextmanager
+    def track_serializer(self) -> Iterator[None]:
+        """Add the time spent inside the block to the request's serializer time."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            metrics = getattr(self.request, "metrics", None)
+            if metrics is not None:
+                metrics.serializer_time += time.perf_counter() - start
+
     def success_response(
         self,
         data: dict | list | None = None,
@@ -91,9 +111,13 @@ class BaseAPIView(GenericAPIView):
         error_message: str = "",
         status_code: int = 400,
         exception_msg: str | None = None,
+        errors: dict | list | None = None,
     ) -> Response:
         response_data: dict[str, Any] = {"success": False, "detail": error_message}
 
+        if errors is not None:
+            response_data["errors"] = errors
+
         if exception_msg and settings.DEBUG:
             response_data["exception_msg"] = exception_msg
 
@@ -121,11 +145,13 @@ class BaseListAPIView(mixins.ListModelMixin, BaseAPIView):
         # Check if pagination is enabled and used
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            with self.track_serializer():
+                data = self.get_serializer(page, many=True).data
+            return self.get_paginated_response(data)
 
-        serializer = self.get_serializer(queryset, many=True)
-        return self.success_response(data=serializer.data)
+        with self.track_serializer():
+            data = self.get_serializer(queryset, many=True).data
+        return self.success_response(data=data)
 
 
 class BaseCreateAPIView(mixins.CreateModelMixin, BaseAPIView):
@@ -136,7 +162,8 @@ class BaseCreateAPIView(mixins.CreateModelMixin, BaseAPIView):
 
     def create(self, request, *args, **kwargs) -> Response:
         serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        with self.track_serializer():
+            serializer.is_valid(raise_exception=True)
         self.perform_create(serializer)
 
         return self.success_response(status_code=status.HTTP_201_CREATED, message="Resource created successfully")
@@ -150,8 +177,9 @@ class BaseRetrieveAPIView(mixins.RetrieveModelMixin, BaseAPIView):
 
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
-        serializer = self.get_serializer(instance)
-        return self.success_response(data=serializer.data)
+        with self.track_serializer():
+            data = self.get_serializer(instance).data
+        return self.success_response(data=data)
 
 
 class BaseUpdateAPIView(mixins.UpdateModelMixin, BaseAPIView):
@@ -167,7 +195,10 @@ class BaseUpdateAPIView(mixins.UpdateModelMixin, BaseAPIView):
         partial = kwargs.pop("partial", False)
         instance = self.get_object()
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
-        serializer.is_valid(raise_exception=True)
+        with self.track_serializer():
+            serializer.is_valid(raise_exception=True)
         self.perform_update(serializer)
 
-        return self.success_response(data=serializer.data, message="Resource updated successfully")
+        with self.track_serializer():
+            data = serializer.data
+        return self.success_response(data=data, message="Resource updated successfully")
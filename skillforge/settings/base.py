@@ -19,6 +19,8 @@ from datetime import timedelta
 import os
 from pathlib import Path
 
+from celery.schedules import crontab
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -66,6 +68,7 @@ THIRD_PARTY_APPS = [
 INSTALLED_APPS = DJANGO_APPS + LOCAL_APPS + THIRD_PARTY_APPS
 
 MIDDLEWARE = [
+    "core.metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -221,13 +224,32 @@ CACHES = {
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
 
+# Request metrics (core.metrics.RequestMetricsMiddleware)
+# Budgets can be overridden per view with `query_budget` / `latency_budget_ms`
+REQUEST_METRICS = {
+    "ENABLED": True,
+    "SERVER_TIMING": True,
+    "QUERY_BUDGET": int(os.environ.get("REQUEST_QUERY_BUDGET", 50)),
+    "LATENCY_BUDGET_MS": int(os.environ.get("REQUEST_LATENCY_BUDGET_MS", 1000)),
+}
+
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
+    'formatters': {
+        'json': {
+            '()': 'pythonjsonlogger.json.JsonFormatter',
+            'fmt': '%(asctime)s %(levelname)s %(name)s %(message)s',
+        },
+    },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler',
         },
+        'json_console': {
+            'class': 'logging.StreamHandler',
+            'formatter': 'json',
+        },
     },
     'root': {
         'handlers': ['console'],
@@ -244,6 +266,11 @@ LOGGING = {
             'level': 'INFO',
             'propagate': False,
         },
+        'core.metrics': {
+            'handlers': ['json_console'],
+            'level': 'INFO',
+            'propagate': False,
+        },
     },
 }
 
@@ -264,12 +291,35 @@ CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
+# Telegram replies run on their own workers (celery -A skillforge worker -Q telegram)
+# so slow AI answers never delay the other tasks
+CELERY_TASK_ROUTES = {
+    "task_process_telegram_updates": {"queue": "telegram"},
+}
+
 # Telegram Bot Configuration
 TELEGRAM_REMINDER_BOT_TOKEN = os.environ.get("TELEGRAM_REMINDER_BOT_TOKEN")
 TELEGRAM_REMINDER_CHAT_ID = os.environ.get("TELEGRAM_REMINDER_CHAT_ID")
+# Send reminders of users without a linked chat to TELEGRAM_REMINDER_CHAT_ID; everyone in that chat reads them,
+# so only enable it for a single-user or staff-only deployment
+TELEGRAM_REMINDER_SHARED_CHAT_FALLBACK = (
+    os.environ.get("TELEGRAM_REMINDER_SHARED_CHAT_FALLBACK", "false").lower() == "true"
+)
+# Sent by Telegram in X-Telegram-Bot-Api-Secret-Token when set as the webhook `secret_token`
+TELEGRAM_WEBHOOK_SECRET = os.environ.get("TELEGRAM_WEBHOOK_SECRET")
+# Bot API server, point it at a local Bot API server or a fake one in tests
+TELEGRAM_API_BASE_URL = os.environ.get("TELEGRAM_API_BASE_URL", "https://api.telegram.org")
 
 # Exchange Rate API Configuration
 EXCHANGE_RATE_API_KEY = os.environ.get("EXCHANGE_RATE_API_KEY")
+# Upstream client used by core.services.exchange_rates.ExchangeRateProvider
+EXCHANGE_RATE_CLIENT = os.environ.get("EXCHANGE_RATE_CLIENT", "core.services.exchange_rate_api.ExchangeRateAPI")
+# Rate source used by core.money.Money.convert_to / convert_many; all pairs come from the pivot currency table
+EXCHANGE_RATE_SOURCE = os.environ.get("EXCHANGE_RATE_SOURCE", "core.services.exchange_rates.CrossRateProvider")
+EXCHANGE_RATE_PIVOT_CURRENCY = os.environ.get("EXCHANGE_RATE_PIVOT_CURRENCY", "USD")
+
+# How often a process compares its in-memory service catalog with the shared version stamp
+FINANCE_CATALOG_VERSION_CHECK_SECONDS = 1
 
 
 # AI Configuration
@@ -280,4 +330,33 @@ OLLAMA_CONFIG = {
     'TIMEOUT': int(os.environ.get('OLLAMA_TIMEOUT', 30)),
     'MAX_TOKENS': int(os.environ.get('OLLAMA_MAX_TOKENS', 1000)),
     'TEMPERATURE': float(os.environ.get('OLLAMA_TEMPERATURE', 0.7)),
+    # How long a model stays loaded after a request; a loaded model reuses the evaluated shared prompt prefix
+    'KEEP_ALIVE': os.environ.get('OLLAMA_KEEP_ALIVE', '30m'),
+    # Estimated prompt tokens the assistant's prompts are trimmed to (apps.thirdparty.ollama.prompts)
+    'PROMPT_TOKEN_BUDGET': int(os.environ.get('OLLAMA_PROMPT_TOKEN_BUDGET', 1500)),
+}
+# Inference gateway (apps.thirdparty.ollama.gateway): generations running at once across every worker, then per
+# priority lane how many requests may wait for a free slot and for how many seconds before getting a busy reply
+OLLAMA_GATEWAY = {
+    "CONCURRENCY": int(os.environ.get("OLLAMA_CONCURRENCY", 2)),
+    "MAX_QUEUE": {"interactive": 8, "batch": 32},
+    "QUEUE_TIMEOUT": {"interactive": 10, "batch": 600},
+}
+# Seconds between background health probes (apps.thirdparty.ollama.health), readers only see the cached status
+OLLAMA_HEALTH_CHECK_INTERVAL = int(os.environ.get("OLLAMA_HEALTH_CHECK_INTERVAL", 15))
+# AI answers are cached per user until their subscriptions change (apps.thirdparty.ollama.answer_cache)
+OLLAMA_ANSWER_CACHE_TIMEOUT = int(os.environ.get("OLLAMA_ANSWER_CACHE_TIMEOUT", 6 * 60 * 60))
+# When set (e.g. nomic-embed-text), reworded questions are matched by embedding similarity too
+OLLAMA_EMBEDDING_MODEL = os.environ.get("OLLAMA_EMBEDDING_MODEL", "")
+OLLAMA_ANSWER_SIMILARITY_THRESHOLD = float(os.environ.get("OLLAMA_ANSWER_SIMILARITY_THRESHOLD", 0.92))
+
+# Periodic tasks defined in code, synced into the database scheduler when beat starts
+CELERY_BEAT_SCHEDULE = {
+    "probe-ollama-health": {"task": "task_probe_ollama_health", "schedule": OLLAMA_HEALTH_CHECK_INTERVAL},
+    # Due finance reminders are claimed with SKIP LOCKED, overlapping runs never send twice
+    "dispatch-due-reminders": {"task": "task_dispatch_due_reminders", "schedule": 60},
+    # Rolls the projected charges horizon forward one day
+    "rebuild-projected-charges": {"task": "task_rebuild_projected_charges", "schedule": crontab(hour=3, minute=0)},
+    # Hands Telegram updates whose processing task was lost to a worker again
+    "requeue-stale-telegram-updates": {"task": "task_requeue_stale_telegram_updates", "schedule": 60},
 }
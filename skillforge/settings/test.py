@@ -34,6 +34,12 @@ PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
 # Use in-memory cache
 CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
+# Never call the exchange rate API from tests
+EXCHANGE_RATE_CLIENT = "core.services.exchange_rates.StaticExchangeRateClient"
+
+# Check the catalog version on every access, the cache is cleared between tests
+FINANCE_CATALOG_VERSION_CHECK_SECONDS = 0
+
 # Use console email backend
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
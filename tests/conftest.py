@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from model_bakery import baker
 from rest_framework.test import APIClient
 import ulid
@@ -12,6 +15,72 @@ from core.fields import ULIDField
 baker.generators.add(ULIDField, lambda: str(ulid.ULID()))  # type: ignore
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache (tests use the in-memory cache, shared by the whole run)."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
+# ----------------------------------------------------
+# Query budget assertions
+# ----------------------------------------------------
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    """Fail tests marked with `@pytest.mark.max_queries(n)` that run more than `n` SQL queries.
+
+    Only the test body is measured; queries run while setting up fixtures are not counted.
+    """
+    marker = item.get_closest_marker("max_queries")
+    if marker is None:
+        return (yield)
+
+    max_queries = marker.args[0] if marker.args else marker.kwargs["n"]
+    with CaptureQueriesContext(connection) as context:
+        result = yield
+
+    if len(context) > max_queries:
+        queries = "\n".join(f"  {i}. {query['sql']}" for i, query in enumerate(context.captured_queries, start=1))
+        pytest.fail(f"Expected at most {max_queries} queries, {len(context)} were executed:\n{queries}")
+    return result
+
+
+@pytest.fixture
+def count_queries(db):
+    """Fixture to count the SQL queries executed by a callable.
+
+    Returns:
+        function: A function that calls `func(*args, **kwargs)` and returns the number of queries it ran
+    """
+
+    def _count_queries(func, *args, **kwargs) -> int:
+        with CaptureQueriesContext(connection) as context:
+            func(*args, **kwargs)
+        return len(context)
+
+    return _count_queries
+
+
+@pytest.fixture
+def query_plan(db):
+    """Fixture to get the PostgreSQL plan of a queryset.
+
+    Sequential scans are disabled for the test transaction, so the plan shows whether an
+    index can answer the query even though test tables are tiny.
+
+    Returns:
+        function: A function that returns the EXPLAIN output of a queryset
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def _query_plan(queryset) -> str:
+        return queryset.explain()
+
+    return _query_plan
+
+
 @pytest.fixture
 def api_client() -> APIClient:
     """Fixture to provide an API client for testing API views.
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import datetime
+
 import pytest
 from django.urls import reverse
+from model_bakery import baker
 from rest_framework import status
 from rest_framework.test import APIClient
 
+from apps.finance.enums import SubscriptionStatusChoices
+from apps.finance.models import SubscriptionService, UserSubscription
+from apps.user.models import User
+
 
 pytestmark = pytest.mark.django_db
 
@@ -75,3 +82,25 @@ def auth_client(api_client: APIClient, login_user: dict) -> APIClient:
     client = api_client
     client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
     return client
+
+
+@pytest.fixture
+def seed_subscriptions(db):
+    """Factory fixture to create active subscriptions for a user, each with its own service.
+
+    Returns:
+        function: A function that creates `quantity` UserSubscription instances for the given user
+    """
+
+    def _seed_subscriptions(user: User, quantity: int) -> list[UserSubscription]:
+        services = baker.make(SubscriptionService, _quantity=quantity)
+        return baker.make(
+            UserSubscription,
+            user=user,
+            service=iter(services),
+            status=SubscriptionStatusChoices.ACTIVE,
+            next_billing_date=datetime.date.today(),
+            _quantity=quantity,
+        )
+
+    return _seed_subscriptions
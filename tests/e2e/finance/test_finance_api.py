@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from model_bakery import baker
+from rest_framework import status
+
+from apps.finance.catalog import catalog
+from apps.finance.models import SubscriptionService, UserSubscription
+
+
+pytestmark = [pytest.mark.django_db, pytest.mark.e2e]
+
+
+class TestSubscriptionAnalyticsAPI:
+    def test_analytics_requires_authentication(self, api_client):
+        response = api_client.get(reverse("subscription-analytics-api"))
+
+        assert response.status_code in (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+
+    def test_analytics_grouped_by_currency(self, authenticated_client, user, seed_subscriptions):
+        seed_subscriptions(user, 3)
+
+        response = authenticated_client.get(
+            reverse("subscription-analytics-api"), {"group_by": "currency", "bucket": "month"}
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.data["data"]
+        assert data["group_by"] == "currency"
+        assert sum(group["subscription_count"] for group in data["groups"]) == 3
+        assert all("buckets" in group for group in data["groups"])
+
+    def test_analytics_invalid_group_by(self, authenticated_client):
+        response = authenticated_client.get(reverse("subscription-analytics-api"), {"group_by": "planet"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_analytics_query_count_is_constant(self, authenticated_client, user, seed_subscriptions, count_queries):
+        url = reverse("subscription-analytics-api")
+
+        seed_subscriptions(user, 2)
+        baseline = count_queries(authenticated_client.get, url, {"group_by": "service"})
+
+        seed_subscriptions(user, 20)
+        cache.clear()
+        assert count_queries(authenticated_client.get, url, {"group_by": "service"}) == baseline
+
+
+class TestUserSubscriptionBulkCreateAPI:
+    @pytest.fixture
+    def services(self):
+        return [baker.make(SubscriptionService, name="Netflix"), baker.make(SubscriptionService, name="Spotify")]
+
+    def build_row(self, service, **kwargs) -> dict:
+        return {
+            "service": service,
+            "amount": "79.99",
+            "currency": "TRY",
+            "billing_cycle": "monthly",
+            "started_at": "2025-01-01",
+            "next_billing_date": "2025-02-01",
+            "status": "active",
+            "payment_method": "credit_card",
+            **kwargs,
+        }
+
+    def test_bulk_create_from_json(self, authenticated_client, user, services):
+        response = authenticated_client.post(
+            reverse("user-subscription-bulk-create-api"),
+            [self.build_row(services[0].pk), self.build_row("Spotify")],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["data"]["created"] == 2
+        assert UserSubscription.objects.filter(user=user).count() == 2
+
+    def test_bulk_create_from_csv(self, authenticated_client, user, services):
+        content = (
+            "service,amount,currency,billing_cycle,started_at,next_billing_date,status,payment_method\n"
+            "Netflix,79.99,TRY,monthly,2025-01-01,2025-02-01,active,credit_card\n"
+            f"{services[1].pk},9.99,USD,annually,2025-01-01,2026-01-01,active,paypal\n"
+        )
+        csv_file = SimpleUploadedFile("bank-export.csv", content.encode("utf-8"), content_type="text/csv")
+
+        response = authenticated_client.post(
+            reverse("user-subscription-bulk-create-api"), {"file": csv_file}, format="multipart"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert set(UserSubscription.objects.filter(user=user).values_list("currency", flat=True)) == {"TRY", "USD"}
+
+    def test_bulk_create_returns_row_errors(self, authenticated_client, user, services):
+        response = authenticated_client.post(
+            reverse("user-subscription-bulk-create-api"),
+            [self.build_row(services[0].pk), self.build_row("Unknown")],
+            format="json",
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert [error["row"] for error in response.data["errors"]] == [1]
+        assert not UserSubscription.objects.filter(user=user).exists()
+
+    def test_bulk_create_query_count_is_constant(self, authenticated_client, services, count_queries):
+        url = reverse("user-subscription-bulk-create-api")
+        extra_services = baker.make(SubscriptionService, _quantity=20)
+        catalog.get_service(services[0].pk)
+
+        baseline = count_queries(authenticated_client.post, url, [self.build_row(services[0].pk)], format="json")
+        rows = [self.build_row(service.pk) for service in extra_services]
+        assert count_queries(authenticated_client.post, url, rows, format="json") == baseline
+
+
+class TestServiceCatalogAPI:
+    def test_catalog_returns_services_with_etag(self, authenticated_client):
+        baker.make(SubscriptionService, name="Netflix")
+
+        response = authenticated_client.get(reverse("service-catalog-api"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"][0]["services"][0]["name"] == "Netflix"
+        assert response["ETag"]
+
+    def test_catalog_not_modified(self, authenticated_client):
+        baker.make(SubscriptionService, name="Netflix")
+        url = reverse("service-catalog-api")
+        etag = authenticated_client.get(url)["ETag"]
+
+        response = authenticated_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response["ETag"] == etag
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import datetime
+
+import pytest
+from model_bakery import baker
+
+from apps.contact.models import Contact
+from apps.user.models import User
+
+
+@pytest.fixture
+def seed_contacts(db):
+    """Factory fixture to create contacts for a user, with every second pair sharing a mobile phone.
+
+    Returns:
+        function: A function that creates `quantity` Contact instances for the given user
+    """
+
+    def _seed_contacts(user: User, quantity: int) -> list[Contact]:
+        start = Contact.objects.filter(user=user).count()
+        return baker.make(
+            Contact,
+            user=user,
+            first_name=iter(f"Contact {i}" for i in range(start, start + quantity)),
+            organization=iter(f"Organization {i % 5}" for i in range(start, start + quantity)),
+            mobile_phone=iter(f"+90532{i // 2:07d}" for i in range(start, start + quantity)),
+            birthday=datetime.date(1990, 1, 1),
+            _quantity=quantity,
+        )
+
+    return _seed_contacts
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import pytest
+from unittest import mock
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from rest_framework import status
+
+from apps.contact.models import Contact
+from apps.contact.tasks import task_save_contact
+from apps.contact.vcard.services import VCardImportService
+
+pytestmark = [pytest.mark.django_db, pytest.mark.e2e, pytest.mark.performance]
+
+SMALL_N = 2
+LARGE_N = 20
+
+
+@pytest.fixture
+def contacts(user, seed_contacts) -> list[Contact]:
+    return seed_contacts(user, LARGE_N)
+
+
+def build_vcard_file(quantity: int) -> SimpleUploadedFile:
+    cards = [
+        f"BEGIN:VCARD\nVERSION:3.0\nFN:Contact {i}\nN:{i};Contact;;;\nTEL;TYPE=CELL:0532{i:07d}\nEND:VCARD"
+        for i in range(quantity)
+    ]
+    return SimpleUploadedFile("contacts.vcf", "\n".join(cards).encode("utf-8"), content_type="text/vcard")
+
+
+class TestContactQueryBudgets:
+    def test_contact_list_query_count_is_constant(self, authenticated_client, user, seed_contacts, count_queries):
+        url = reverse("contact_list_api_view")
+
+        seed_contacts(user, SMALL_N)
+        baseline = count_queries(authenticated_client.get, url)
+
+        seed_contacts(user, LARGE_N)
+        assert count_queries(authenticated_client.get, url) == baseline
+
+    def test_contact_duplicates_query_count_is_constant(
+        self, authenticated_client, user, seed_contacts, count_queries
+    ):
+        url = reverse("contact_duplicate_list_api_view")
+
+        seed_contacts(user, SMALL_N)
+        baseline = count_queries(authenticated_client.get, url)
+
+        seed_contacts(user, LARGE_N)
+        assert count_queries(authenticated_client.get, url) == baseline
+
+    def test_contact_detail_query_count_is_constant(self, authenticated_client, user, seed_contacts, count_queries):
+        contact = seed_contacts(user, SMALL_N)[0]
+        url = reverse("contact_detail_api_view", kwargs={"pk": contact.pk})
+        baseline = count_queries(authenticated_client.get, url)
+
+        seed_contacts(user, LARGE_N)
+        assert count_queries(authenticated_client.get, url) == baseline
+
+    def test_contact_analytics_query_count_is_constant(self, admin_client, admin_user, seed_contacts, count_queries):
+        url = reverse("admin:contact_contact_analytics")
+
+        seed_contacts(admin_user, SMALL_N)
+        baseline = count_queries(admin_client.get, url)
+
+        seed_contacts(admin_user, LARGE_N)
+        assert count_queries(admin_client.get, url) == baseline
+
+    @pytest.mark.max_queries(2)
+    def test_contact_list_max_queries(self, authenticated_client, contacts):
+        response = authenticated_client.get(reverse("contact_list_api_view"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["count"] == LARGE_N
+
+    @pytest.mark.max_queries(1)
+    def test_contact_detail_max_queries(self, authenticated_client, contacts):
+        response = authenticated_client.get(reverse("contact_detail_api_view", kwargs={"pk": contacts[0].pk}))
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+class TestSubscriptionQueryBudgets:
+    def test_active_subscriptions_query_count_is_constant(
+        self, authenticated_client, user, seed_subscriptions, count_queries
+    ):
+        url = reverse("active-subscriptions-list-api")
+
+        seed_subscriptions(user, SMALL_N)
+        baseline = count_queries(authenticated_client.get, url)
+
+        seed_subscriptions(user, LARGE_N)
+        assert count_queries(authenticated_client.get, url) == baseline
+
+
+class TestVCardImportQueryBudgets:
+    @mock.patch("apps.contact.tasks.task_save_contact.delay")
+    def test_save_vcards_query_count_is_constant(self, mock_delay, user, count_queries):
+        small = count_queries(VCardImportService(user=user, vcard_file=build_vcard_file(SMALL_N)).save_vcards)
+        large = count_queries(VCardImportService(user=user, vcard_file=build_vcard_file(LARGE_N)).save_vcards)
+
+        assert small == large
+        assert mock_delay.call_count == SMALL_N + LARGE_N
+
+    def test_save_contact_task_query_count_does_not_grow_with_table(self, user, seed_contacts, count_queries):
+        def save_contact(index: int):
+            contact_data = {"user_id": user.id, "first_name": f"Imported {index}", "external_id": f"vcard_{index}"}
+            return task_save_contact.apply(kwargs={"contact_data": contact_data}).get()
+
+        baseline = count_queries(save_contact, 0)
+
+        seed_contacts(user, LARGE_N)
+        assert count_queries(save_contact, 1) == baseline
+        assert Contact.objects.filter(user=user, first_name__startswith="Imported").count() == 2
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+
+from apps.thirdparty.ollama.enums import CircuitStateChoices
+from apps.thirdparty.ollama.health import OllamaHealthMonitor
+
+
+pytestmark = [pytest.mark.django_db, pytest.mark.e2e]
+
+
+def cache_status(**overrides) -> None:
+    health = {
+        "status": "healthy",
+        "ready_for_chat": True,
+        "available_models": ["qwen2.5:7b"],
+        "default_model": "qwen2.5:7b",
+        "fallback_model": "phi3.5:latest",
+        "circuit_state": CircuitStateChoices.CLOSED,
+        "checked_at": "2026-01-01T12:00:00+00:00",
+    }
+    cache.set(OllamaHealthMonitor.STATUS_KEY, {**health, **overrides}, 60)
+
+
+class TestOllamaHealthCheck:
+    def test_cached_status_is_returned_without_calling_ollama(self, authenticated_client, requests_mock):
+        cache_status()
+
+        response = authenticated_client.get(reverse("ollama:health_check"))
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["data"]["circuit_state"] == CircuitStateChoices.CLOSED
+        assert requests_mock.call_count == 0
+
+    def test_open_circuit_is_reported_unavailable(self, authenticated_client, requests_mock):
+        cache_status(status="unreachable", ready_for_chat=False, circuit_state=CircuitStateChoices.OPEN)
+
+        response = authenticated_client.get(reverse("ollama:health_check"))
+
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        assert requests_mock.call_count == 0
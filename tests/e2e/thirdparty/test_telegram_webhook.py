@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from django.urls import reverse
+from rest_framework import status
+
+from apps.thirdparty.telegram.enums import TelegramUpdateStatusChoices
+from apps.thirdparty.telegram.models import TelegramUpdate
+
+
+pytestmark = [pytest.mark.django_db, pytest.mark.e2e]
+
+
+def build_update(update_id: int, chat_id: int = 42, text: str = "How much will I pay this month?") -> dict:
+    return {
+        "update_id": update_id,
+        "message": {
+            "message_id": update_id,
+            "from": {"id": chat_id, "username": "ada"},
+            "chat": {"id": chat_id, "type": "private"},
+            "date": 1750000000,
+            "text": text,
+        },
+    }
+
+
+@pytest.fixture
+def process_task():
+    with mock.patch("apps.thirdparty.telegram.webhooks.task_process_telegram_updates") as task:
+        yield task
+
+
+class TestTelegramWebhook:
+    def test_update_is_stored_and_queued(self, api_client, process_task, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post(reverse("telegram_webhook"), build_update(1), format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        update = TelegramUpdate.objects.get(update_id=1)
+        assert (update.chat_id, update.status) == (42, TelegramUpdateStatusChoices.RECEIVED)
+        assert update.payload["message"]["text"] == "How much will I pay this month?"
+        process_task.delay.assert_called_once_with(42)
+
+    def test_redelivered_update_is_not_queued_again(
+        self, api_client, process_task, django_capture_on_commit_callbacks
+    ):
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(reverse("telegram_webhook"), build_update(1), format="json")
+            response = api_client.post(reverse("telegram_webhook"), build_update(1), format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert TelegramUpdate.objects.count() == 1
+        assert process_task.delay.call_count == 1
+
+    def test_updates_without_a_chat_are_only_stored(self, api_client, process_task):
+        payload = {"update_id": 7, "inline_query": {"id": "1", "from": {"id": 42}, "query": "netflix"}}
+
+        response = api_client.post(reverse("telegram_webhook"), payload, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert TelegramUpdate.objects.get(update_id=7).status == TelegramUpdateStatusChoices.PROCESSED
+        process_task.delay.assert_not_called()
+
+    def test_secret_token_is_checked(self, api_client, process_task, settings):
+        settings.TELEGRAM_WEBHOOK_SECRET = "s3cret"
+        url = reverse("telegram_webhook")
+
+        rejected = api_client.post(url, build_update(1), format="json")
+        accepted = api_client.post(url, build_update(2), format="json", HTTP_X_TELEGRAM_BOT_API_SECRET_TOKEN="s3cret")
+
+        assert rejected.status_code == status.HTTP_403_FORBIDDEN
+        assert accepted.status_code == status.HTTP_200_OK
+        assert list(TelegramUpdate.objects.values_list("update_id", flat=True)) == [2]
+
+    def test_webhook_does_no_processing_inline(self, api_client, process_task, count_queries):
+        # One INSERT, in a savepoint so a duplicate does not break the request transaction
+        assert count_queries(api_client.post, reverse("telegram_webhook"), build_update(1), format="json") == 3
@@ -0,0 +1,35 @@
+import pytest
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.contact.models import Contact
+
+
+@pytest.mark.integration
+@pytest.mark.django_db
+class TestContactAdminIntegration:
+
+    def test_changelist_filters_by_organization(self, admin_client, admin_user):
+        baker.make(Contact, user=admin_user, first_name="Acme", organization="Acme Corp")
+        baker.make(Contact, user=admin_user, first_name="Other", organization="Other Inc")
+
+        response = admin_client.get(reverse("admin:contact_contact_changelist"), {"organization": "acme corp"})
+
+        assert response.status_code == 200
+        assert response.context["cl"].result_count == 1
+        assert response.context["cl"].show_full_result_count is False
+
+    def test_organization_autocomplete_returns_prefix_matches(self, admin_client, admin_user):
+        baker.make(Contact, user=admin_user, organization="Acme Corp", _quantity=2)
+        baker.make(Contact, user=admin_user, organization="Acme Labs")
+        baker.make(Contact, user=admin_user, organization="Other Inc")
+
+        response = admin_client.get(reverse("admin:contact_contact_organization_autocomplete"), {"term": "ac"})
+
+        assert response.status_code == 200
+        assert response.json() == {"results": ["Acme Corp", "Acme Labs"]}
+
+    def test_organization_autocomplete_requires_two_characters(self, admin_client):
+        response = admin_client.get(reverse("admin:contact_contact_organization_autocomplete"), {"term": "a"})
+
+        assert response.json() == {"results": []}
@@ -23,3 +23,48 @@ class TestVCardImportServiceIntegration:
         # Assert
         assert result is True
         assert mock_task_save_contact.call_count == 5
+
+    def test_save_vcards_stores_embedded_photos_once(
+        self, user, vcard_file_factory, settings, tmp_path, django_capture_on_commit_callbacks
+    ):
+        import base64
+        import io
+
+        from PIL import Image
+
+        from apps.contact.models import Contact
+        from apps.contact.tasks import task_save_contact, task_store_contact_photo
+
+        settings.MEDIA_ROOT = tmp_path
+        output = io.BytesIO()
+        Image.new("RGB", (300, 300), color=(10, 120, 200)).save(output, format="JPEG")
+        photo = base64.b64encode(output.getvalue()).decode("ascii")
+        vcard_content = "".join(
+            f"BEGIN:VCARD\r\nVERSION:3.0\r\nN:Doe;Person{i};;;\r\nFN:Person{i} Doe\r\n"
+            f"PHOTO;ENCODING=b;TYPE=JPEG:{photo}\r\nEND:VCARD\r\n"
+            for i in range(3)
+        )
+        service = VCardImportService(user=user, vcard_file=vcard_file_factory(vcard_content))
+
+        # Run the save (and photo) tasks inline
+        with (
+            mock.patch.object(
+                task_save_contact, "delay", side_effect=lambda **kwargs: task_save_contact.apply(kwargs=kwargs)
+            ),
+            mock.patch.object(
+                task_store_contact_photo,
+                "delay",
+                side_effect=lambda **kwargs: task_store_contact_photo.apply(kwargs=kwargs),
+            ),
+            django_capture_on_commit_callbacks(execute=True),
+        ):
+            assert service.save_vcards() is True
+
+        contacts = Contact.objects.filter(user=user)
+        assert contacts.count() == 3
+        assert len({contact.photo_hash for contact in contacts}) == 1
+        assert {contact.photo_file.name for contact in contacts} == {contacts[0].photo_file.name}
+        assert contacts[0].photo_thumbnail.name.startswith("contact_photos/thumbnails/")
+
+        # One original and one thumbnail for the three cards
+        assert len([path for path in tmp_path.rglob("*") if path.is_file()]) == 2
@@ -0,0 +1,83 @@
+import pytest
+import vobject
+
+from apps.contact.models import Contact, ContactBackup
+from apps.contact.vcard.adapter import VCardAdapter
+from apps.finance.models import UserSubscription
+from benchmarks import generators
+from benchmarks.scenarios import SCENARIOS, build_context, run_scenarios
+
+
+@pytest.mark.unit
+class TestBenchmarkGenerators:
+    """Unit tests for the benchmark data generators."""
+
+    def test_generate_vcard_file_is_reproducible(self):
+        """Test that the same seed always produces the same file"""
+        assert generators.generate_vcard_file(10, seed=1) == generators.generate_vcard_file(10, seed=1)
+
+    def test_generate_vcard_file_parses_into_cards(self):
+        """Test that every generated card is parsed, including folded lines and photos"""
+        content = generators.generate_vcard_file(50, photo_ratio=0.5).decode("utf-8")
+        vcards = list(vobject.readComponents(content))
+
+        assert len(vcards) == 50
+        assert any(hasattr(vcard, "photo") for vcard in vcards)
+        assert all(VCardAdapter(vcard).to_contact_dict()["full_name"] for vcard in vcards)
+
+    def test_generate_vcard_file_latin1_is_not_utf8(self):
+        """Test that the latin-1 file exercises the import service's decoding fallback"""
+        content = generators.generate_vcard_file(20, encoding="latin-1")
+
+        with pytest.raises(UnicodeDecodeError):
+            content.decode("utf-8")
+        assert len(list(vobject.readComponents(content.decode("latin-1")))) == 20
+
+    def test_fold_vcard_line(self):
+        """Test that long lines are folded at 75 characters with a leading space"""
+        folded = generators.fold_vcard_line("NOTE:" + "x" * 200)
+        lines = folded.split("\r\n")
+
+        assert all(len(line) <= generators.VCARD_LINE_LENGTH for line in lines)
+        assert all(line.startswith(" ") for line in lines[1:])
+        assert "".join(line.removeprefix(" ") for line in lines) == "NOTE:" + "x" * 200
+
+    @pytest.mark.django_db
+    def test_create_contacts_and_subscriptions(self, user):
+        """Test that the bulk fixtures insert the requested number of rows"""
+        generators.create_contacts(user, 30)
+        generators.create_subscriptions(user, 20)
+
+        assert Contact.objects.filter(user=user).count() == 30
+        assert UserSubscription.objects.filter(user=user).count() == 20
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestBenchmarkScenarios:
+    """Smoke tests for the benchmark scenarios."""
+
+    def test_run_scenarios_reports_every_scenario(self):
+        """Test that all scenarios run on a small data set and nothing is persisted"""
+        results = run_scenarios(size=5, repeat=1)
+
+        assert [result.name for result in results] == list(SCENARIOS)
+        assert all(result.to_dict()["median_ms"] >= 0 for result in results)
+        assert not Contact.objects.exists()
+
+    def test_vcard_import_saves_contacts(self):
+        """Test that the import scenario actually saves the generated contacts"""
+        result = run_scenarios(size=5, repeat=1, names=["vcard_import"])[0]
+
+        # One INSERT per contact, without task retries
+        assert result.queries == 5
+
+    def test_contact_bulk_backup_saves_backups(self):
+        """Test that the backup scenario backs up every contact instead of timing the failure path"""
+        context = build_context(size=5)
+
+        SCENARIOS["contact_bulk_backup"](context)
+
+        backups = ContactBackup.objects.filter(user=context.user)
+        assert backups.count() == 5
+        assert all(backup.contact_data["full_name"] for backup in backups)
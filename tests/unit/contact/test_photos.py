@@ -0,0 +1,108 @@
+import base64
+import io
+
+import pytest
+from PIL import Image
+from vobject import base as vobject
+
+from apps.contact import photos
+from apps.contact.vcard.adapter import VCardAdapter
+
+
+def make_image(image_format: str = "JPEG", size: tuple[int, int] = (640, 480)) -> bytes:
+    output = io.BytesIO()
+    Image.new("RGB", size, color=(200, 30, 30)).save(output, format=image_format)
+    return output.getvalue()
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestPhotoHelpers:
+    """Unit tests for the contact photo helpers."""
+
+    @pytest.mark.parametrize(
+        "image_format,mime_type",
+        [("JPEG", "image/jpeg"), ("PNG", "image/png"), ("GIF", "image/gif"), ("WEBP", "image/webp")],
+    )
+    def test_sniff_image_mime_type(self, image_format, mime_type):
+        """Test that the MIME type is detected from the byte header"""
+        assert photos.sniff_image_mime_type(make_image(image_format)) == mime_type
+
+    def test_sniff_image_mime_type_unknown(self):
+        """Test that unknown payloads are not guessed from their content"""
+        assert photos.sniff_image_mime_type(b"not an image, mentions JPEG and PNG") is None
+
+    def test_photo_path_is_content_addressed(self):
+        """Test that the storage path is derived from the hash and MIME type"""
+        photo_hash = photos.photo_content_hash(b"photo")
+
+        assert photos.photo_path(photo_hash, "image/png") == f"contact_photos/{photo_hash[:2]}/{photo_hash}.png"
+        assert photos.photo_path(photo_hash, None).endswith(".bin")
+
+    def test_generate_thumbnail_fits_size(self):
+        """Test that thumbnails are small JPEGs keeping the aspect ratio"""
+        thumbnail = photos.generate_thumbnail(make_image("PNG", size=(1024, 512)))
+
+        with Image.open(io.BytesIO(thumbnail)) as image:
+            assert image.format == "JPEG"
+            assert image.size == (128, 64)
+
+    def test_generate_thumbnail_invalid_image(self):
+        """Test that undecodable photos produce no thumbnail"""
+        assert photos.generate_thumbnail(b"\xff\xd8\xff\xe0 truncated") is None
+
+    def test_store_photo_deduplicates_by_hash(self, media_root):
+        """Test that storing the same photo twice writes a single file"""
+        data = make_image()
+        photo_hash = photos.photo_content_hash(data)
+
+        first = photos.store_photo(photo_hash, data)
+        second = photos.store_photo(photo_hash, data)
+
+        assert first == second
+        assert (media_root / first[0]).read_bytes() == data
+        assert (media_root / first[1]).exists()
+        assert len(list(media_root.rglob("*.jpg"))) == 2
+
+    def test_stage_photo(self):
+        """Test that raw bytes are staged once under their content hash"""
+        data = make_image()
+
+        photo_hash = photos.stage_photo(data)
+
+        assert photo_hash == photos.photo_content_hash(data)
+        assert photos.get_staged_photo(photo_hash) == data
+
+
+@pytest.mark.unit
+class TestVCardAdapterPhoto:
+    """Unit tests for the embedded photo properties of VCardAdapter."""
+
+    def make_adapter(self, data: bytes, photo_type: str = "JPEG") -> VCardAdapter:
+        content = (
+            "BEGIN:VCARD\r\nVERSION:3.0\r\nFN:Photo Contact\r\nN:Contact;Photo;;;\r\n"
+            f"PHOTO;ENCODING=b;TYPE={photo_type}:{base64.b64encode(data).decode('ascii')}\r\n"
+            "END:VCARD\r\n"
+        )
+        return VCardAdapter(vobject.readOne(content))
+
+    def test_photo_bytes(self):
+        """Test that the embedded photo is returned as raw bytes"""
+        data = make_image("PNG")
+        adapter = self.make_adapter(data, "PNG")
+
+        assert adapter.photo_bytes == data
+        assert adapter.vcard_mime_type == "image/png"
+        assert adapter.vcard_photo_base64 == base64.b64encode(data).decode("ascii")
+        assert adapter.to_contact_dict()["photo_url"] == ""
+
+    def test_mime_type_falls_back_to_type_parameter(self):
+        """Test that the TYPE parameter is used when the header is not recognised"""
+        adapter = self.make_adapter(b"\x00\x01unknown header", "GIF")
+
+        assert adapter.vcard_mime_type == "image/gif"
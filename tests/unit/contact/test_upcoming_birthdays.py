@@ -0,0 +1,86 @@
+import datetime
+
+import pytest
+from model_bakery import baker
+
+from apps.contact.models import Contact, day_of_year
+
+
+@pytest.fixture
+def make_contact(user):
+    def _make(birthday, **kwargs) -> Contact:
+        return baker.make(Contact, user=user, birthday=birthday, **kwargs)
+
+    return _make
+
+
+@pytest.mark.unit
+class TestDayOfYear:
+    """Unit tests for apps.contact.models.day_of_year."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (datetime.date(1990, 1, 1), 1),
+            (datetime.date(1990, 2, 28), 59),
+            (datetime.date(1992, 2, 29), 60),
+            (datetime.date(1990, 3, 1), 61),
+            (datetime.date(1992, 3, 1), 61),
+            (datetime.date(1990, 12, 31), 366),
+        ],
+    )
+    def test_day_of_year_ignores_leap_years(self, value, expected):
+        assert day_of_year(value) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestUpcomingBirthdays:
+    """Unit tests for ContactManager.upcoming_birthdays."""
+
+    def test_stored_day_of_year_matches_python(self, make_contact):
+        birthdays = [datetime.date(1990, 3, 1), datetime.date(1992, 2, 29), datetime.date(1985, 12, 31)]
+        for birthday in birthdays:
+            make_contact(birthday)
+
+        stored = Contact.objects.order_by("birthday").values_list("birthday", "birthday_doy")
+        assert [doy for _, doy in stored] == [day_of_year(birthday) for birthday, _ in stored]
+
+    def test_window_within_the_year(self, make_contact):
+        inside = [make_contact(datetime.date(1990, 6, 20)), make_contact(datetime.date(1980, 6, 10))]
+        make_contact(datetime.date(1990, 6, 9))
+        make_contact(datetime.date(1990, 7, 11))
+        make_contact(datetime.date(1990, 6, 15), is_active=False)
+        make_contact(None)
+
+        assert list(Contact.objects.upcoming_birthdays(datetime.date(2025, 6, 10), days=30)) == inside[::-1]
+
+    def test_window_wraps_around_the_new_year(self, make_contact):
+        december = make_contact(datetime.date(1990, 12, 25))
+        january = make_contact(datetime.date(1990, 1, 10))
+        make_contact(datetime.date(1990, 1, 25))
+        make_contact(datetime.date(1990, 12, 15))
+
+        result = Contact.objects.upcoming_birthdays(datetime.date(2025, 12, 20), days=30)
+
+        assert list(result) == [december, january]
+
+    def test_february_29_in_a_common_year(self, make_contact):
+        leap_day = make_contact(datetime.date(1992, 2, 29))
+
+        assert list(Contact.objects.upcoming_birthdays(datetime.date(2025, 2, 28), days=1)) == [leap_day]
+
+    def test_filters_by_user(self, make_contact, user_factory):
+        mine = make_contact(datetime.date(1990, 6, 20))
+        baker.make(Contact, user=user_factory(), birthday=datetime.date(1990, 6, 20))
+
+        result = Contact.objects.upcoming_birthdays(datetime.date(2025, 6, 10), days=30, user_ids=[mine.user_id])
+
+        assert list(result) == [mine]
+
+    @pytest.mark.parametrize("start", [datetime.date(2025, 6, 10), datetime.date(2025, 12, 20)])
+    def test_uses_the_birthday_index(self, user, query_plan, start):
+        plan = query_plan(Contact.objects.upcoming_birthdays(start, days=30, user_ids=[user.pk]))
+
+        assert "contact_user_birthday_doy" in plan
+        assert "Seq Scan" not in plan
@@ -0,0 +1,155 @@
+import datetime
+import threading
+
+import pytest
+from decimal import Decimal
+from unittest import mock
+
+from django.core.cache import cache
+
+from core.models import ExchangeRate
+from core.services.exchange_rate_api import ExchangeRateAPI
+from core.money import Money
+from core.services.exchange_rates import CrossRateProvider, ExchangeRateProvider, StaticExchangeRateClient
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestExchangeRateProvider:
+    """Unit tests for the cached exchange rate provider."""
+
+    def test_get_rate_fetches_base_table_once(self):
+        """Test that many lookups for the same base currency make a single upstream call"""
+        client = StaticExchangeRateClient()
+        provider = ExchangeRateProvider(client=client)
+
+        rates = [provider.get_rate("USD", "TRY") for _ in range(1000)]
+
+        assert set(rates) == {Decimal("40.00000000")}
+        assert provider.get_rate("USD", "EUR") == Decimal("0.88888889")
+        assert client.calls == [("USD", None)]
+
+    def test_same_currency_needs_no_rates(self):
+        """Test that converting a currency to itself never loads rates"""
+        client = StaticExchangeRateClient()
+
+        assert ExchangeRateProvider(client=client).get_rate("TRY", "TRY") == Decimal("1")
+        assert client.calls == []
+
+    def test_rates_are_persisted_for_the_day(self):
+        """Test that fetched tables are stored and reused by other providers and processes"""
+        ExchangeRateProvider(client=StaticExchangeRateClient()).get_rate("EUR", "TRY")
+        cache.clear()
+
+        client = StaticExchangeRateClient()
+        assert ExchangeRateProvider(client=client).get_rate("EUR", "TRY") == Decimal("45.00000000")
+        assert client.calls == []
+        assert ExchangeRate.objects.filter(base_currency="EUR", date=datetime.date.today()).count() == 4
+
+    def test_cached_rates_skip_database(self, django_assert_num_queries):
+        """Test that rates cached by another worker are read without queries"""
+        ExchangeRateProvider(client=StaticExchangeRateClient()).get_rates("USD")
+
+        with django_assert_num_queries(0):
+            assert ExchangeRateProvider(client=StaticExchangeRateClient()).get_rate("USD", "TRY") == Decimal("40")
+
+    def test_upstream_failure_falls_back_to_latest_stored_rates(self):
+        """Test that the last stored table is used when upstream returns nothing"""
+        yesterday = datetime.date.today() - datetime.timedelta(days=1)
+        ExchangeRate.objects.create(base_currency="USD", target_currency="TRY", rate=Decimal("39.5"), date=yesterday)
+
+        provider = ExchangeRateProvider(client=StaticExchangeRateClient(rates={"TRY": Decimal("1")}))
+
+        assert provider.get_rate("USD", "TRY") == Decimal("39.5")
+
+    def test_no_rates_available_raises(self):
+        """Test that a missing table without stored fallback raises ValueError"""
+        provider = ExchangeRateProvider(client=StaticExchangeRateClient(rates={"TRY": Decimal("1")}))
+
+        with pytest.raises(ValueError):
+            provider.get_rate("USD", "TRY")
+
+    def test_waiting_worker_reads_rates_filled_by_lock_holder(self):
+        """Test that a worker not holding the lock waits for the cache instead of calling upstream"""
+        today = datetime.date.today().isoformat()
+        cache.add(ExchangeRateProvider.LOCK_KEY.format(base_currency="USD", date=today), True)
+        client = StaticExchangeRateClient()
+        provider = ExchangeRateProvider(client=client)
+
+        cache_key = ExchangeRateProvider.CACHE_KEY.format(base_currency="USD", date=today)
+        timer = threading.Timer(0.2, lambda: cache.set(cache_key, {"TRY": Decimal("41")}))
+        timer.start()
+
+        with mock.patch.object(ExchangeRateProvider, "_get_stored_rates", return_value={}):
+            assert provider.get_rate("USD", "TRY") == Decimal("41")
+        timer.join()
+        assert client.calls == []
+
+    def test_default_client_comes_from_settings(self):
+        """Test that the upstream client is replaceable through EXCHANGE_RATE_CLIENT"""
+        assert isinstance(ExchangeRateProvider().client, StaticExchangeRateClient)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestCrossRateProvider:
+    """Unit tests for exchange rates derived from a pivot currency table."""
+
+    def test_cross_rates_come_from_one_pivot_table(self):
+        """Test that every pair is derived from a single upstream table"""
+        client = StaticExchangeRateClient()
+        provider = CrossRateProvider(client=client, pivot_currency="USD")
+
+        assert provider.get_rate("USD", "TRY") == Decimal("40.00000000")
+        assert provider.get_rate("TRY", "USD") == Decimal("0.02500000")
+        assert provider.get_rate("GBP", "EUR") == Decimal("1.15555556")
+        assert provider.get_rate("EUR", "TRY") == Decimal("44.99999994")
+        assert client.calls == [("USD", None)]
+
+    def test_unknown_currency_raises(self):
+        provider = CrossRateProvider(client=StaticExchangeRateClient(), pivot_currency="USD")
+
+        with pytest.raises(ValueError):
+            provider.get_rate("CHF", "TRY")
+
+    def test_default_rate_source_converts_money(self):
+        """Test that Money conversion uses the EXCHANGE_RATE_SOURCE setting"""
+        moneys = [Money("10.00", "USD"), Money("10.00", "GBP"), Money("10.00", "EUR")]
+
+        with mock.patch.object(StaticExchangeRateClient, "get_latest_rates", autospec=True) as get_latest_rates:
+            get_latest_rates.side_effect = lambda client, base, date=None: {
+                "TRY": Decimal("40"),
+                "GBP": Decimal("0.8"),
+                "EUR": Decimal("0.9"),
+            }
+            converted = Money.convert_many(moneys, "TRY")
+
+        assert converted == [Money("400.00", "TRY"), Money("500.00", "TRY"), Money("444.44", "TRY")]
+        assert get_latest_rates.call_count == 1
+
+
+@pytest.mark.unit
+class TestExchangeRateAPILatestRates:
+    """Unit tests for ExchangeRateAPI.get_latest_rates."""
+
+    @pytest.fixture
+    def api(self):
+        with mock.patch.object(ExchangeRateAPI, "EXCHANGE_RATE_API_KEY", "test-key"):
+            yield ExchangeRateAPI()
+
+    def test_get_latest_rates(self, api, requests_mock):
+        requests_mock.get(
+            "https://v6.exchangerate-api.com/v6/test-key/latest/USD",
+            json={"result": "success", "conversion_rates": {"USD": 1, "TRY": 40.1234, "EUR": 0.91}},
+        )
+
+        assert api.get_latest_rates("USD") == {
+            "USD": Decimal("1"),
+            "TRY": Decimal("40.1234"),
+            "EUR": Decimal("0.91"),
+        }
+
+    def test_get_latest_rates_failure_returns_empty(self, api, requests_mock):
+        requests_mock.get("https://v6.exchangerate-api.com/v6/test-key/latest/USD", status_code=500)
+
+        assert api.get_latest_rates("USD") == {}
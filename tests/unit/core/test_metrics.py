@@ -0,0 +1,68 @@
+import pytest
+from unittest import mock
+from django.urls import reverse
+from model_bakery import baker
+
+from apps.contact.models import Contact
+from apps.contact.views import ContactListAPIView
+from core.metrics import RequestMetrics
+
+
+@pytest.mark.unit
+class TestRequestMetrics:
+    """Unit tests for the RequestMetrics class."""
+
+    def test_execute_wrapper_counts_queries(self):
+        """Test that every wrapped execute call is counted and timed"""
+        metrics = RequestMetrics()
+        execute = mock.Mock(return_value="result")
+
+        assert metrics(execute, "SELECT 1", None, False, {}) == "result"
+        assert metrics(execute, "SELECT 2", None, False, {}) == "result"
+        assert metrics.query_count == 2
+        assert metrics.db_time >= 0
+
+    def test_exceeded_budgets(self):
+        """Test that query and latency budgets are reported when exceeded"""
+        metrics = RequestMetrics(query_count=11, total_time=0.5, query_budget=10, latency_budget_ms=100)
+        assert metrics.exceeded_budgets == ["queries", "latency"]
+
+        metrics = RequestMetrics(query_count=3, total_time=0.01, query_budget=10, latency_budget_ms=100)
+        assert metrics.exceeded_budgets == []
+
+    def test_server_timing_header(self):
+        """Test the Server-Timing header format"""
+        metrics = RequestMetrics(query_count=3, db_time=0.0125, serializer_time=0.002, total_time=0.05)
+        assert metrics.server_timing() == 'db;dur=12.5;desc="3 queries", serializer;dur=2.0, total;dur=50.0'
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestRequestMetricsMiddleware:
+    """Tests for RequestMetricsMiddleware through the API."""
+
+    def test_response_has_server_timing_header(self, authenticated_client, user):
+        """Test that API responses carry query count and timings"""
+        baker.make(Contact, user=user, _quantity=3)
+
+        response = authenticated_client.get(reverse("contact_list_api_view"))
+
+        assert response.status_code == 200
+        assert 'desc="' in response["Server-Timing"]
+        assert "serializer;dur=" in response["Server-Timing"]
+        assert "total;dur=" in response["Server-Timing"]
+
+    def test_view_query_budget_exceeded_logs_warning(self, authenticated_client, user):
+        """Test that a per-view query budget overrides the global one and warns when exceeded"""
+        baker.make(Contact, user=user, _quantity=3)
+
+        with mock.patch.object(ContactListAPIView, "query_budget", 0), mock.patch(
+            "core.metrics.logger"
+        ) as mock_logger:
+            authenticated_client.get(reverse("contact_list_api_view"))
+
+        mock_logger.warning.assert_called_once()
+        log_fields = mock_logger.warning.call_args.kwargs["extra"]
+        assert log_fields["view"] == "ContactListAPIView"
+        assert log_fields["query_budget"] == 0
+        assert log_fields["query_count"] > 0
@@ -1,3 +1,5 @@
+import datetime
+
 import pytest
 from decimal import Decimal
 from moneyed import Money as Money
@@ -267,3 +269,109 @@ class TestMoney:
         assert isinstance(money, Money)
         assert money.amount == Decimal("100.50")
         assert money.currency_code == "USD"
+
+    def test_money_uses_slots(self):
+        """Test that Money instances carry no per-instance __dict__"""
+        money = Money("100.00", "USD")
+
+        assert not hasattr(money, "__dict__")
+        with pytest.raises(AttributeError):
+            money.extra = 1
+
+    def test_currency_code_is_normalized_and_shared(self):
+        """Test that currency codes are upper-cased once and shared between instances"""
+        assert Money("1", "usd").currency_code is Money("2", "USD").currency_code
+
+    def test_from_quantized_keeps_amount(self):
+        """Test that the fast constructor stores the given Decimal as is"""
+        amount = Decimal("12.34")
+        money = Money.from_quantized(amount, "USD")
+
+        assert money.amount is amount
+        assert money == Money("12.34", "USD")
+
+    def test_addition_different_currency_raises(self):
+        """Test that adding or comparing different currencies raises TypeError"""
+        with pytest.raises(TypeError):
+            Money("1.00", "USD") + Money("1.00", "EUR")
+        with pytest.raises(TypeError):
+            Money("1.00", "USD") < Money("1.00", "EUR")
+
+    def test_hash(self):
+        """Test that equal Money objects hash the same"""
+        assert len({Money("100.00", "USD"), Money("100", "USD"), Money("100.00", "EUR")}) == 2
+
+    def test_sum(self):
+        """Test summing many Money objects of one currency"""
+        total = Money.sum(Money("0.10", "USD") for _ in range(1000))
+
+        assert total == Money("100.00", "USD")
+        assert str(total) == "100.00 USD"
+
+    def test_sum_empty(self):
+        """Test that an empty sum is zero in the requested currency"""
+        assert Money.sum([]) == Money("0", "TRY")
+        assert str(Money.sum([], currency="JPY")) == "0 JPY"
+
+    def test_sum_different_currency_raises(self):
+        """Test that summing mixed currencies raises TypeError"""
+        with pytest.raises(TypeError):
+            Money.sum([Money("1.00", "USD"), Money("1.00", "EUR")])
+        with pytest.raises(TypeError):
+            Money.sum([Money("1.00", "USD")], currency="EUR")
+
+    def test_moneyed_interop(self):
+        """Test that the py-moneyed equivalent is still available"""
+        money = Money("100.50", "USD")
+
+        assert money.money.amount == Decimal("100.50")
+        assert money.money.currency.code == "USD"
+
+
+class FakeRateSource:
+    """Rate source recording lookups, with rates to TRY."""
+
+    RATES_TO_TRY = {"TRY": Decimal("1"), "USD": Decimal("40"), "EUR": Decimal("45.5"), "JPY": Decimal("0.27")}
+
+    def __init__(self):
+        self.calls = []
+
+    def get_rate(self, base_currency, target_currency, on=None):
+        self.calls.append((base_currency, target_currency, on))
+        return self.RATES_TO_TRY[base_currency] / self.RATES_TO_TRY[target_currency]
+
+
+class TestMoneyConversion:
+    """Unit tests for Money.convert_to and Money.convert_many."""
+
+    def test_convert_to(self):
+        """Test converting rounds to the target currency precision"""
+        rate_source = FakeRateSource()
+        converted = Money("9.99", "USD").convert_to("TRY", on=datetime.date(2025, 1, 1), rate_source=rate_source)
+
+        assert converted == Money("399.60", "TRY")
+        assert rate_source.calls == [("USD", "TRY", datetime.date(2025, 1, 1))]
+
+    def test_convert_to_target_precision(self):
+        """Test converting into a currency without decimals"""
+        assert Money("100.00", "TRY").convert_to("JPY", rate_source=FakeRateSource()) == Money("370", "JPY")
+
+    def test_convert_to_same_currency_needs_no_rate(self):
+        """Test that converting to the same currency does not look up a rate"""
+        rate_source = FakeRateSource()
+        money = Money("10.00", "usd")
+
+        assert money.convert_to("USD", rate_source=rate_source) is money
+        assert rate_source.calls == []
+
+    def test_convert_many_looks_up_each_rate_once(self):
+        """Test that a batch conversion resolves one rate per source currency"""
+        rate_source = FakeRateSource()
+        moneys = [Money("1.00", "USD"), Money("2.00", "EUR"), Money("3.00", "TRY")] * 100
+
+        converted = Money.convert_many(moneys, "TRY", rate_source=rate_source)
+
+        assert converted[:3] == [Money("40.00", "TRY"), Money("91.00", "TRY"), Money("3.00", "TRY")]
+        assert len(converted) == 300
+        assert sorted(call[0] for call in rate_source.calls) == ["EUR", "USD"]
+        assert Money.sum(converted) == Money("13400.00", "TRY")
@@ -0,0 +1,43 @@
+import pytest
+from unittest import mock
+from model_bakery import baker
+
+from apps.contact.models import Contact
+from core.pagination import EstimatedCountPaginator
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestEstimatedCountPaginator:
+    """Unit tests for the EstimatedCountPaginator class."""
+
+    def test_unfiltered_queryset_uses_estimate_above_threshold(self):
+        """Test that an unfiltered queryset is counted from planner statistics"""
+        paginator = EstimatedCountPaginator(Contact.objects.all(), 25)
+
+        with mock.patch.object(EstimatedCountPaginator, "_estimated_table_count", return_value=250_000):
+            assert paginator.count == 250_000
+
+    def test_unfiltered_queryset_uses_exact_count_below_threshold(self, user):
+        """Test that small tables fall back to an exact count"""
+        baker.make(Contact, user=user, _quantity=3)
+        paginator = EstimatedCountPaginator(Contact.objects.all(), 25)
+
+        with mock.patch.object(EstimatedCountPaginator, "_estimated_table_count", return_value=5):
+            assert paginator.count == 3
+
+    def test_filtered_queryset_uses_exact_count(self, user):
+        """Test that filtered querysets never use the table estimate"""
+        baker.make(Contact, user=user, organization="Acme", _quantity=2)
+        baker.make(Contact, user=user, organization="Other")
+        paginator = EstimatedCountPaginator(Contact.objects.filter(organization="Acme"), 25)
+
+        with mock.patch.object(EstimatedCountPaginator, "_estimated_table_count") as mock_estimate:
+            assert paginator.count == 2
+            mock_estimate.assert_not_called()
+
+    def test_estimated_table_count_reads_pg_class(self):
+        """Test that the estimate query runs and never returns a negative count"""
+        paginator = EstimatedCountPaginator(Contact.objects.all(), 25)
+
+        assert paginator._estimated_table_count() >= 0
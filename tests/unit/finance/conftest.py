@@ -0,0 +1,37 @@
+from decimal import Decimal
+
+import pytest
+from model_bakery import baker
+
+from apps.finance.enums import BillingCycleChoices, SubscriptionStatusChoices
+from apps.finance.models import UserSubscription
+
+
+@pytest.fixture
+def make_subscription(user):
+    """Factory fixture to create subscriptions of `user` with different attributes.
+
+    Returns:
+        function: A function that creates UserSubscription instances
+    """
+
+    def _make_subscription(**kwargs) -> UserSubscription:
+        """Creates an active monthly subscription of 10.00 TRY, overridden by the given attributes.
+
+        Args:
+            **kwargs: Attributes to set on the created subscription, `user` included
+
+        Returns:
+            UserSubscription: A UserSubscription instance with the given attributes
+        """
+        default_values = {
+            "user": user,
+            "status": SubscriptionStatusChoices.ACTIVE,
+            "amount": Decimal("10.00"),
+            "currency": "TRY",
+            "billing_cycle": BillingCycleChoices.MONTHLY,
+        }
+        default_values.update(kwargs)
+        return baker.make(UserSubscription, **default_values)
+
+    return _make_subscription
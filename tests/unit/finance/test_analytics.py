@@ -0,0 +1,111 @@
+import datetime
+
+import pytest
+from decimal import Decimal
+from model_bakery import baker
+
+from apps.finance import analytics
+from apps.finance.enums import AnalyticsGroupByChoices, BillingCycleChoices, SubscriptionStatusChoices
+from apps.finance.ledger import rebuild_projected_charges
+from apps.finance.models import SubscriptionService, SubscriptionServiceCategory, UserSubscription
+from core.services.exchange_rates import ExchangeRateProvider, StaticExchangeRateClient
+
+
+TODAY = datetime.date(2025, 1, 15)
+
+
+@pytest.fixture
+def subscriptions(user):
+    video = baker.make(SubscriptionServiceCategory, name="Video Streaming")
+    netflix = baker.make(SubscriptionService, name="Netflix", category=video)
+    disney = baker.make(SubscriptionService, name="Disney+", category=video)
+    dropbox = baker.make(SubscriptionService, name="Dropbox", category=None)
+
+    def make(service, amount, currency, billing_cycle, **kwargs):
+        kwargs.setdefault("status", SubscriptionStatusChoices.ACTIVE)
+        return baker.make(
+            UserSubscription,
+            user=user,
+            service=service,
+            amount=Decimal(amount),
+            currency=currency,
+            billing_cycle=billing_cycle,
+            next_billing_date=datetime.date(2025, 1, 20),
+            **kwargs,
+        )
+
+    return [
+        make(netflix, "100.00", "TRY", BillingCycleChoices.MONTHLY),
+        make(disney, "120.00", "USD", BillingCycleChoices.ANNUALLY),
+        make(dropbox, "30.00", "TRY", BillingCycleChoices.QUARTERLY),
+        make(dropbox, "999.00", "TRY", BillingCycleChoices.MONTHLY, status=SubscriptionStatusChoices.CANCELLED),
+    ]
+
+
+def build(user, **kwargs):
+    return analytics.build_subscription_analytics(
+        user, exchange_rate_provider=ExchangeRateProvider(client=StaticExchangeRateClient()), today=TODAY, **kwargs
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestSubscriptionAnalytics:
+    """Unit tests for the subscription spend analytics."""
+
+    def test_group_by_category(self, user, subscriptions, count_queries):
+        """Test that normalized monthly costs are summed per category and converted per currency"""
+        result = build(user, group_by=AnalyticsGroupByChoices.CATEGORY)
+
+        # 100 + 120 USD / 12 * 40 and 30 / 3
+        assert result["monthly_total"] == "510.00"
+        assert result["groups"] == [
+            {"key": "Video Streaming", "subscription_count": 2, "monthly_cost": "500.00"},
+            {"key": analytics.UNCATEGORIZED, "subscription_count": 1, "monthly_cost": "10.00"},
+        ]
+        # One aggregate query joining the category, plus the stored rates
+        assert count_queries(build, user, group_by=AnalyticsGroupByChoices.CATEGORY) <= 2
+
+    def test_group_by_service_and_currency(self, user, subscriptions):
+        by_service = build(user, group_by=AnalyticsGroupByChoices.SERVICE)
+        by_currency = build(user, group_by=AnalyticsGroupByChoices.CURRENCY)
+
+        assert [(group["key"], group["monthly_cost"]) for group in by_service["groups"]] == [
+            ("Disney+", "400.00"),
+            ("Netflix", "100.00"),
+            ("Dropbox", "10.00"),
+        ]
+        assert [(group["key"], group["monthly_cost"]) for group in by_currency["groups"]] == [
+            ("USD", "400.00"),
+            ("TRY", "110.00"),
+        ]
+
+    def test_monthly_buckets(self, user, subscriptions):
+        """Test that bucket=month adds the projected charges per calendar month"""
+        rebuild_projected_charges(today=TODAY)
+
+        result = build(user, group_by=AnalyticsGroupByChoices.CURRENCY, bucket="month")
+        buckets = {group["key"]: group["buckets"] for group in result["groups"]}
+
+        assert buckets["USD"] == [{"month": "2025-01", "total": "4800.00"}]
+        assert buckets["TRY"][:4] == [
+            {"month": "2025-01", "total": "130.00"},
+            {"month": "2025-02", "total": "100.00"},
+            {"month": "2025-03", "total": "100.00"},
+            {"month": "2025-04", "total": "130.00"},
+        ]
+
+    def test_results_are_cached_until_a_subscription_changes(
+        self, user, subscriptions, count_queries, django_capture_on_commit_callbacks
+    ):
+        first = analytics.get_subscription_analytics(user)
+
+        assert count_queries(analytics.get_subscription_analytics, user) == 0
+
+        with django_capture_on_commit_callbacks(execute=True):
+            subscriptions[0].amount = Decimal("200.00")
+            subscriptions[0].save()
+
+        second = analytics.get_subscription_analytics(user)
+        assert first["monthly_total"] == "510.00"
+        assert second["monthly_total"] == "610.00"
@@ -0,0 +1,86 @@
+import pytest
+from model_bakery import baker
+
+from apps.finance.catalog import ServiceCatalog, catalog
+from apps.finance.models import SubscriptionService, SubscriptionServiceCategory
+
+
+@pytest.fixture
+def services():
+    video = baker.make(SubscriptionServiceCategory, name="Video Streaming")
+    return {
+        "video": video,
+        "netflix": baker.make(SubscriptionService, name="Netflix", category=video),
+        "disney": baker.make(SubscriptionService, name="Disney+", category=video),
+        "dropbox": baker.make(SubscriptionService, name="Dropbox", category=None),
+    }
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestServiceCatalog:
+    """Unit tests for apps.finance.catalog.ServiceCatalog."""
+
+    def test_lookups(self, services):
+        service_catalog = ServiceCatalog()
+
+        assert service_catalog.get_service(services["netflix"].pk) == services["netflix"]
+        assert service_catalog.get_service_by_name("Dropbox") == services["dropbox"]
+        assert service_catalog.get_service(0) is None
+        assert service_catalog.get_category(services["video"].pk) == services["video"]
+        assert service_catalog.services_in_category(services["video"]) == [services["disney"], services["netflix"]]
+        assert service_catalog.services_in_category(None) == [services["dropbox"]]
+
+    def test_warm_catalog_runs_no_queries(self, services, count_queries):
+        service_catalog = ServiceCatalog()
+
+        assert count_queries(service_catalog.get_service, services["netflix"].pk) == 2
+
+        def read():
+            service = service_catalog.get_service(services["netflix"].pk)
+            return service.category.name, service_catalog.services_in_category(services["video"].pk)
+
+        assert count_queries(read) == 0
+
+    def test_changes_reload_the_catalog(self, services, django_capture_on_commit_callbacks):
+        assert catalog.get_service_by_name("Netflix").name == "Netflix"
+
+        with django_capture_on_commit_callbacks(execute=True):
+            services["netflix"].name = "Netflix Premium"
+            services["netflix"].save()
+
+        assert catalog.get_service_by_name("Netflix") is None
+        assert catalog.get_service(services["netflix"].pk).name == "Netflix Premium"
+
+    def test_bulk_writes_reload_the_catalog(self, services, django_capture_on_commit_callbacks):
+        assert catalog.get_service_by_name("Spotify") is None
+
+        with django_capture_on_commit_callbacks(execute=True):
+            SubscriptionService.objects.bulk_create([SubscriptionService(name="Spotify", is_active=True)])
+
+        assert catalog.get_service_by_name("Spotify") is not None
+
+        with django_capture_on_commit_callbacks(execute=True):
+            SubscriptionService.objects.filter(name="Spotify").update(name="Spotify Premium")
+
+        assert catalog.get_service_by_name("Spotify") is None
+        assert catalog.get_service_by_name("Spotify Premium") is not None
+
+    def test_other_processes_reload_on_a_new_version(self, services):
+        other_process = ServiceCatalog()
+        _, etag = other_process.as_payload()
+
+        services["dropbox"].delete()
+        catalog.invalidate()
+
+        assert other_process.get_service(services["dropbox"].pk) is None
+        assert other_process.as_payload()[1] != etag
+
+    def test_payload_groups_services_by_category(self, services):
+        payload, etag = ServiceCatalog().as_payload()
+
+        assert [(category["name"], len(category["services"])) for category in payload] == [
+            ("Video Streaming", 2),
+            (None, 1),
+        ]
+        assert etag.startswith('"') and etag.endswith('"')
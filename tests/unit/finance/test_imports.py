@@ -0,0 +1,90 @@
+import datetime
+import io
+
+import pytest
+from decimal import Decimal
+from model_bakery import baker
+
+from apps.finance.catalog import catalog
+from apps.finance.imports import SubscriptionBulkCreateService, parse_subscription_csv
+from apps.finance.models import ProjectedCharge, SubscriptionService, UserSubscription
+
+
+def make_row(service, **kwargs) -> dict:
+    row = {
+        "service": service,
+        "amount": "79.99",
+        "currency": "TRY",
+        "billing_cycle": "monthly",
+        "started_at": "2025-01-01",
+        "next_billing_date": (datetime.date.today() + datetime.timedelta(days=3)).isoformat(),
+        "status": "active",
+        "payment_method": "credit_card",
+    }
+    row.update(kwargs)
+    return row
+
+
+@pytest.mark.unit
+class TestParseSubscriptionCSV:
+    """Unit tests for apps.finance.imports.parse_subscription_csv."""
+
+    def test_parse_semicolon_separated_export(self):
+        """Test that delimiters are detected and empty cells dropped"""
+        content = "service;amount;currency;plan_name\r\nNetflix;79,99;TRY;\r\n12;9.99;USD;Family\r\n"
+
+        rows = parse_subscription_csv(io.BytesIO(("\ufeff" + content).encode("utf-8")))
+
+        assert rows == [
+            {"service": "Netflix", "amount": "79,99", "currency": "TRY"},
+            {"service": "12", "amount": "9.99", "currency": "USD", "plan_name": "Family"},
+        ]
+
+    def test_parse_single_column(self):
+        assert parse_subscription_csv(io.BytesIO(b"service\nNetflix\n")) == [{"service": "Netflix"}]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestSubscriptionBulkCreateService:
+    """Unit tests for apps.finance.imports.SubscriptionBulkCreateService."""
+
+    def test_create_resolves_services_by_id_and_name(self, user, django_capture_on_commit_callbacks):
+        netflix = baker.make(SubscriptionService, name="Netflix")
+        spotify = baker.make(SubscriptionService, name="Spotify")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            result = SubscriptionBulkCreateService(user=user).create(
+                [make_row(netflix.pk), make_row("Spotify", amount="59.99")]
+            )
+
+        assert result.errors == []
+        assert [subscription.service for subscription in result.created] == [netflix, spotify]
+        assert UserSubscription.objects.filter(user=user).count() == 2
+        assert UserSubscription.objects.get(service=spotify).amount == Decimal("59.99")
+        # Signals are skipped by bulk_create, the ledger is refreshed explicitly
+        assert ProjectedCharge.objects.filter(user=user).count() == 24
+
+    def test_invalid_rows_create_nothing(self, user):
+        service = baker.make(SubscriptionService, name="Netflix")
+
+        result = SubscriptionBulkCreateService(user=user).create(
+            [make_row(service.pk), make_row("Unknown"), make_row(service.pk, amount="abc"), "not a row"]
+        )
+
+        assert result.created == []
+        assert [error["row"] for error in result.errors] == [1, 2, 3]
+        assert "service" in result.errors[0]["errors"]
+        assert "amount" in result.errors[1]["errors"]
+        assert not UserSubscription.objects.exists()
+
+    def test_query_count_does_not_depend_on_rows(self, user, count_queries):
+        """Test that services are resolved from the catalog and rows inserted with one bulk_create"""
+        services = baker.make(SubscriptionService, _quantity=25)
+        service = SubscriptionBulkCreateService(user=user)
+        catalog.get_service(services[0].pk)
+
+        few = count_queries(service.create, [make_row(services[0].pk)])
+        many = count_queries(service.create, [make_row(item.pk) for item in services])
+
+        assert few == many
@@ -0,0 +1,125 @@
+import datetime
+
+import pytest
+from decimal import Decimal
+
+from apps.finance import ledger
+from apps.finance.enums import BillingCycleChoices, SubscriptionStatusChoices
+from apps.finance.models import ProjectedCharge, UserSubscription
+
+
+TODAY = datetime.date(2025, 1, 15)
+NEXT_BILLING_DATE = datetime.date(2025, 1, 20)
+
+
+@pytest.mark.unit
+class TestProjectBillingDates:
+    """Unit tests for ledger.project_billing_dates."""
+
+    @pytest.mark.parametrize(
+        "billing_cycle,expected_count",
+        [
+            (BillingCycleChoices.WEEKLY, 52),
+            (BillingCycleChoices.MONTHLY, 12),
+            (BillingCycleChoices.QUARTERLY, 4),
+            (BillingCycleChoices.SEMI_ANNUALLY, 2),
+            (BillingCycleChoices.ANNUALLY, 1),
+            (None, 12),
+        ],
+    )
+    def test_billing_cycles(self, billing_cycle, expected_count):
+        """Test that each billing cycle is expanded with its own interval"""
+        subscription = UserSubscription(next_billing_date=datetime.date(2025, 1, 20), billing_cycle=billing_cycle)
+
+        dates = ledger.project_billing_dates(subscription, TODAY, TODAY + datetime.timedelta(days=365))
+
+        assert len(dates) == expected_count
+        assert dates[0] == datetime.date(2025, 1, 20)
+
+    def test_matches_refresh_next_billing_date(self):
+        """Test that projected dates follow the same chaining as refresh_next_billing_date"""
+        subscription = UserSubscription(
+            next_billing_date=datetime.date(2025, 1, 31), billing_cycle=BillingCycleChoices.MONTHLY
+        )
+
+        dates = ledger.project_billing_dates(subscription, TODAY, datetime.date(2025, 5, 1))
+
+        assert dates == [
+            datetime.date(2025, 1, 31),
+            datetime.date(2025, 2, 28),
+            datetime.date(2025, 3, 28),
+            datetime.date(2025, 4, 28),
+        ]
+
+    def test_overdue_billing_date_is_projected_from_today(self):
+        """Test that charges before the window are skipped when the next billing date is not refreshed yet"""
+        subscription = UserSubscription(
+            next_billing_date=datetime.date(2024, 11, 10), billing_cycle=BillingCycleChoices.MONTHLY
+        )
+
+        dates = ledger.project_billing_dates(subscription, TODAY, datetime.date(2025, 3, 1))
+
+        assert dates == [datetime.date(2025, 2, 10)]
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestProjectedChargesLedger:
+    """Unit tests for maintaining and querying the projected charges ledger."""
+
+    def test_subscription_save_refreshes_ledger(self, user, make_subscription, django_capture_on_commit_callbacks):
+        """Test that saving a subscription re-projects its charges after commit"""
+        with django_capture_on_commit_callbacks(execute=True):
+            subscription = make_subscription(
+                billing_cycle=BillingCycleChoices.QUARTERLY, next_billing_date=datetime.date.today()
+            )
+
+        assert subscription.projected_charges.count() == 5
+
+        with django_capture_on_commit_callbacks(execute=True):
+            subscription.status = SubscriptionStatusChoices.CANCELLED
+            subscription.save()
+
+        assert not subscription.projected_charges.exists()
+
+    def test_refresh_replaces_existing_charges(self, make_subscription):
+        subscription = make_subscription(
+            billing_cycle=BillingCycleChoices.MONTHLY, next_billing_date=NEXT_BILLING_DATE
+        )
+        ledger.refresh_projected_charges([subscription], today=TODAY)
+
+        subscription.amount = Decimal("25.00")
+        subscription.billing_cycle = BillingCycleChoices.ANNUALLY
+        ledger.refresh_projected_charges([subscription], today=TODAY)
+
+        assert list(subscription.projected_charges.values_list("billing_date", "amount")) == [
+            (datetime.date(2025, 1, 20), Decimal("25.00"))
+        ]
+
+    def test_rebuild_drops_past_charges(self, make_subscription):
+        make_subscription(billing_cycle=BillingCycleChoices.MONTHLY, next_billing_date=NEXT_BILLING_DATE)
+        ledger.rebuild_projected_charges(today=TODAY)
+
+        created = ledger.rebuild_projected_charges(today=datetime.date(2025, 3, 1))
+
+        assert created == 12
+        assert not ProjectedCharge.objects.filter(billing_date__lt=datetime.date(2025, 3, 1)).exists()
+
+    def test_sum_projected_charges_by_currency(self, user, make_subscription, count_queries):
+        """Test that spend over a date range is a single grouped range sum"""
+        make_subscription(
+            billing_cycle=BillingCycleChoices.WEEKLY, next_billing_date=NEXT_BILLING_DATE, amount=Decimal("5.00")
+        )
+        make_subscription(
+            billing_cycle=BillingCycleChoices.ANNUALLY,
+            next_billing_date=NEXT_BILLING_DATE,
+            amount=Decimal("100.00"),
+            currency="USD",
+        )
+        ledger.rebuild_projected_charges(today=TODAY)
+
+        totals = ledger.sum_projected_charges(user, TODAY, datetime.date(2025, 2, 1))
+
+        # Weekly on Jan 20 and 27, annual on Jan 20
+        assert totals == {"TRY": Decimal("10.00"), "USD": Decimal("100.00")}
+        assert count_queries(ledger.sum_projected_charges, user, TODAY, datetime.date(2025, 4, 15)) == 1
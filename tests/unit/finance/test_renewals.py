@@ -0,0 +1,114 @@
+import datetime
+
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from apps.finance.enums import BillingCycleChoices, SubscriptionStatusChoices
+from apps.finance.models import UserSubscription
+from apps.finance.renewals import advance_billing_date, renew_overdue_subscriptions, upcoming_renewals
+
+
+TODAY = datetime.date(2025, 6, 15)
+
+
+@pytest.mark.unit
+class TestAdvanceBillingDate:
+    """Unit tests for apps.finance.renewals.advance_billing_date."""
+
+    @pytest.mark.parametrize(
+        "billing_date,interval,expected",
+        [
+            (datetime.date(2025, 6, 1), datetime.timedelta(weeks=1), datetime.date(2025, 6, 15)),
+            (datetime.date(2025, 6, 2), datetime.timedelta(weeks=1), datetime.date(2025, 6, 16)),
+            (datetime.date(2024, 1, 10), relativedelta(months=1), datetime.date(2025, 7, 10)),
+            (datetime.date(2025, 1, 31), relativedelta(months=1), datetime.date(2025, 6, 28)),
+            (datetime.date(2023, 6, 15), relativedelta(years=1), datetime.date(2025, 6, 15)),
+            (datetime.date(2025, 7, 1), relativedelta(months=3), datetime.date(2025, 7, 1)),
+        ],
+    )
+    def test_advance_billing_date(self, billing_date, interval, expected):
+        assert advance_billing_date(billing_date, interval, TODAY) == expected
+
+    def test_matches_refresh_next_billing_date_chain(self):
+        """Test that the result equals calling the single-period step until the date is not overdue"""
+        billing_date = datetime.date(2024, 8, 31)
+        interval = relativedelta(months=1)
+
+        chained = billing_date
+        while chained < TODAY:
+            chained = chained + interval
+
+        assert advance_billing_date(billing_date, interval, TODAY) == chained
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestRenewOverdueSubscriptions:
+    """Unit tests for apps.finance.renewals.renew_overdue_subscriptions."""
+
+    def test_renews_every_cycle_to_today_or_later(self, make_subscription):
+        weekly = make_subscription(
+            billing_cycle=BillingCycleChoices.WEEKLY, next_billing_date=datetime.date(2025, 3, 3)
+        )
+        monthly = make_subscription(next_billing_date=datetime.date(2024, 12, 20))
+        no_cycle = make_subscription(billing_cycle=None, next_billing_date=datetime.date(2025, 5, 1))
+        annual = make_subscription(
+            billing_cycle=BillingCycleChoices.ANNUALLY, next_billing_date=datetime.date(2022, 1, 1)
+        )
+
+        assert renew_overdue_subscriptions(today=TODAY) == 4
+
+        for subscription in (weekly, monthly, no_cycle, annual):
+            subscription.refresh_from_db()
+        assert weekly.next_billing_date == datetime.date(2025, 6, 16)
+        assert monthly.next_billing_date == datetime.date(2025, 6, 20)
+        assert no_cycle.next_billing_date == datetime.date(2025, 7, 1)
+        assert annual.next_billing_date == datetime.date(2026, 1, 1)
+
+    def test_skips_current_and_inactive_subscriptions(self, make_subscription):
+        due_today = make_subscription(next_billing_date=TODAY)
+        cancelled = make_subscription(
+            status=SubscriptionStatusChoices.CANCELLED, next_billing_date=datetime.date(2025, 1, 1)
+        )
+
+        assert renew_overdue_subscriptions(today=TODAY) == 0
+
+        assert UserSubscription.objects.get(pk=due_today.pk).next_billing_date == TODAY
+        assert UserSubscription.objects.get(pk=cancelled.pk).next_billing_date == datetime.date(2025, 1, 1)
+
+    def test_queries_depend_on_billing_cycles_not_rows(self, make_subscription, count_queries):
+        """Test that one SELECT and one UPDATE per billing cycle renew any number of subscriptions"""
+        for day in range(1, 21):
+            make_subscription(next_billing_date=datetime.date(2025, 5, day))
+            make_subscription(billing_cycle=BillingCycleChoices.WEEKLY, next_billing_date=datetime.date(2025, 5, day))
+
+        # SELECT distinct dates, SAVEPOINT, UPDATE monthly, UPDATE weekly, RELEASE
+        assert count_queries(renew_overdue_subscriptions, TODAY) == 5
+        assert not UserSubscription.objects.filter(next_billing_date__lt=TODAY).exists()
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestUpcomingRenewals:
+    """Unit tests for apps.finance.renewals.upcoming_renewals."""
+
+    def test_window_crosses_the_year_boundary(self, make_subscription):
+        inside = [
+            make_subscription(auto_renewal=True, next_billing_date=datetime.date(2025, 12, 28)),
+            make_subscription(auto_renewal=True, next_billing_date=datetime.date(2026, 1, 2)),
+        ]
+        make_subscription(auto_renewal=True, next_billing_date=datetime.date(2026, 1, 5))
+        make_subscription(auto_renewal=False, next_billing_date=datetime.date(2025, 12, 30))
+        make_subscription(
+            auto_renewal=True,
+            next_billing_date=datetime.date(2025, 12, 30),
+            status=SubscriptionStatusChoices.CANCELLED,
+        )
+
+        assert list(upcoming_renewals(datetime.date(2025, 12, 27), days=7)) == inside
+
+    def test_uses_the_renewal_window_index(self, query_plan):
+        plan = query_plan(upcoming_renewals(TODAY, days=7))
+
+        assert "subscription_renewal_window" in plan
+        assert "Seq Scan" not in plan
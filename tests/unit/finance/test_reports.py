@@ -0,0 +1,102 @@
+import datetime
+
+import pytest
+from decimal import Decimal
+
+from apps.finance.enums import SubscriptionStatusChoices
+from apps.finance.reports import build_subscription_expense_report
+from core.services.exchange_rates import ExchangeRateProvider, StaticExchangeRateClient
+
+
+START_DATE = datetime.date(2025, 3, 1)
+END_DATE = datetime.date(2025, 4, 1)
+
+
+@pytest.fixture
+def rates_client():
+    return StaticExchangeRateClient(
+        rates={"TRY": Decimal("1"), "USD": Decimal("40.123"), "EUR": Decimal("45.5"), "JPY": Decimal("0.27")}
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestSubscriptionExpenseReport:
+    """Unit tests for build_subscription_expense_report."""
+
+    def test_totals_are_converted_once_per_currency(self, user, user_factory, make_subscription, rates_client):
+        """Test that global and per-user totals are converted from per-currency sums"""
+        other_user = user_factory()
+        make_subscription(amount=Decimal("100.00"), currency="TRY", next_billing_date=START_DATE)
+        make_subscription(amount=Decimal("9.99"), currency="USD", next_billing_date=START_DATE)
+        make_subscription(amount=Decimal("10.01"), currency="USD", next_billing_date=START_DATE, user=other_user)
+        make_subscription(amount=Decimal("5.00"), currency="EUR", next_billing_date=START_DATE, user=other_user)
+
+        report = build_subscription_expense_report(
+            START_DATE, END_DATE, exchange_rate_provider=ExchangeRateProvider(client=rates_client)
+        )
+
+        assert report.subscription_count == 4
+        assert report.currency_totals == {"TRY": Decimal("100.00"), "USD": Decimal("20.00"), "EUR": Decimal("5.00")}
+        # 100 + 20 * 40.123 + 5 * 45.5
+        assert report.total == Decimal("1129.96")
+        assert report.user_totals == {
+            # 100 + 9.99 * 40.123 = 500.828... -> 500.83
+            user.id: Decimal("500.83"),
+            # 10.01 * 40.123 = 401.631... -> 401.63, + 227.50
+            other_user.id: Decimal("629.13"),
+        }
+        assert sorted(call[0] for call in rates_client.calls) == ["EUR", "USD"]
+
+    def test_only_active_subscriptions_in_range_are_included(self, make_subscription, rates_client):
+        """Test that the billing date window and status are applied"""
+        make_subscription(amount=Decimal("10.00"), currency="TRY", next_billing_date=START_DATE)
+        make_subscription(amount=Decimal("10.00"), currency="TRY", next_billing_date=END_DATE)
+        make_subscription(
+            amount=Decimal("10.00"),
+            currency="TRY",
+            next_billing_date=START_DATE,
+            status=SubscriptionStatusChoices.CANCELLED,
+        )
+
+        report = build_subscription_expense_report(
+            START_DATE, END_DATE, exchange_rate_provider=ExchangeRateProvider(client=rates_client)
+        )
+
+        assert report.total == Decimal("10.00")
+        assert report.subscription_count == 1
+
+    def test_rounding_follows_target_currency_precision(self, make_subscription, rates_client):
+        """Test that totals in zero-decimal currencies are rounded to whole units"""
+        make_subscription(amount=Decimal("100.00"), currency="TRY", next_billing_date=START_DATE)
+
+        report = build_subscription_expense_report(
+            START_DATE, END_DATE, currency="JPY", exchange_rate_provider=ExchangeRateProvider(client=rates_client)
+        )
+
+        # 100 TRY / 0.27 = 370.37 JPY
+        assert report.total == Decimal("370")
+        assert str(report.total_money) == "370 JPY"
+
+    def test_query_count_does_not_depend_on_subscriptions(self, make_subscription, rates_client, count_queries):
+        """Test that the report runs a single aggregate query however many subscriptions exist"""
+        for _ in range(20):
+            make_subscription(amount=Decimal("1.00"), currency="USD", next_billing_date=START_DATE)
+        provider = ExchangeRateProvider(client=rates_client)
+        provider.get_rates("USD")
+
+        assert (
+            count_queries(build_subscription_expense_report, START_DATE, END_DATE, exchange_rate_provider=provider)
+            == 1
+        )
+        assert build_subscription_expense_report(START_DATE, END_DATE, exchange_rate_provider=provider).total == (
+            Decimal("802.46")
+        )
+
+    def test_empty_report(self, rates_client):
+        report = build_subscription_expense_report(
+            START_DATE, END_DATE, exchange_rate_provider=ExchangeRateProvider(client=rates_client)
+        )
+
+        assert report.total == Decimal("0.00")
+        assert report.user_totals == {}
@@ -0,0 +1,123 @@
+import datetime
+from unittest import mock
+
+import pytest
+from decimal import Decimal
+from model_bakery import baker
+
+from apps.contact.models import Contact
+from apps.finance.enums import SubscriptionStatusChoices
+from apps.finance.models import SubscriptionService, UserSubscription
+from apps.reminder.digests import iter_user_batches, render_birthday_digest, send_reminder_digests
+from apps.reminder.enums import DeliveryStatusChoices, ReminderDigestChoices
+from apps.reminder.models import ReminderDelivery
+from apps.reminder.tasks import task_schedule_reminder_digests
+
+
+TODAY = datetime.date(2025, 12, 20)
+
+
+@pytest.fixture
+def telegram():
+    with mock.patch("apps.reminder.digests.TelegramReminderAPI") as api:
+        yield api.return_value
+
+
+@pytest.fixture
+def users_with_birthdays(user_factory):
+    users = [user_factory(telegram_chat_id=f"10{i}") for i in range(3)]
+    for user in users:
+        baker.make(Contact, user=user, first_name="Ada", birthday=datetime.date(1990, 12, 25))
+        baker.make(Contact, user=user, first_name="Alan", birthday=datetime.date(1990, 1, 5))
+    return users
+
+
+@pytest.mark.unit
+class TestRenderDigests:
+    def test_birthday_digest_lists_every_contact(self):
+        contacts = [
+            Contact(first_name="Ada", birthday=datetime.date(1990, 12, 25)),
+            Contact(first_name="<Alan>", birthday=datetime.date(1990, 1, 5)),
+        ]
+
+        message = render_birthday_digest(contacts)
+
+        assert "Ada - 25 December 1990" in message
+        assert "&lt;Alan&gt; - 05 January 1990" in message
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestReminderDigests:
+    """Unit tests for the per-user reminder digests in apps.reminder.digests."""
+
+    def test_user_batches(self, users_with_birthdays):
+        batches = list(iter_user_batches(ReminderDigestChoices.BIRTHDAYS, TODAY, batch_size=2))
+
+        assert [len(batch) for batch in batches] == [2, 1]
+        assert sorted(sum(batches, [])) == sorted(user.pk for user in users_with_birthdays)
+
+    def test_schedule_queues_one_task_per_batch(self, users_with_birthdays):
+        with mock.patch("apps.reminder.tasks.task_send_reminder_digests.delay") as delay:
+            batches = task_schedule_reminder_digests(ReminderDigestChoices.BIRTHDAYS, TODAY.isoformat())
+
+        assert batches == 1
+        delay.assert_called_once()
+        kind, user_ids, scheduled_for = delay.call_args.args
+        assert (kind, len(user_ids), scheduled_for) == (ReminderDigestChoices.BIRTHDAYS, 3, "2025-12-20")
+
+    def test_one_digest_per_user(self, users_with_birthdays, telegram, count_queries):
+        user_ids = [user.pk for user in users_with_birthdays]
+
+        queries = count_queries(send_reminder_digests, ReminderDigestChoices.BIRTHDAYS, user_ids, TODAY)
+
+        assert telegram.send_message.call_count == 3
+        message = telegram.send_message.call_args_list[0].args[0]
+        assert "Ada" in message and "Alan" in message
+        assert {call.kwargs["chat_id"] for call in telegram.send_message.call_args_list} == {"100", "101", "102"}
+        assert set(ReminderDelivery.objects.values_list("status", "item_count")) == {(DeliveryStatusChoices.SENT, 2)}
+        # Deliveries (insert and select), chat IDs and items for the whole batch, then one update per user
+        assert queries == 4 + len(user_ids)
+
+    def test_retried_batch_does_not_resend(self, users_with_birthdays, telegram):
+        user_ids = [user.pk for user in users_with_birthdays]
+        telegram.send_message.side_effect = [True, ValueError("Forbidden: bot was blocked by the user"), True]
+
+        first = send_reminder_digests(ReminderDigestChoices.BIRTHDAYS, user_ids, TODAY)
+        telegram.send_message.side_effect = None
+        second = send_reminder_digests(ReminderDigestChoices.BIRTHDAYS, user_ids, TODAY)
+
+        assert first == {DeliveryStatusChoices.SENT: 2, DeliveryStatusChoices.FAILED: 1}
+        assert second == {DeliveryStatusChoices.SENT: 1}
+        assert telegram.send_message.call_count == 4
+        assert ReminderDelivery.objects.filter(status=DeliveryStatusChoices.SENT).count() == 3
+
+    @pytest.fixture
+    def renewal(self, user):
+        return baker.make(
+            UserSubscription,
+            user=user,
+            service=baker.make(SubscriptionService, name="Netflix"),
+            amount=Decimal("79.99"),
+            auto_renewal=True,
+            status=SubscriptionStatusChoices.ACTIVE,
+            next_billing_date=TODAY + datetime.timedelta(days=3),
+        )
+
+    def test_users_without_a_chat_are_skipped(self, user, renewal, telegram, settings):
+        settings.TELEGRAM_REMINDER_CHAT_ID = "999"
+
+        result = send_reminder_digests(ReminderDigestChoices.RENEWALS, [user.pk], TODAY)
+
+        assert result == {DeliveryStatusChoices.SKIPPED: 1}
+        telegram.send_message.assert_not_called()
+
+    def test_renewal_digest_falls_back_to_the_shared_chat_when_enabled(self, user, renewal, telegram, settings):
+        settings.TELEGRAM_REMINDER_CHAT_ID = "999"
+        settings.TELEGRAM_REMINDER_SHARED_CHAT_FALLBACK = True
+
+        result = send_reminder_digests(ReminderDigestChoices.RENEWALS, [user.pk], TODAY)
+
+        assert result == {DeliveryStatusChoices.SENT: 1}
+        assert "Netflix" in telegram.send_message.call_args.args[0]
+        assert telegram.send_message.call_args.kwargs["chat_id"] == "999"
@@ -0,0 +1,163 @@
+import datetime
+import threading
+from unittest import mock
+
+import pytest
+from django.db import connection, transaction
+from django.utils import timezone
+from model_bakery import baker
+
+from apps.finance.enums import BillingCycleChoices
+from apps.reminder.dispatcher import claim_due_reminders, dispatch_due_reminders, due_reminders
+from apps.reminder.enums import ReminderStatusChoices
+from apps.reminder.models import FinanceReminder
+
+
+NOW = timezone.make_aware(datetime.datetime(2025, 6, 15, 9, 0))
+
+
+@pytest.fixture
+def telegram():
+    with mock.patch("apps.reminder.dispatcher.TelegramReminderAPI") as api:
+        yield api.return_value
+
+
+@pytest.fixture
+def make_reminder(user_factory):
+    user = user_factory(telegram_chat_id="42")
+
+    def _make(reminder_date: datetime.datetime, **kwargs) -> FinanceReminder:
+        kwargs.setdefault("title", "Rent")
+        return baker.make(FinanceReminder, user=user, reminder_date=reminder_date, subscription=None, **kwargs)
+
+    return _make
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestDueReminders:
+    """Unit tests for the due reminder queue in apps.reminder.dispatcher."""
+
+    def test_due_reminders_follow_snooze(self, make_reminder):
+        due = make_reminder(NOW - datetime.timedelta(hours=1))
+        snoozed_due = make_reminder(
+            NOW - datetime.timedelta(days=2),
+            status=ReminderStatusChoices.SNOOZED,
+            snoozed_until=NOW - datetime.timedelta(minutes=5),
+        )
+        make_reminder(
+            NOW - datetime.timedelta(days=1),
+            status=ReminderStatusChoices.SNOOZED,
+            snoozed_until=NOW + datetime.timedelta(hours=1),
+        )
+        make_reminder(NOW + datetime.timedelta(hours=1))
+        make_reminder(NOW - datetime.timedelta(hours=1), is_notified=True)
+        make_reminder(NOW - datetime.timedelta(hours=1), status=ReminderStatusChoices.FAILED)
+
+        assert list(due_reminders(NOW)) == [due, snoozed_due]
+
+    def test_uses_the_due_queue_index(self, query_plan):
+        plan = query_plan(due_reminders(NOW))
+
+        assert "finance_reminder_due_queue" in plan
+        assert "Seq Scan" not in plan
+
+    def test_claim_marks_a_batch_processing(self, make_reminder, count_queries):
+        reminders = [make_reminder(NOW - datetime.timedelta(minutes=i)) for i in range(5)]
+
+        # SELECT ... FOR UPDATE SKIP LOCKED and one UPDATE, inside a savepoint of the test transaction
+        assert count_queries(claim_due_reminders, NOW, 3) == 4
+        assert FinanceReminder.objects.filter(status=ReminderStatusChoices.PROCESSING).count() == 3
+        assert claim_due_reminders(NOW, 3) == [reminders[1].pk, reminders[0].pk]
+        assert claim_due_reminders(NOW, 3) == []
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestDispatchDueReminders:
+    """Unit tests for apps.reminder.dispatcher.dispatch_due_reminders."""
+
+    def test_one_off_reminders_are_completed(self, make_reminder, telegram):
+        reminder = make_reminder(NOW - datetime.timedelta(hours=1), description="Pay <now>")
+
+        assert dispatch_due_reminders(NOW) == {"completed": 1}
+
+        reminder.refresh_from_db()
+        assert (reminder.status, reminder.is_notified) == (ReminderStatusChoices.COMPLETED, True)
+        assert "Pay &lt;now&gt;" in telegram.send_message.call_args.args[0]
+
+    def test_recurring_reminders_move_to_the_next_occurrence(self, make_reminder, telegram):
+        weekly = make_reminder(
+            NOW - datetime.timedelta(days=15),
+            is_recurring=True,
+            recurrence=BillingCycleChoices.WEEKLY,
+            status=ReminderStatusChoices.SNOOZED,
+            snoozed_until=NOW - datetime.timedelta(hours=1),
+            snooze_count=2,
+        )
+        monthly = make_reminder(NOW - datetime.timedelta(hours=1), is_recurring=True)
+
+        assert dispatch_due_reminders(NOW) == {"recurring": 2}
+
+        weekly.refresh_from_db()
+        monthly.refresh_from_db()
+        assert weekly.reminder_date == NOW + datetime.timedelta(days=6)
+        assert (weekly.status, weekly.snoozed_until, weekly.snooze_count) == (ReminderStatusChoices.PENDING, None, 0)
+        assert monthly.reminder_date == NOW + datetime.timedelta(days=30) - datetime.timedelta(hours=1)
+        assert not monthly.is_notified
+
+    def test_failed_sends_do_not_stop_the_batch(self, make_reminder, telegram):
+        make_reminder(NOW - datetime.timedelta(hours=2))
+        make_reminder(NOW - datetime.timedelta(hours=1))
+        telegram.send_message.side_effect = [ValueError("Bad Request: chat not found"), True]
+
+        assert dispatch_due_reminders(NOW) == {"failed": 1, "completed": 1}
+
+    def test_reminders_of_users_without_a_chat_fail(self, user, telegram, settings):
+        settings.TELEGRAM_REMINDER_CHAT_ID = "999"
+        reminder = baker.make(FinanceReminder, user=user, reminder_date=NOW - datetime.timedelta(hours=1))
+
+        assert dispatch_due_reminders(NOW) == {"failed": 1}
+
+        reminder.refresh_from_db()
+        assert reminder.status == ReminderStatusChoices.FAILED
+        telegram.send_message.assert_not_called()
+
+    def test_stale_processing_reminders_are_released(self, make_reminder, telegram):
+        make_reminder(
+            NOW - datetime.timedelta(hours=1),
+            status=ReminderStatusChoices.PROCESSING,
+            scheduled_at=NOW - datetime.timedelta(hours=1),
+        )
+        make_reminder(NOW - datetime.timedelta(hours=1), status=ReminderStatusChoices.PROCESSING, scheduled_at=NOW)
+
+        assert dispatch_due_reminders(NOW) == {"completed": 1}
+
+    def test_batches_run_until_the_queue_is_empty(self, make_reminder, telegram):
+        for i in range(5):
+            make_reminder(NOW - datetime.timedelta(minutes=i))
+
+        assert dispatch_due_reminders(NOW, batch_size=2) == {"completed": 5}
+
+
+@pytest.mark.unit
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_workers_skip_locked_reminders(make_reminder):
+    """Test that a worker does not wait for, or claim, reminders another worker has locked"""
+    reminders = [make_reminder(NOW - datetime.timedelta(minutes=i)) for i in range(4)]
+    claimed = []
+
+    def other_worker():
+        try:
+            claimed.extend(claim_due_reminders(NOW, 10))
+        finally:
+            connection.close()
+
+    with transaction.atomic():
+        locked = list(due_reminders(NOW).select_for_update().values_list("pk", flat=True)[:2])
+        worker = threading.Thread(target=other_worker)
+        worker.start()
+        worker.join(timeout=10)
+
+    assert not worker.is_alive()
+    assert sorted(claimed) == sorted({reminder.pk for reminder in reminders} - set(locked))
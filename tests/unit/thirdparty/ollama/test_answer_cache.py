@@ -0,0 +1,122 @@
+from unittest import mock
+
+import pytest
+from django.conf import settings
+from model_bakery import baker
+
+from apps.finance.models import UserSubscription
+from apps.thirdparty.ollama.answer_cache import AnswerCache, normalize_question
+from apps.thirdparty.ollama.client import OllamaError
+from apps.thirdparty.ollama.enums import InferenceLaneChoices
+from apps.thirdparty.ollama.gateway import InferenceBusy, inference_gateway
+
+
+EMBEDDINGS_URL = f"{settings.OLLAMA_CONFIG['BASE_URL']}/api/embeddings"
+CONTEXT = {"user_name": "Ada", "total_count": 2, "this_month_remaining_try": 250.0}
+
+
+def failing_after(*pieces: str):
+    yield from pieces
+    raise OllamaError("killed")
+
+
+@pytest.mark.unit
+def test_normalize_question():
+    assert normalize_question("  Bu AY ne kadar   ödeyeceğim?? ") == "bu ay ne kadar ödeyeceğim"
+    assert normalize_question("İPTAL ETTİĞİM") == "iptal ettiğim"
+    assert normalize_question("How much, this month?") == normalize_question("how much this month")
+    assert normalize_question("What Is my total?") == normalize_question("what is my total")
+    assert normalize_question("IS NETFLIX ACTIVE") == "is netflix active"
+    assert normalize_question("KAÇ ABONELİĞİM VAR") == normalize_question("kaç aboneliğim var")
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestAnswerCache:
+    """Unit tests for apps.thirdparty.ollama.answer_cache.AnswerCache."""
+
+    def test_normalized_question_hits(self, user):
+        AnswerCache(user.pk, CONTEXT, "How much this month?").set("250 TRY")
+
+        assert AnswerCache(user.pk, CONTEXT, "how much this month").get() == "250 TRY"
+        assert AnswerCache(user.pk, CONTEXT, "How much next month?").get() is None
+
+    def test_other_context_or_user_misses(self, user, user_factory):
+        AnswerCache(user.pk, CONTEXT, "How much?").set("250 TRY")
+
+        assert AnswerCache(user.pk, {**CONTEXT, "total_count": 3}, "How much?").get() is None
+        assert AnswerCache(user_factory().pk, CONTEXT, "How much?").get() is None
+
+    def test_subscription_change_invalidates(self, user, django_capture_on_commit_callbacks):
+        AnswerCache(user.pk, CONTEXT, "How much?").set("250 TRY")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            baker.make(UserSubscription, user=user)
+
+        assert AnswerCache(user.pk, CONTEXT, "How much?").get() is None
+
+    def test_record_caches_complete_answers_only(self, user):
+        answer_cache = AnswerCache(user.pk, CONTEXT, "How much?")
+
+        with pytest.raises(OllamaError):
+            list(answer_cache.record(failing_after("250")))
+        assert answer_cache.get() is None
+
+        assert list(answer_cache.record(iter(["250", " TRY"]))) == ["250", " TRY"]
+        assert answer_cache.get() == "250 TRY"
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestSemanticAnswerCache:
+    """Unit tests for the embedding matching of AnswerCache."""
+
+    @pytest.fixture(autouse=True)
+    def embeddings(self, settings, requests_mock):
+        settings.OLLAMA_EMBEDDING_MODEL = "nomic-embed-text"
+        vectors = {
+            "How much do I pay this month?": [1.0, 0.0, 0.1],
+            "What is my total for this month?": [0.98, 0.0, 0.15],
+            "When is Netflix renewed?": [0.0, 1.0, 0.0],
+        }
+        return requests_mock.post(
+            EMBEDDINGS_URL, json=lambda request, context: {"embedding": vectors[request.json()["prompt"]]}
+        )
+
+    def test_similar_question_hits(self, user, embeddings):
+        AnswerCache(user.pk, CONTEXT, "How much do I pay this month?").set("250 TRY")
+
+        assert AnswerCache(user.pk, CONTEXT, "What is my total for this month?").get() == "250 TRY"
+        assert embeddings.last_request.json()["model"] == "nomic-embed-text"
+
+    def test_unrelated_question_misses(self, user):
+        AnswerCache(user.pk, CONTEXT, "How much do I pay this month?").set("250 TRY")
+
+        assert AnswerCache(user.pk, CONTEXT, "When is Netflix renewed?").get() is None
+
+    def test_semantic_lookup_can_be_skipped(self, user, embeddings):
+        AnswerCache(user.pk, CONTEXT, "How much do I pay this month?").set("250 TRY")
+        calls = embeddings.call_count
+
+        assert AnswerCache(user.pk, CONTEXT, "What is my total for this month?").get(semantic=False) is None
+        assert embeddings.call_count == calls
+
+    def test_embedding_failure_falls_back_to_exact_match(self, user, requests_mock):
+        requests_mock.post(EMBEDDINGS_URL, status_code=500, text="boom")
+        AnswerCache(user.pk, CONTEXT, "How much do I pay this month?").set("250 TRY")
+
+        assert AnswerCache(user.pk, CONTEXT, "What is my total for this month?").get() is None
+        assert AnswerCache(user.pk, CONTEXT, "how much do I pay this month").get() == "250 TRY"
+
+    def test_busy_gateway_skips_the_embedding(self, user, embeddings):
+        AnswerCache(user.pk, CONTEXT, "How much do I pay this month?").set("250 TRY")
+        calls = embeddings.call_count
+
+        with mock.patch(
+            "apps.thirdparty.ollama.answer_cache.inference_gateway.acquire",
+            side_effect=InferenceBusy("Inference queue is full", InferenceLaneChoices.INTERACTIVE),
+        ):
+            assert AnswerCache(user.pk, CONTEXT, "What is my total for this month?").get() is None
+
+        assert embeddings.call_count == calls
+        assert inference_gateway.in_flight() == 0
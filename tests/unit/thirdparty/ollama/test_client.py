@@ -0,0 +1,145 @@
+import json
+
+import pytest
+import requests
+from django.conf import settings
+
+from apps.thirdparty.ollama.client import GenerationMetrics, OllamaClient, OllamaError
+
+
+BASE_URL = "http://ollama.test"
+
+
+def ndjson(*chunks: dict) -> str:
+    return "".join(json.dumps(chunk) + "\n" for chunk in chunks)
+
+
+def chat_stream(*pieces: str, eval_count: int = 10, eval_duration: int = 500_000_000) -> str:
+    chunks = [{"message": {"role": "assistant", "content": piece}, "done": False} for piece in pieces]
+    chunks.append(
+        {
+            "message": {"role": "assistant", "content": ""},
+            "done": True,
+            "eval_count": eval_count,
+            "eval_duration": eval_duration,
+            "prompt_eval_count": 42,
+        }
+    )
+    return ndjson(*chunks)
+
+
+@pytest.fixture
+def client():
+    return OllamaClient(
+        base_url=BASE_URL, default_model="big", fallback_model="small", timeout=3, max_tokens=256, temperature=0.2
+    )
+
+
+@pytest.mark.unit
+class TestOllamaClient:
+    """Unit tests for apps.thirdparty.ollama.client.OllamaClient."""
+
+    def test_chat_streams_pieces_with_config_options(self, client, requests_mock):
+        requests_mock.post(f"{BASE_URL}/api/chat", text=chat_stream("Merhaba", " dünya"))
+
+        stream = client.stream_chat([{"role": "user", "content": "Selam"}])
+
+        assert list(stream) == ["Merhaba", " dünya"]
+        assert stream.content == "Merhaba dünya"
+        assert stream.model == "big"
+        body = requests_mock.last_request.json()
+        assert body["model"] == "big"
+        assert body["stream"] is True
+        assert body["options"] == {"num_predict": 256, "temperature": 0.2}
+        assert body["keep_alive"] == settings.OLLAMA_CONFIG["KEEP_ALIVE"]
+
+    def test_metrics(self, client, requests_mock):
+        requests_mock.post(f"{BASE_URL}/api/chat", text=chat_stream("a", "b", eval_count=20))
+
+        completion = client.chat([{"role": "user", "content": "?"}])
+
+        metrics = completion.metrics
+        assert completion.content == "ab"
+        assert metrics.time_to_first_token is not None
+        assert metrics.time_to_first_token <= metrics.total_time
+        assert (metrics.prompt_tokens, metrics.completion_tokens) == (42, 20)
+        assert metrics.tokens_per_second == 40.0
+
+    def test_tokens_per_second_without_eval_duration(self):
+        metrics = GenerationMetrics(model="m", time_to_first_token=1.0, total_time=3.0, completion_tokens=10)
+
+        assert metrics.tokens_per_second == 5.0
+
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            {"status_code": 404, "text": '{"error": "model \\"big\\" not found"}'},
+            {"exc": requests.exceptions.ReadTimeout},
+            {"text": ndjson({"error": "out of memory"})},
+        ],
+    )
+    def test_falls_back_when_default_model_fails(self, client, requests_mock, failure):
+        requests_mock.post(
+            f"{BASE_URL}/api/chat", additional_matcher=lambda request: request.json()["model"] == "big", **failure
+        )
+        requests_mock.post(
+            f"{BASE_URL}/api/chat",
+            additional_matcher=lambda request: request.json()["model"] == "small",
+            text=chat_stream("ok"),
+        )
+
+        completion = client.chat([{"role": "user", "content": "?"}])
+
+        assert completion.content == "ok"
+        assert completion.metrics.model == "small"
+        assert [request.json()["model"] for request in requests_mock.request_history] == ["big", "small"]
+
+    def test_raises_when_every_model_fails(self, client, requests_mock):
+        requests_mock.post(f"{BASE_URL}/api/chat", exc=requests.exceptions.ConnectionError)
+
+        with pytest.raises(OllamaError, match="big.*small"):
+            client.chat([{"role": "user", "content": "?"}])
+
+    def test_failure_after_first_piece_does_not_fall_back(self, client, requests_mock):
+        requests_mock.post(
+            f"{BASE_URL}/api/chat", text=ndjson({"message": {"content": "Half"}, "done": False}, {"error": "killed"})
+        )
+
+        stream = client.stream_chat([{"role": "user", "content": "?"}])
+        with pytest.raises(OllamaError, match="mid-stream"):
+            list(stream)
+
+        assert stream.content == "Half"
+        assert requests_mock.call_count == 1
+
+    def test_explicit_model_has_no_fallback(self, client, requests_mock):
+        requests_mock.post(f"{BASE_URL}/api/chat", status_code=500, text="boom")
+
+        with pytest.raises(OllamaError):
+            client.chat([{"role": "user", "content": "?"}], model="custom")
+
+        assert requests_mock.call_count == 1
+
+    def test_generate(self, client, requests_mock):
+        requests_mock.post(
+            f"{BASE_URL}/api/generate",
+            text=ndjson({"response": "4", "done": False}, {"response": "", "done": True, "eval_count": 1}),
+        )
+
+        completion = client.generate("2+2?", system="Answer with a number")
+
+        assert completion.content == "4"
+        body = requests_mock.last_request.json()
+        assert (body["prompt"], body["system"]) == ("2+2?", "Answer with a number")
+
+    def test_embed(self, client, requests_mock):
+        requests_mock.post(f"{BASE_URL}/api/embeddings", json={"embedding": [0.1, 0.2]})
+
+        assert client.embed("Hi", "nomic-embed-text") == [0.1, 0.2]
+
+    @pytest.mark.parametrize("body", [{"text": "not json"}, {"json": {"error": "model not found"}}])
+    def test_unexpected_embedding_response_raises_ollama_error(self, client, requests_mock, body):
+        requests_mock.post(f"{BASE_URL}/api/embeddings", **body)
+
+        with pytest.raises(OllamaError, match="Unexpected embedding response"):
+            client.embed("Hi", "nomic-embed-text")
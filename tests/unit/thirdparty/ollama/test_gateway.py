@@ -0,0 +1,171 @@
+import pytest
+from django.core.cache import cache
+from freezegun import freeze_time
+
+from apps.thirdparty.ollama.enums import InferenceLaneChoices
+from apps.thirdparty.ollama.gateway import InferenceBusy, InferenceGateway
+
+
+GATEWAY_SETTINGS = {
+    "CONCURRENCY": 2,
+    "MAX_QUEUE": {"interactive": 1, "batch": 2},
+    "QUEUE_TIMEOUT": {"interactive": 5, "batch": 60},
+}
+
+
+class FakeClock:
+    """Monotonic clock advanced by the gateway's sleeps."""
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture(autouse=True)
+def gateway_settings(settings):
+    settings.OLLAMA_GATEWAY = GATEWAY_SETTINGS
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def gateway(clock):
+    return InferenceGateway(sleep=clock.sleep, clock=clock)
+
+
+def queue_key(lane: str, position: int = 0) -> str:
+    return InferenceGateway.QUEUE_KEY.format(lane=lane, position=position)
+
+
+def fill_slots(gateway):
+    return [gateway.acquire(InferenceLaneChoices.INTERACTIVE) for _ in range(GATEWAY_SETTINGS["CONCURRENCY"])]
+
+
+@pytest.mark.unit
+class TestInferenceGateway:
+    """Unit tests for apps.thirdparty.ollama.gateway.InferenceGateway."""
+
+    def test_slots_are_limited_to_the_concurrency(self, gateway, clock):
+        leases = fill_slots(gateway)
+
+        assert len({lease.key for lease in leases}) == 2
+        assert gateway.in_flight() == 2
+        assert clock.sleeps == []
+
+        gateway.release(leases[0])
+        assert gateway.in_flight() == 1
+        assert gateway.acquire(InferenceLaneChoices.INTERACTIVE).key == leases[0].key
+
+    def test_full_queue_is_rejected_without_waiting(self, gateway, clock):
+        fill_slots(gateway)
+        # Another worker's request already waits in the only queue position
+        cache.set(queue_key(InferenceLaneChoices.INTERACTIVE), "other-worker", InferenceGateway.QUEUE_LEASE_TIMEOUT)
+
+        with pytest.raises(InferenceBusy) as exc_info:
+            gateway.acquire(InferenceLaneChoices.INTERACTIVE)
+
+        assert exc_info.value.lane == InferenceLaneChoices.INTERACTIVE
+        assert clock.sleeps == []
+        stats = gateway.stats()
+        assert stats["waiting"][InferenceLaneChoices.INTERACTIVE] == 1
+        assert stats["rejected"] == {InferenceLaneChoices.INTERACTIVE: 1, InferenceLaneChoices.BATCH: 0}
+
+    def test_wait_times_out(self, gateway, clock):
+        fill_slots(gateway)
+
+        with pytest.raises(InferenceBusy, match="after 5s"):
+            gateway.acquire(InferenceLaneChoices.INTERACTIVE)
+
+        assert 5 <= sum(clock.sleeps) < 5 + 2 * InferenceGateway.POLL_INTERVAL
+        assert gateway.waiting(InferenceLaneChoices.INTERACTIVE) == 0
+
+    def test_waiting_request_takes_a_released_slot(self, clock):
+        leases = fill_slots(InferenceGateway(clock=clock))
+        # Another worker finishes while this one waits
+        gateway = InferenceGateway(sleep=lambda seconds: gateway.release(leases[0]), clock=clock)
+
+        lease = gateway.acquire(InferenceLaneChoices.INTERACTIVE)
+
+        assert lease.key == leases[0].key
+
+    def test_batch_waits_while_interactive_requests_wait(self, gateway, clock):
+        cache.set(queue_key(InferenceLaneChoices.INTERACTIVE), "other-worker", InferenceGateway.QUEUE_LEASE_TIMEOUT)
+
+        with pytest.raises(InferenceBusy):
+            gateway.acquire(InferenceLaneChoices.BATCH)
+
+        assert gateway.in_flight() == 0
+        assert 60 <= sum(clock.sleeps) < 60 + 2 * InferenceGateway.POLL_INTERVAL
+
+    def test_waiters_killed_while_waiting_leave_the_queue(self, gateway, mocker):
+        fill_slots(gateway)
+        # A killed worker never runs its `finally`, its queue position is left behind
+        mocker.patch.object(gateway, "release")
+        gateway._sleep = mocker.Mock(side_effect=SystemExit)
+
+        with freeze_time() as frozen:
+            with pytest.raises(SystemExit):
+                gateway.acquire(InferenceLaneChoices.INTERACTIVE)
+            assert gateway.waiting(InferenceLaneChoices.INTERACTIVE) == 1
+
+            frozen.tick(InferenceGateway.QUEUE_LEASE_TIMEOUT + 1)
+            assert gateway.waiting(InferenceLaneChoices.INTERACTIVE) == 0
+
+    def test_waiting_request_keeps_its_queue_position(self, gateway, clock, mocker):
+        fill_slots(gateway)
+        touch = mocker.spy(cache, "touch")
+
+        with pytest.raises(InferenceBusy):
+            gateway.acquire(InferenceLaneChoices.INTERACTIVE)
+
+        # Refreshed about once a second over the 5 second wait
+        assert 4 <= touch.call_count <= 5
+        assert touch.call_args.args == (
+            queue_key(InferenceLaneChoices.INTERACTIVE),
+            InferenceGateway.QUEUE_LEASE_TIMEOUT,
+        )
+
+    def test_expired_lease_is_not_released_by_its_old_holder(self, gateway):
+        lease = gateway.acquire(InferenceLaneChoices.BATCH)
+        cache.set(lease.key, "other-worker", InferenceGateway.LEASE_TIMEOUT)
+
+        gateway.release(lease)
+
+        assert cache.get(lease.key) == "other-worker"
+
+    def test_stream_holds_a_slot_while_iterating(self, gateway):
+        stream = gateway.stream(iter(["Mer", "haba"]))
+        assert gateway.in_flight() == 0
+
+        assert next(stream) == "Mer"
+        assert gateway.in_flight() == 1
+        assert list(stream) == ["haba"]
+        assert gateway.in_flight() == 0
+
+    def test_stream_releases_the_slot_when_closed_early(self, gateway):
+        stream = gateway.stream(iter(["Mer", "haba"]))
+        next(stream)
+
+        stream.close()
+
+        assert gateway.in_flight() == 0
+
+    def test_stream_refreshes_the_lease(self, gateway, clock, mocker):
+        touch = mocker.spy(cache, "touch")
+        stream = gateway.stream(iter(["a", "b", "c"]))
+
+        next(stream)
+        clock.now += InferenceGateway.LEASE_REFRESH_INTERVAL
+        list(stream)
+
+        touch.assert_called_once()
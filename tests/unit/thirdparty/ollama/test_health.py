@@ -0,0 +1,118 @@
+from unittest import mock
+
+import pytest
+import requests
+from django.conf import settings
+
+from apps.thirdparty.ollama.enums import CircuitStateChoices
+from apps.thirdparty.ollama.health import OllamaHealthMonitor
+from apps.thirdparty.ollama.tasks import task_probe_ollama_health
+
+
+TAGS_URL = f"{settings.OLLAMA_CONFIG['BASE_URL']}/api/tags"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def monitor(clock):
+    return OllamaHealthMonitor(clock=clock)
+
+
+@pytest.fixture
+def ollama_up(requests_mock):
+    models = [{"name": settings.OLLAMA_CONFIG["DEFAULT_MODEL"]}]
+    return requests_mock.get(TAGS_URL, json={"models": models})
+
+
+@pytest.fixture
+def ollama_down(requests_mock):
+    return requests_mock.get(TAGS_URL, exc=requests.exceptions.ConnectionError)
+
+
+@pytest.mark.unit
+class TestOllamaHealthMonitor:
+    """Unit tests for apps.thirdparty.ollama.health.OllamaHealthMonitor."""
+
+    def test_status_is_read_from_the_cache(self, monitor, ollama_up):
+        task_probe_ollama_health()
+
+        for _ in range(3):
+            status = monitor.get_status()
+
+        assert ollama_up.call_count == 1
+        assert status["status"] == "healthy"
+        assert status["circuit_state"] == CircuitStateChoices.CLOSED
+        assert "checked_at" in status
+        assert monitor.is_ready_for_chat()
+
+    def test_read_without_a_cached_status_queues_a_probe(self, monitor, ollama_up):
+        with mock.patch("apps.thirdparty.ollama.tasks.task_probe_ollama_health.delay") as delay:
+            statuses = [monitor.get_status() for _ in range(3)]
+
+        assert [status["status"] for status in statuses] == ["unreachable"] * 3
+        assert not monitor.is_ready_for_chat()
+        # Queued once for every reader, Ollama is not called in the reader
+        delay.assert_called_once()
+        assert ollama_up.call_count == 0
+
+    def test_probe_uses_a_short_timeout(self, monitor, ollama_up):
+        monitor.probe()
+
+        assert ollama_up.last_request.timeout == monitor.PROBE_TIMEOUT
+
+    def test_circuit_opens_after_repeated_failures(self, monitor, ollama_down):
+        for _ in range(monitor.FAILURE_THRESHOLD - 1):
+            monitor.probe()
+        assert monitor.circuit()["state"] == CircuitStateChoices.CLOSED
+
+        status = monitor.probe()
+
+        assert status["status"] == "unreachable"
+        assert status["circuit_state"] == CircuitStateChoices.OPEN
+        assert not monitor.is_ready_for_chat()
+        # Open circuit: no probes until the reset timeout has passed
+        assert monitor.probe() is None
+        assert ollama_down.call_count == monitor.FAILURE_THRESHOLD
+
+    def test_half_open_probe_closes_the_circuit(self, monitor, clock, requests_mock, ollama_down):
+        for _ in range(monitor.FAILURE_THRESHOLD):
+            monitor.probe()
+        clock.now += monitor.RESET_TIMEOUT
+        requests_mock.get(TAGS_URL, json={"models": [{"name": settings.OLLAMA_CONFIG["FALLBACK_MODEL"]}]})
+
+        status = monitor.probe()
+
+        assert status["circuit_state"] == CircuitStateChoices.CLOSED
+        assert monitor.circuit()["failures"] == 0
+        assert monitor.is_ready_for_chat()
+
+    def test_failed_half_open_probe_reopens_the_circuit(self, monitor, clock, ollama_down):
+        for _ in range(monitor.FAILURE_THRESHOLD):
+            monitor.probe()
+        clock.now += monitor.RESET_TIMEOUT
+
+        assert monitor.probe()["circuit_state"] == CircuitStateChoices.OPEN
+        assert monitor.circuit()["opened_at"] == clock.now
+        assert monitor.probe() is None
+
+    def test_reachable_ollama_without_models_keeps_the_circuit_closed(self, monitor, requests_mock):
+        requests_mock.get(TAGS_URL, json={"models": []})
+
+        for _ in range(monitor.FAILURE_THRESHOLD):
+            status = monitor.probe()
+
+        assert status["status"] == "unhealthy"
+        assert status["circuit_state"] == CircuitStateChoices.CLOSED
+        assert not monitor.is_ready_for_chat()
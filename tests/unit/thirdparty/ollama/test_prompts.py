@@ -0,0 +1,116 @@
+import json
+
+import pytest
+
+from apps.thirdparty.ollama.prompts import SYSTEM_PREAMBLE, build_prompt, estimate_tokens, rank_subscriptions
+from apps.thirdparty.telegram.enums import IntentChoices
+
+
+def subscription(name: str, amount_try: float, next_date: str, category: str = "Video Streaming") -> dict:
+    return {
+        "name": name,
+        "amount": amount_try,
+        "currency": "TRY",
+        "amount_try": amount_try,
+        "cycle": "monthly",
+        "next_date": next_date,
+        "category": category,
+    }
+
+
+def user_context(subscriptions: list[dict]) -> dict:
+    return {
+        "user_name": "Ada Lovelace",
+        "subscriptions": subscriptions,
+        "total_count": len(subscriptions),
+        "this_month_remaining_try": 250.0,
+        "next_90_days_try": 900.0,
+        "estimated_monthly_try": 300.0,
+        "estimated_yearly_try": 3600.0,
+        "categories": {"Video Streaming": {"count": len(subscriptions), "monthly_total": 300.0}},
+    }
+
+
+SUBSCRIPTIONS = [
+    subscription("Netflix", 229.99, "20/11/2026"),
+    subscription("Spotify", 59.99, "02/11/2026", category="Music"),
+    subscription("iCloud", 12.99, "25/10/2026", category="Storage"),
+]
+
+
+@pytest.mark.unit
+class TestBuildPrompt:
+    """Unit tests for apps.thirdparty.ollama.prompts.build_prompt."""
+
+    def test_messages(self):
+        prompt = build_prompt(user_context(SUBSCRIPTIONS), "Tasarruf önerin var mı?")
+
+        assert [message["role"] for message in prompt.messages] == ["system", "system", "user"]
+        assert prompt.messages[0]["content"] == SYSTEM_PREAMBLE
+        assert "Netflix|229.99|TRY|229.99|monthly|20/11/2026|Video Streaming" in prompt.messages[1]["content"]
+        assert "Video Streaming|3|300.00" in prompt.messages[1]["content"]
+        assert prompt.omitted_rows == 0
+
+    def test_preamble_is_the_same_for_every_user(self):
+        first = build_prompt(user_context(SUBSCRIPTIONS), "?")
+        second = build_prompt(user_context(SUBSCRIPTIONS[:1]), "Başka bir soru")
+
+        assert first.messages[0] == second.messages[0]
+
+    def test_token_counts(self):
+        prompt = build_prompt(user_context(SUBSCRIPTIONS), "Tasarruf önerin var mı?")
+
+        assert prompt.token_counts == {
+            "preamble": estimate_tokens(SYSTEM_PREAMBLE),
+            "context": estimate_tokens(prompt.messages[1]["content"]),
+            "question": estimate_tokens("Tasarruf önerin var mı?"),
+            "total": prompt.total_tokens,
+        }
+
+    def test_much_smaller_than_indented_json(self):
+        subscriptions = [subscription(f"Service {index}", 10.0 + index, "01/12/2026") for index in range(40)]
+
+        prompt = build_prompt(user_context(subscriptions), "?", token_budget=10_000)
+
+        indented = json.dumps(subscriptions, ensure_ascii=False, indent=2)
+        assert prompt.omitted_rows == 0
+        assert len(prompt.messages[1]["content"]) < len(indented) / 2
+
+    def test_least_relevant_rows_are_summarized_to_fit_the_budget(self):
+        subscriptions = [subscription(f"Service {index}", 10.0 + index, "01/12/2026") for index in range(200)]
+
+        prompt = build_prompt(user_context(subscriptions), "?", token_budget=800)
+
+        context = prompt.messages[1]["content"]
+        assert prompt.total_tokens <= 800
+        assert 0 < prompt.omitted_rows < 200
+        # Most expensive rows are kept
+        assert "Service 199|" in context
+        assert "Service 0|" not in context
+        assert f"(+{prompt.omitted_rows} more subscriptions not listed" in context
+
+    def test_most_relevant_row_is_kept_even_over_budget(self):
+        prompt = build_prompt(user_context(SUBSCRIPTIONS), "?", token_budget=1)
+
+        assert prompt.omitted_rows == 2
+        assert "Netflix|" in prompt.messages[1]["content"]
+
+
+@pytest.mark.unit
+class TestRankSubscriptions:
+    """Unit tests for apps.thirdparty.ollama.prompts.rank_subscriptions."""
+
+    def names(self, *args, **kwargs) -> list[str]:
+        return [row["name"] for row in rank_subscriptions(SUBSCRIPTIONS, *args, **kwargs)]
+
+    def test_most_expensive_first_by_default(self):
+        assert self.names() == ["Netflix", "Spotify", "iCloud"]
+
+    def test_upcoming_first_for_payment_questions(self):
+        assert self.names(IntentChoices.NEXT_PAYMENT) == ["iCloud", "Spotify", "Netflix"]
+
+    def test_grouped_by_category_for_category_questions(self):
+        assert self.names(IntentChoices.CATEGORY_BREAKDOWN) == ["Spotify", "iCloud", "Netflix"]
+
+    def test_named_service_first(self):
+        assert self.names(None, {"service": "iCloud"}) == ["iCloud", "Netflix", "Spotify"]
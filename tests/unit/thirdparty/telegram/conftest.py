@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+
+class FakeBotAPI:
+    """Local stand-in for the Telegram Bot API.
+
+    Records every request as (method, payload) and answers with queued responses
+    (status, body), then with a successful message.
+    """
+
+    def __init__(self):
+        self.requests: list[tuple[str, dict]] = []
+        self.responses: list[tuple[int, dict]] = []
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])) or b"{}")
+                method = self.path.rsplit("/", 1)[-1]
+                with fake.lock:
+                    fake.requests.append((method, payload))
+                    status, body = fake.responses.pop(0) if fake.responses else (200, None)
+                if body is None:
+                    body = {"ok": True, "result": {"message_id": len(fake.requests), "text": payload.get("text")}}
+
+                data = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def fail(self, status: int, description: str, retry_after: int | None = None):
+        body = {"ok": False, "error_code": status, "description": description}
+        if retry_after is not None:
+            body["parameters"] = {"retry_after": retry_after}
+        self.responses.append((status, body))
+
+
+@pytest.fixture
+def fake_bot_api():
+    """Fixture running a fake Telegram Bot API server on a free local port."""
+    fake = FakeBotAPI()
+    thread = threading.Thread(target=fake.server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield fake
+    fake.server.shutdown()
+    fake.server.server_close()
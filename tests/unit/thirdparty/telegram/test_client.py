@@ -0,0 +1,150 @@
+import pytest
+
+from apps.thirdparty.telegram.client import SharedRateLimit, TelegramAPIError, TelegramBotClient, split_message
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.mark.unit
+class TestSharedRateLimit:
+    def test_waits_for_the_next_window(self):
+        clock = FakeClock()
+        limit = SharedRateLimit("test:rate", limit=2, period=1, clock=clock, sleep=clock.sleep)
+
+        waits = [limit.acquire() for _ in range(5)]
+
+        assert waits == [0.0, 0.0, 1.0, 0.0, 1.0]
+
+    def test_is_shared_by_every_process(self):
+        # Two limiters with the same key stand for two workers sending for the same bot
+        clock = FakeClock()
+        first, second = (SharedRateLimit("test:rate", limit=1, clock=clock, sleep=clock.sleep) for _ in range(2))
+
+        assert first.acquire() == 0.0
+        assert second.acquire() == 1.0
+
+    def test_slow_rates_get_longer_windows(self):
+        clock = FakeClock()
+        limit = SharedRateLimit.from_rate("test:rate", 20 / 60, clock=clock, sleep=clock.sleep)
+
+        assert (limit.limit, limit.period) == (1, 3)
+        assert [limit.acquire() for _ in range(2)] == [0.0, 3.0]
+
+
+@pytest.mark.unit
+class TestSplitMessage:
+    def test_short_message_is_kept(self):
+        assert split_message("hello") == ["hello"]
+
+    def test_split_at_line_breaks(self):
+        lines = [f"• line {i}\n" for i in range(100)]
+
+        chunks = split_message("".join(lines), limit=100)
+
+        assert "".join(chunks) == "".join(lines)
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert all(chunk.endswith("\n") for chunk in chunks)
+
+    def test_long_line_is_cut(self):
+        assert split_message("a" * 250, limit=100) == ["a" * 100, "a" * 100, "a" * 50]
+
+
+@pytest.mark.unit
+class TestTelegramBotClient:
+    """Tests of apps.thirdparty.telegram.client.TelegramBotClient against a fake Bot API server."""
+
+    @pytest.fixture
+    def sleeps(self):
+        return []
+
+    @pytest.fixture
+    def client(self, fake_bot_api, sleeps):
+        return TelegramBotClient(
+            "123:abc", base_url=fake_bot_api.base_url, global_rate=1000, chat_rate=1000, sleep=sleeps.append
+        )
+
+    def test_send_message(self, client, fake_bot_api):
+        messages = client.send_message(42, "<b>Hi</b>")
+
+        assert messages[0]["text"] == "<b>Hi</b>"
+        assert fake_bot_api.requests == [("sendMessage", {"chat_id": "42", "text": "<b>Hi</b>", "parse_mode": "HTML"})]
+
+    def test_long_message_is_sent_in_parts(self, client, fake_bot_api):
+        text = "".join(f"• subscription {i}\n" for i in range(400))
+
+        messages = client.send_message(42, text)
+
+        assert len(messages) == len(fake_bot_api.requests) > 1
+        assert "".join(payload["text"] for _, payload in fake_bot_api.requests) == text
+
+    def test_429_waits_retry_after(self, client, fake_bot_api, sleeps):
+        fake_bot_api.fail(429, "Too Many Requests: retry after 3", retry_after=3)
+
+        client.send_message(42, "Hi")
+
+        assert len(fake_bot_api.requests) == 2
+        assert 3 in sleeps
+
+    def test_server_errors_are_retried_with_backoff(self, client, fake_bot_api, sleeps):
+        for _ in range(client.MAX_RETRIES + 1):
+            fake_bot_api.fail(502, "Bad Gateway")
+
+        with pytest.raises(TelegramAPIError) as exc_info:
+            client.send_message(42, "Hi")
+
+        assert exc_info.value.error_code == 502
+        assert [delay for delay in sleeps if delay >= 1] == [1, 2, 4]
+
+    def test_client_errors_are_not_retried(self, client, fake_bot_api):
+        fake_bot_api.fail(403, "Forbidden: bot was blocked by the user")
+
+        with pytest.raises(TelegramAPIError, match="blocked"):
+            client.send_message(42, "Hi")
+
+        assert len(fake_bot_api.requests) == 1
+
+    def test_send_many_reports_each_message(self, client, fake_bot_api):
+        fake_bot_api.fail(400, "Bad Request: chat not found")
+
+        results = client.send_many([(str(chat_id), f"Hello {chat_id}") for chat_id in range(20)], max_workers=4)
+
+        assert [result.chat_id for result in results] == [str(chat_id) for chat_id in range(20)]
+        assert sum(not result.ok for result in results) == 1
+        assert len(fake_bot_api.requests) == 20
+
+    def test_rate_limits_are_shared_per_chat(self, fake_bot_api):
+        clock = FakeClock()
+        client = TelegramBotClient(
+            "123:abc", base_url=fake_bot_api.base_url, global_rate=1000, sleep=clock.sleep, clock=clock
+        )
+
+        for chat_id, text in [("7", "a"), ("7", "b"), ("7", "c"), ("8", "d")]:
+            client.send_message(chat_id, text)
+
+        # Private chats get one message per second, other chats are not held back
+        assert clock.sleeps == [1.0, 1.0]
+
+    def test_rate_limits_are_shared_by_the_bot_clients_of_every_process(self, fake_bot_api):
+        clock = FakeClock()
+        clients = [
+            TelegramBotClient(
+                "123:abc", base_url=fake_bot_api.base_url, global_rate=1000, sleep=clock.sleep, clock=clock
+            )
+            for _ in range(2)
+        ]
+
+        for client in clients:
+            client.send_message("7", "Hi")
+
+        assert clock.sleeps == [1.0]
@@ -0,0 +1,61 @@
+import datetime
+
+import pytest
+from decimal import Decimal
+from model_bakery import baker
+
+from apps.finance.enums import BillingCycleChoices, SubscriptionStatusChoices
+from apps.finance.models import SubscriptionService, SubscriptionServiceCategory, UserSubscription
+from apps.thirdparty.telegram.helpers import get_user_financial_context
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestGetUserFinancialContext:
+    """Unit tests for get_user_financial_context."""
+
+    def test_no_subscriptions(self, user):
+        assert get_user_financial_context(user) is None
+
+    def test_totals_follow_billing_cycles(self, user, django_capture_on_commit_callbacks):
+        """Test that weekly and annual plans are projected by their cycle and converted with daily rates"""
+        category = baker.make(SubscriptionServiceCategory, name="Video Streaming")
+        service = baker.make(SubscriptionService, name="Netflix", category=category)
+        next_billing_date = datetime.date.today() + datetime.timedelta(days=1)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            baker.make(
+                UserSubscription,
+                user=user,
+                service=service,
+                amount=Decimal("1.00"),
+                currency="USD",
+                billing_cycle=BillingCycleChoices.ANNUALLY,
+                next_billing_date=next_billing_date,
+                status=SubscriptionStatusChoices.ACTIVE,
+            )
+            baker.make(
+                UserSubscription,
+                user=user,
+                amount=Decimal("10.00"),
+                currency="TRY",
+                billing_cycle=BillingCycleChoices.WEEKLY,
+                next_billing_date=next_billing_date,
+                status=SubscriptionStatusChoices.ACTIVE,
+            )
+
+        context = get_user_financial_context(user)
+
+        # 1 USD = 40 TRY (StaticExchangeRateClient), charged once a year; 10 TRY weekly, 52 times in 365 days
+        assert context["estimated_yearly_try"] == 40.0 + 520.0
+        assert context["next_90_days_try"] == 40.0 + 130.0
+        assert context["total_count"] == 2
+        # Normalized monthly cost per category: 40 / 12 and 10 * 52 / 12
+        assert context["categories"] == {
+            "Other": {"count": 1, "monthly_total": 43.33},
+            "Video Streaming": {"count": 1, "monthly_total": 3.33},
+        }
+        assert {item["name"] for item in context["subscriptions"]} == {
+            "Netflix",
+            UserSubscription.objects.last().service.name,
+        }
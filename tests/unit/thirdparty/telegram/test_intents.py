@@ -0,0 +1,158 @@
+import datetime
+
+import pytest
+from decimal import Decimal
+from model_bakery import baker
+
+from apps.finance.enums import BillingCycleChoices, SubscriptionStatusChoices
+from apps.finance.models import SubscriptionService, SubscriptionServiceCategory, UserSubscription
+from apps.thirdparty.telegram.enums import IntentChoices
+from apps.thirdparty.telegram.intents import answer_intent, classify_message, fold_text
+from apps.thirdparty.telegram.serializers import ProcessedMessageSerializer
+
+
+@pytest.fixture
+def services(db, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        video = baker.make(SubscriptionServiceCategory, name="Video Streaming")
+        music = baker.make(SubscriptionServiceCategory, name="Music")
+        return {
+            "netflix": baker.make(SubscriptionService, name="Netflix", category=video),
+            "youtube": baker.make(SubscriptionService, name="YouTube", category=video),
+            "youtube_premium": baker.make(SubscriptionService, name="YouTube Premium", category=video),
+            "spotify": baker.make(SubscriptionService, name="Spotify", category=music),
+        }
+
+
+@pytest.fixture
+def subscriptions(user, services, django_capture_on_commit_callbacks):
+    today = datetime.date.today()
+    with django_capture_on_commit_callbacks(execute=True):
+        for service, amount, days in [("netflix", "229.99", 3), ("spotify", "59.99", 10)]:
+            baker.make(
+                UserSubscription,
+                user=user,
+                service=services[service],
+                amount=Decimal(amount),
+                currency="TRY",
+                billing_cycle=BillingCycleChoices.MONTHLY,
+                next_billing_date=today + datetime.timedelta(days=days),
+                status=SubscriptionStatusChoices.ACTIVE,
+            )
+
+
+@pytest.mark.unit
+def test_fold_text():
+    assert fold_text("  Bu AY ne kadar ÖDEYECEĞİM?? ") == "bu ay ne kadar odeyecegim"
+    assert fold_text("Is Netflix active?") == "is netflix active"
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestClassifyMessage:
+    """Unit tests for apps.thirdparty.telegram.intents.classify_message."""
+
+    @pytest.mark.parametrize(
+        "text, intent, language",
+        [
+            ("Bu ay ne kadar ödeyeceğim?", IntentChoices.MONTHLY_TOTAL, "tr"),
+            ("bu ay toplam odemem ne", IntentChoices.MONTHLY_TOTAL, "tr"),
+            ("How much do I pay this month?", IntentChoices.MONTHLY_TOTAL, "en"),
+            ("En pahalı aboneliğim hangisi?", IntentChoices.MOST_EXPENSIVE, "tr"),
+            ("Which subscription is the most expensive?", IntentChoices.MOST_EXPENSIVE, "en"),
+            ("Kategorilere göre harcamam", IntentChoices.CATEGORY_BREAKDOWN, "tr"),
+            ("Show me a breakdown by category", IntentChoices.CATEGORY_BREAKDOWN, "en"),
+            ("Sıradaki ödemem ne zaman?", IntentChoices.NEXT_PAYMENT, "tr"),
+            ("What is my next payment?", IntentChoices.NEXT_PAYMENT, "en"),
+            ("Netflix aboneliğim aktif mi?", IntentChoices.SERVICE_ACTIVE, "tr"),
+            ("Is my Spotify subscription still active?", IntentChoices.SERVICE_ACTIVE, "en"),
+        ],
+    )
+    def test_intents(self, services, text, intent, language):
+        processed = classify_message(text)
+
+        assert processed["intent"] == intent
+        assert processed["entities"]["language"] == language
+        assert processed["confidence"] >= 0.8
+        assert ProcessedMessageSerializer(data=processed).is_valid(), processed
+
+    def test_service_entity_prefers_the_longest_name(self, services):
+        processed = classify_message("Is YouTube Premium active?")
+
+        assert processed["entities"]["service"] == "YouTube Premium"
+        assert processed["entities"]["service_id"] == services["youtube_premium"].pk
+
+    def test_service_question_without_known_service_is_not_classified(self, services):
+        assert classify_message("Is my gym membership active?")["intent"] is None
+
+    def test_open_question_is_left_to_the_assistant(self, services):
+        processed = classify_message("Aboneliklerimi nasıl azaltabilirim?")
+
+        assert (processed["intent"], processed["pattern_id"], processed["confidence"]) == (None, None, 0.0)
+        assert ProcessedMessageSerializer(data=processed).is_valid()
+
+    @pytest.mark.parametrize(
+        "text, intent",
+        [
+            ("Ödemelerimi nasıl planlayabilirim?", IntentChoices.NEXT_PAYMENT),
+            ("Which bills could I cancel?", IntentChoices.NEXT_PAYMENT),
+            ("Hangi tür aboneliklerden vazgeçmeliyim?", IntentChoices.CATEGORY_BREAKDOWN),
+            ("What kinds of subscriptions should I cut?", IntentChoices.CATEGORY_BREAKDOWN),
+        ],
+    )
+    def test_keyword_hints_are_left_to_the_assistant(self, user, services, text, intent):
+        processed = classify_message(text)
+
+        assert processed["intent"] == intent
+        assert processed["confidence"] < 0.8
+        assert answer_intent(user, processed) is None
+
+    def test_runs_no_queries_with_a_warm_catalog(self, services, count_queries):
+        classify_message("Is Netflix active?")
+
+        assert count_queries(classify_message, "Is Netflix active?") == 0
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestAnswerIntent:
+    """Unit tests for apps.thirdparty.telegram.intents.answer_intent."""
+
+    def answer(self, user, text):
+        return answer_intent(user, classify_message(text))
+
+    def test_monthly_total(self, user, subscriptions):
+        answer = self.answer(user, "Bu ay ne kadar ödeyeceğim?")
+
+        assert "Aylık ortalama: 289.98 TRY (2 abonelik)" in answer
+
+    def test_most_expensive(self, user, subscriptions):
+        assert self.answer(user, "What is my most expensive subscription?") == (
+            "💸 Your most expensive subscription is Netflix: 229.99 TRY a month"
+        )
+
+    def test_category_breakdown(self, user, subscriptions):
+        answer = self.answer(user, "Kategorilere göre harcamam")
+
+        assert "• Video Streaming: 229.99 TRY (1)" in answer
+        assert "• Music: 59.99 TRY (1)" in answer
+        assert answer.endswith("Toplam: 289.98 TRY")
+
+    def test_next_payment(self, user, subscriptions):
+        due = (datetime.date.today() + datetime.timedelta(days=3)).strftime("%d/%m/%Y")
+
+        assert self.answer(user, "When is my next payment?") == f"📅 Your next payment: Netflix, 229.99 TRY on {due}"
+
+    def test_next_payment_of_a_service(self, user, subscriptions):
+        assert "Spotify" in self.answer(user, "Spotify ödemesi ne zaman?")
+        assert "Yaklaşan bir YouTube ödemeniz yok" in self.answer(user, "YouTube ödemesi ne zaman?")
+
+    def test_service_active(self, user, subscriptions):
+        assert self.answer(user, "Is Netflix active?").startswith("✅ Your Netflix subscription is active")
+        assert self.answer(user, "YouTube aboneliğim var mı?") == "❌ Aktif bir YouTube aboneliğiniz yok."
+
+    def test_user_without_subscriptions(self, user, services):
+        assert "You Don't Have Any Subscriptions Yet" in self.answer(user, "How much do I pay this month?")
+
+    def test_unclassified_message_is_not_answered(self, user, subscriptions):
+        assert self.answer(user, "Aboneliklerimi nasıl azaltabilirim?") is None
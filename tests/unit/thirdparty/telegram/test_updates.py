@@ -0,0 +1,308 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.utils import timezone
+from freezegun import freeze_time
+from model_bakery import baker
+
+from apps.finance.enums import SubscriptionStatusChoices
+from apps.finance.models import UserSubscription
+from apps.thirdparty.ollama.client import OllamaError
+from apps.thirdparty.ollama.enums import InferenceLaneChoices
+from apps.thirdparty.ollama.gateway import InferenceBusy
+from apps.thirdparty.ollama.prompts import build_prompt
+from apps.thirdparty.telegram.client import TelegramBotClient
+from apps.thirdparty.telegram.enums import IntentChoices, TelegramUpdateStatusChoices
+from apps.thirdparty.telegram.models import TelegramUpdate
+from apps.thirdparty.telegram.tasks import task_process_telegram_updates, task_requeue_stale_telegram_updates
+from apps.thirdparty.telegram.updates import (
+    CHAT_LOCK_KEY,
+    CHAT_LOCK_TIMEOUT,
+    PROCESSING_TIMEOUT,
+    STALE_UPDATE_AGE,
+    answer_question,
+    get_chat_id,
+    process_chat_updates,
+    store_update,
+    stream_reply,
+)
+
+
+def build_update(update_id: int, text: str, chat_id: int = 42) -> dict:
+    return {"update_id": update_id, "message": {"message_id": update_id, "chat": {"id": chat_id}, "text": text}}
+
+
+@pytest.fixture
+def sent_messages():
+    with mock.patch("apps.thirdparty.telegram.updates.TelegramReminderAPI") as api:
+        yield api.return_value.client.send_message
+
+
+@pytest.mark.unit
+def test_get_chat_id():
+    assert get_chat_id(build_update(1, "hi", chat_id=-100)) == -100
+    assert get_chat_id({"update_id": 1, "callback_query": {"message": {"chat": {"id": 5}}}}) == 5
+    assert get_chat_id({"update_id": 1, "inline_query": {"id": "1"}}) is None
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestProcessChatUpdates:
+    """Unit tests for apps.thirdparty.telegram.updates.process_chat_updates."""
+
+    def test_updates_are_processed_in_order(self, user_factory, sent_messages):
+        user_factory(telegram_chat_id="42")
+        for update_id, text in [(3, "/help"), (1, "/start"), (2, "How much?")]:
+            store_update(build_update(update_id, text))
+
+        assert process_chat_updates(42) == 3
+
+        replies = [call.args[1] for call in sent_messages.call_args_list]
+        assert "Hello" in replies[0]
+        assert "You Don't Have Any Subscriptions Yet" in replies[1]
+        assert "Help Menu" in replies[2]
+        assert set(TelegramUpdate.objects.values_list("status", flat=True)) == {TelegramUpdateStatusChoices.PROCESSED}
+
+    def test_unknown_chat_is_asked_to_link_the_account(self, sent_messages):
+        store_update(build_update(1, "How much?", chat_id=99))
+
+        process_chat_updates(99)
+
+        assert "link your account" in sent_messages.call_args.args[1]
+
+    def test_failed_update_does_not_block_the_chat(self, sent_messages):
+        store_update(build_update(1, "/help"))
+        store_update(build_update(2, "/help"))
+        sent_messages.side_effect = [ValueError("Bad Request"), [{}]]
+
+        assert process_chat_updates(42) == 2
+
+        statuses = dict(TelegramUpdate.objects.values_list("update_id", "status"))
+        assert statuses == {1: TelegramUpdateStatusChoices.FAILED, 2: TelegramUpdateStatusChoices.PROCESSED}
+
+    def test_busy_chat_is_retried(self, sent_messages):
+        store_update(build_update(1, "/help"))
+        cache.add(CHAT_LOCK_KEY.format(chat_id=42), "other-worker")
+
+        assert process_chat_updates(42) is None
+        with mock.patch.object(task_process_telegram_updates, "retry", side_effect=RuntimeError) as retry:
+            with pytest.raises(RuntimeError):
+                task_process_telegram_updates(42)
+
+        retry.assert_called_once()
+        sent_messages.assert_not_called()
+
+    def test_lock_is_refreshed_before_each_update(self, sent_messages, mocker):
+        store_update(build_update(1, "/help"))
+        store_update(build_update(2, "/help"))
+        touch = mocker.spy(cache, "touch")
+
+        assert process_chat_updates(42) == 2
+
+        assert touch.call_count == 2
+        assert touch.call_args.args == (CHAT_LOCK_KEY.format(chat_id=42), CHAT_LOCK_TIMEOUT)
+
+    def test_claimed_update_is_not_processed_again(self, sent_messages):
+        # Claimed by a worker whose chat lock expired while it was answering
+        store_update(build_update(1, "/help"))
+        TelegramUpdate.objects.filter(update_id=1).update(status=TelegramUpdateStatusChoices.PROCESSING)
+        store_update(build_update(2, "/help"))
+
+        assert process_chat_updates(42) == 1
+
+        sent_messages.assert_called_once()
+        statuses = dict(TelegramUpdate.objects.values_list("update_id", "status"))
+        assert statuses == {1: TelegramUpdateStatusChoices.PROCESSING, 2: TelegramUpdateStatusChoices.PROCESSED}
+
+    def test_lost_lock_leaves_the_chat_to_the_new_holder(self, sent_messages):
+        store_update(build_update(1, "/help"))
+        store_update(build_update(2, "/help"))
+        # The lock expires during the first answer and another worker takes the chat
+        sent_messages.side_effect = lambda *args, **kwargs: cache.set(CHAT_LOCK_KEY.format(chat_id=42), "other-worker")
+
+        assert process_chat_updates(42) == 1
+
+        statuses = dict(TelegramUpdate.objects.values_list("update_id", "status"))
+        assert statuses == {1: TelegramUpdateStatusChoices.PROCESSED, 2: TelegramUpdateStatusChoices.RECEIVED}
+        assert cache.get(CHAT_LOCK_KEY.format(chat_id=42)) == "other-worker"
+
+    def test_store_update_deduplicates(self):
+        assert store_update(build_update(1, "hi")) is not None
+        assert store_update(build_update(1, "hi")) is None
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+class TestRequeueStaleUpdates:
+    """Unit tests for apps.thirdparty.telegram.tasks.task_requeue_stale_telegram_updates."""
+
+    @pytest.fixture(autouse=True)
+    def delay(self):
+        with mock.patch.object(task_process_telegram_updates, "delay") as delay:
+            yield delay
+
+    def test_chats_with_stale_received_updates_are_requeued(self, delay):
+        with freeze_time() as frozen:
+            store_update(build_update(1, "/help"))
+            store_update(build_update(2, "/help"))
+            store_update(build_update(3, "/help", chat_id=7))
+            frozen.tick(STALE_UPDATE_AGE + 1)
+            store_update(build_update(4, "/help", chat_id=8))
+
+            assert task_requeue_stale_telegram_updates() == 2
+
+        assert sorted(call.args[0] for call in delay.call_args_list) == [7, 42]
+
+    def test_recent_and_processed_updates_are_left_alone(self, delay):
+        with freeze_time() as frozen:
+            store_update(build_update(1, "/help"))
+            TelegramUpdate.objects.update(status=TelegramUpdateStatusChoices.PROCESSED)
+            frozen.tick(STALE_UPDATE_AGE + 1)
+            store_update(build_update(2, "/help"))
+
+            assert task_requeue_stale_telegram_updates() == 0
+
+        delay.assert_not_called()
+
+    def test_interrupted_updates_are_marked_failed(self, delay):
+        with freeze_time() as frozen:
+            store_update(build_update(1, "/help"))
+            store_update(build_update(2, "/help"))
+            TelegramUpdate.objects.update(status=TelegramUpdateStatusChoices.PROCESSING, last_updated=timezone.now())
+            frozen.tick(PROCESSING_TIMEOUT - 1)
+            TelegramUpdate.objects.filter(update_id=2).update(last_updated=timezone.now())
+            frozen.tick(2)
+
+            task_requeue_stale_telegram_updates()
+
+        statuses = dict(TelegramUpdate.objects.values_list("update_id", "status"))
+        assert statuses == {1: TelegramUpdateStatusChoices.FAILED, 2: TelegramUpdateStatusChoices.PROCESSING}
+        assert TelegramUpdate.objects.get(update_id=1).error == "Interrupted"
+        delay.assert_not_called()
+
+
+def failing_after(*pieces: str):
+    yield from pieces
+    raise OllamaError("Ollama completion failed")
+
+
+@pytest.mark.unit
+class TestStreamReply:
+    """Unit tests for apps.thirdparty.telegram.updates.stream_reply."""
+
+    @pytest.fixture
+    def bot(self, fake_bot_api):
+        return TelegramBotClient("token", base_url=fake_bot_api.base_url, global_rate=1000, chat_rate=1000)
+
+    @pytest.fixture(autouse=True)
+    def edit_every_piece(self, monkeypatch):
+        monkeypatch.setattr("apps.thirdparty.telegram.updates.STREAM_EDIT_INTERVAL", 0)
+
+    def test_message_grows_with_the_answer(self, bot, fake_bot_api):
+        stream_reply(bot, 42, ["Bu ay", " 250 TRY", " ödeyeceksiniz."])
+
+        assert fake_bot_api.requests == [
+            ("sendMessage", {"chat_id": "42", "text": "Bu ay"}),
+            ("editMessageText", {"chat_id": "42", "text": "Bu ay 250 TRY", "message_id": 1}),
+            ("editMessageText", {"chat_id": "42", "text": "Bu ay 250 TRY ödeyeceksiniz.", "message_id": 1}),
+        ]
+
+    def test_edits_are_throttled(self, bot, fake_bot_api, monkeypatch):
+        monkeypatch.setattr("apps.thirdparty.telegram.updates.STREAM_EDIT_INTERVAL", 60)
+
+        stream_reply(bot, 42, ["a", "b", "c"])
+
+        assert [(method, payload["text"]) for method, payload in fake_bot_api.requests] == [
+            ("sendMessage", "a"),
+            ("editMessageText", "abc"),
+        ]
+
+    def test_long_answer_continues_in_new_messages(self, bot, fake_bot_api):
+        stream_reply(bot, 42, ["x" * 4000 + "\n", "y" * 200])
+
+        assert [method for method, _ in fake_bot_api.requests] == ["sendMessage", "sendMessage"]
+        assert fake_bot_api.requests[0][1]["text"] == "x" * 4000 + "\n"
+        assert fake_bot_api.requests[-1][1]["text"] == "y" * 200
+
+    def test_failure_mid_answer_keeps_the_partial_answer(self, bot, fake_bot_api):
+        stream_reply(bot, 42, failing_after("Bu ay"))
+
+        method, payload = fake_bot_api.requests[-1]
+        assert method == "editMessageText"
+        assert payload["text"].startswith("Bu ay\n\n⏱️")
+
+    def test_failure_before_any_piece(self, bot, fake_bot_api):
+        stream_reply(bot, 42, failing_after())
+
+        assert len(fake_bot_api.requests) == 1
+        assert "AI" in fake_bot_api.requests[0][1]["text"]
+
+    def test_busy_gateway_is_answered_right_away(self, bot, fake_bot_api):
+        def busy():
+            raise InferenceBusy("Inference queue is full", InferenceLaneChoices.INTERACTIVE)
+            yield
+
+        stream_reply(bot, 42, busy())
+
+        assert len(fake_bot_api.requests) == 1
+        assert fake_bot_api.requests[0][1]["text"].startswith("🚦")
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_question_is_answered_by_streaming_chat(user_factory, sent_messages):
+    user = user_factory(telegram_chat_id="42")
+    baker.make(UserSubscription, user=user, status=SubscriptionStatusChoices.ACTIVE)
+    store_update(build_update(1, "Aboneliklerimi nasıl azaltabilirim?"))
+    store_update(build_update(2, "aboneliklerimi nasıl azaltabilirim"))
+
+    with (
+        mock.patch("apps.thirdparty.telegram.updates.health_monitor.is_ready_for_chat", return_value=True),
+        mock.patch("apps.thirdparty.telegram.updates.get_ollama_client") as get_client,
+        mock.patch(
+            "apps.thirdparty.telegram.updates.stream_reply", side_effect=lambda client, chat_id, pieces: list(pieces)
+        ) as stream,
+    ):
+        get_client.return_value.stream_chat.return_value = iter(["Bu ay", " 250 TRY"])
+        process_chat_updates(42)
+
+    messages = get_client.return_value.stream_chat.call_args.args[0]
+    assert [message["role"] for message in messages] == ["system", "system", "user"]
+    assert messages[2]["content"] == "Aboneliklerimi nasıl azaltabilirim?"
+    assert stream.call_args.args[1] == 42
+    # The same question again is answered from the cache, without inference
+    get_client.return_value.stream_chat.assert_called_once()
+    sent_messages.assert_called_once_with(42, "Bu ay 250 TRY", parse_mode=None)
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_question_sends_its_intent_hint_to_the_prompt(user):
+    baker.make(UserSubscription, user=user, status=SubscriptionStatusChoices.ACTIVE)
+
+    with (
+        mock.patch("apps.thirdparty.telegram.updates.health_monitor.is_ready_for_chat", return_value=True),
+        mock.patch("apps.thirdparty.telegram.updates.get_ollama_client"),
+        mock.patch("apps.thirdparty.telegram.updates.build_prompt", wraps=build_prompt) as prompt,
+    ):
+        answer_question(user, "Ödemelerimi nasıl planlayabilirim?")
+
+    assert prompt.call_args.kwargs["intent"] == IntentChoices.NEXT_PAYMENT
+
+
+@pytest.mark.unit
+@pytest.mark.django_db
+def test_question_is_not_sent_to_unready_ai(user_factory, sent_messages):
+    user = user_factory(telegram_chat_id="42")
+    baker.make(UserSubscription, user=user, status=SubscriptionStatusChoices.ACTIVE)
+    store_update(build_update(1, "Aboneliklerimi nasıl azaltabilirim?"))
+
+    with (
+        mock.patch("apps.thirdparty.telegram.updates.health_monitor.is_ready_for_chat", return_value=False),
+        mock.patch("apps.thirdparty.telegram.updates.get_ollama_client") as get_client,
+    ):
+        process_chat_updates(42)
+
+    get_client.assert_not_called()
+    assert "AI" in sent_messages.call_args.args[1]